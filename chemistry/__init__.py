@@ -0,0 +1,39 @@
+"""
+Shared helpers for the chemistry animations / Gemeinsame Hilfsmittel
+
+Run scenes from the repository root so that this package is importable,
+e.g. ``PYTHONPATH=. manim render chemistry/elements/026_iron_atom.py IronAtomDE``.
+"""
+
+from .constants import (
+    COLORS,
+    ELEMENT_COLORS,
+    PERIODIC_TABLE,
+    SHELL_COLORS,
+    SHELL_NAMES,
+    TEXT_DE,
+    TEXT_EN,
+    get_text,
+)
+from .atom import (
+    BohrModel,
+    ElectronPool,
+    create_element_box,
+    create_element_detail_box,
+    create_orbit,
+)
+from .aufbau import (
+    format_subshell_config,
+    get_shell_config,
+    get_subshell_config,
+)
+from .cache import NpzCache, save_npz
+from .decay import DECAY_SERIES, Nuclide, get_populations, solve_bateman
+from .data import ELEMENTS, Element, get_element, get_element_name
+from .lod import LevelOfDetail, merge_paths
+from .nucleus import NUCLEUS_CACHE, NucleonCluster, NucleusCache, pack_nucleons
+from .orbitals import ORBITAL_CACHE, OrbitalCache, OrbitalCloud, sample_orbital
+from .spectra import SpectralLines, format_wavelength, get_spectral_lines, wavelength_to_rgb
+from .transforms import CachedReplacementTransform, TransformCache
+from .table import TrendTable, create_batched_periodic_table, get_cell_centers, get_cell_position
+from .trends import TRENDS, TrendColors, format_trend_value, get_trend_colors
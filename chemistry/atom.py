@@ -0,0 +1,372 @@
+"""
+Atom builders / Atom-Bausteine
+
+The element box, detail card and Bohr model, shared by the element
+scripts and the scenes that show more than one element. ``BohrModel``
+can change its configuration
+in place: only shells whose electron count changed are touched, so
+stepping from one element to the next costs a handful of mobjects instead
+of a new model. ``ElectronPool`` goes further and keeps all electrons of an
+atom in one array that is redrawn as one path per shell.
+"""
+
+import numpy as np
+from manim import (
+    BOLD, DOWN, GRAY, ITALIC, PI, RIGHT, UP, WHITE,
+    Circle, Create, DashedVMobject, FadeIn, FadeOut, RoundedRectangle, Text,
+    Transform, UpdateFromAlphaFunc, VGroup, VMobject,
+)
+
+from .constants import COLORS, ELEMENT_COLORS, SHELL_COLORS, SHELL_NAMES
+from .data import get_element_name
+from .lod import LevelOfDetail
+from .nucleus import NucleonCluster
+
+NUCLEUS_RADIUS = 0.35
+ELECTRON_RADIUS = 0.08
+BASE_RADIUS = 0.5
+RADIUS_STEP = 0.375
+
+
+def create_element_box(symbol, number, group, size=0.7):
+    color = ELEMENT_COLORS.get(group, WHITE)
+    bg = RoundedRectangle(
+        width=size, height=size,
+        corner_radius=0.03,
+        fill_color=color,
+        fill_opacity=0.3,
+        stroke_color=color,
+        stroke_width=1
+    )
+    sym_text = Text(symbol, font_size=16, color=WHITE, weight=BOLD)
+    sym_text.move_to(bg.get_center())
+    return VGroup(bg, sym_text)
+
+
+def create_element_detail_box(element, text, lang="de"):
+    """
+    Detail card of an element: VGroup(bg, number, symbol, name, latin, mass).
+    """
+    color = ELEMENT_COLORS.get(element.group, WHITE)
+    bg = RoundedRectangle(
+        width=4, height=5.5,
+        corner_radius=0.2,
+        fill_color=color,
+        fill_opacity=0.3,
+        stroke_color=color,
+        stroke_width=3
+    )
+
+    num_label = Text(text["atomic_number"] + ":", font_size=20, color=GRAY)
+    num_value = Text(str(element.number), font_size=24, color=WHITE, weight=BOLD)
+    num_group = VGroup(num_label, num_value).arrange(RIGHT, buff=0.2)
+    num_group.move_to(bg.get_top() + DOWN * 0.5)
+
+    symbol = Text(element.symbol, font_size=100, color=color, weight=BOLD)
+    symbol.move_to(bg.get_center() + UP * 0.4)
+
+    name = Text(get_element_name(element, lang), font_size=26, color=WHITE)
+    name.move_to(bg.get_center() + DOWN * 0.7)
+
+    latin_label = Text(text["latin_name"] + ":", font_size=16, color=GRAY)
+    latin_value = Text(element.latin, font_size=18, color=WHITE, slant=ITALIC)
+    latin_group = VGroup(latin_label, latin_value).arrange(RIGHT, buff=0.2)
+    latin_group.move_to(bg.get_center() + DOWN * 1.2)
+
+    mass_label = Text(text["mass_number"] + ":", font_size=18, color=GRAY)
+    mass_value = Text(element.mass, font_size=20, color=WHITE)
+    mass_group = VGroup(mass_label, mass_value).arrange(RIGHT, buff=0.2)
+    mass_group.move_to(bg.get_bottom() + UP * 0.6)
+
+    return VGroup(bg, num_group, symbol, name, latin_group, mass_group)
+
+
+def get_shell_radius(index):
+    return BASE_RADIUS + index * RADIUS_STEP
+
+
+def get_electron_offsets(index, count):
+    """Positions of count electrons evenly spaced on shell index, nucleus at 0."""
+    angles = 2 * PI * np.arange(count) / max(count, 1)
+    radius = get_shell_radius(index)
+    return np.stack([radius * np.cos(angles), radius * np.sin(angles), np.zeros(count)], axis=1)
+
+
+def create_orbit(index, lod=None):
+    """Dashed orbit of shell index around the origin, as drawn by the element scenes."""
+    lod = lod or LevelOfDetail()
+    radius = get_shell_radius(index)
+    orbit = Circle(
+        radius=radius,
+        stroke_color=SHELL_COLORS[SHELL_NAMES[index]],
+        stroke_width=1.5,
+        stroke_opacity=0.6
+    )
+    return DashedVMobject(orbit, num_dashes=lod.num_dashes(radius, 20 + index * 8))
+
+
+class BohrModel(VGroup):
+    """
+    Bohr model whose electron configuration can be changed in place.
+
+    Submobjects are the nucleus group and its label, followed by the
+    orbit, electrons and label of each occupied shell. Shells are kept
+    in ``orbits``, ``electron_groups`` and ``labels`` (None for empty
+    shells). The model may be shifted but not scaled.
+
+    With ``packed_nucleus`` the nucleus shows its individual protons and
+    neutrons as a NucleonCluster instead of the "Np+ / Nn" counts.
+    """
+
+    def __init__(self, protons, neutrons, electron_config, text, lod=None,
+                 packed_nucleus=False, **kwargs):
+        super().__init__(**kwargs)
+        self.lod = lod or LevelOfDetail()
+        self.packed_nucleus = packed_nucleus
+        self.protons = protons
+        self.neutrons = neutrons
+        self.electron_config = [0] * len(SHELL_NAMES)
+
+        self.nucleus = Circle(
+            radius=NUCLEUS_RADIUS,
+            fill_color=COLORS["proton"],
+            fill_opacity=0.9,
+            stroke_color=WHITE,
+            stroke_width=2
+        )
+        if packed_nucleus:
+            # Only marks the centre and size; the nucleons are the content
+            self.nucleus.set_style(fill_opacity=0, stroke_opacity=0)
+        self.nucleus_content = self.create_nucleus_content(protons, neutrons)
+        self.nucleus_group = VGroup(self.nucleus, self.nucleus_content)
+
+        self.nucleus_label = Text(text["nucleus"], font_size=14, color=COLORS["proton"])
+        self.nucleus_label.next_to(self.nucleus_group, UP, buff=0.2)
+        self.add(self.nucleus_group, self.nucleus_label)
+
+        self.orbits = [None] * len(SHELL_NAMES)
+        self.electron_groups = [None] * len(SHELL_NAMES)
+        self.labels = [None] * len(SHELL_NAMES)
+        for index, count in enumerate(electron_config):
+            if count:
+                orbit, electrons, label = self.create_shell(index, count)
+                self.add(orbit, electrons, label)
+
+    def get_nucleus_center(self):
+        return self.nucleus.get_center()
+
+    def create_nucleus_content(self, protons, neutrons):
+        if self.packed_nucleus:
+            cluster = NucleonCluster(protons, neutrons, NUCLEUS_RADIUS, lod=self.lod)
+            return cluster.shift(self.get_nucleus_center())
+        proton_text = Text(f"{protons}p+", font_size=12, color=WHITE, weight=BOLD)
+        neutron_text = Text(f"{neutrons}n", font_size=12, color=WHITE, weight=BOLD)
+        content = VGroup(proton_text, neutron_text).arrange(DOWN, buff=0.03)
+        return content.move_to(self.get_nucleus_center())
+
+    def create_electron(self, index):
+        return Circle(
+            radius=ELECTRON_RADIUS,
+            fill_color=SHELL_COLORS[SHELL_NAMES[index]],
+            fill_opacity=1,
+            stroke_color=WHITE,
+            stroke_width=self.lod.stroke_width(1)
+        )
+
+    def create_label(self, index, count):
+        label = Text(f"{SHELL_NAMES[index]}: {count}", font_size=10,
+                     color=SHELL_COLORS[SHELL_NAMES[index]])
+        label = self.lod.simplify_label(label)
+        label.move_to(self.get_nucleus_center() + (get_shell_radius(index) + 0.2) * DOWN)
+        return label
+
+    def create_shell(self, index, count):
+        """Builds and registers orbit, electrons and label of one shell."""
+        center = self.get_nucleus_center()
+        # Shifted, not moved: the bounding box of the dashes is not centred on the circle
+        orbit = create_orbit(index, self.lod).shift(center)
+
+        electrons = VGroup()
+        for offset in get_electron_offsets(index, count):
+            electrons.add(self.create_electron(index).move_to(center + offset))
+
+        self.orbits[index] = orbit
+        self.electron_groups[index] = electrons
+        self.labels[index] = self.create_label(index, count)
+        self.electron_config[index] = count
+        return orbit, electrons, self.labels[index]
+
+    def play_transition(self, scene, protons, neutrons, electron_config, **play_kwargs):
+        """
+        Animates the model to a new nucleus and configuration in one play.
+
+        Existing electrons slide to their new places, added electrons fade
+        in, removed ones fade out; orbits appear and vanish with their
+        shells. Shells with an unchanged count are not touched.
+        """
+        animations = []
+        introduced = []
+        center = self.get_nucleus_center()
+
+        if (protons, neutrons) != (self.protons, self.neutrons):
+            content = self.create_nucleus_content(protons, neutrons)
+            animations.append(Transform(self.nucleus_content, content))
+            self.protons, self.neutrons = protons, neutrons
+
+        for index, count in enumerate(electron_config):
+            old_count = self.electron_config[index]
+            if count == old_count:
+                continue
+
+            if old_count == 0:
+                orbit, electrons, label = self.create_shell(index, count)
+                animations += [Create(orbit), FadeIn(electrons), FadeIn(label)]
+                introduced += [(self, part) for part in (orbit, electrons, label)]
+                continue
+
+            if count == 0:
+                parts = [self.orbits[index], self.electron_groups[index], self.labels[index]]
+                self.remove(*parts)
+                animations += [FadeOut(part) for part in parts]
+                self.orbits[index] = self.electron_groups[index] = self.labels[index] = None
+                self.electron_config[index] = 0
+                continue
+
+            electrons = self.electron_groups[index]
+            targets = center + get_electron_offsets(index, count)
+            if count < old_count:
+                removed = electrons.submobjects[count:]
+                electrons.remove(*removed)
+                animations += [FadeOut(electron) for electron in removed]
+            for electron, target in zip(electrons, targets):
+                animations.append(electron.animate.move_to(target))
+            for target in targets[old_count:]:
+                electron = self.create_electron(index).move_to(target)
+                animations.append(FadeIn(electron, scale=0.5))
+                introduced.append((electrons, electron))
+
+            animations.append(Transform(self.labels[index], self.create_label(index, count)))
+            self.electron_config[index] = count
+
+        if animations:
+            scene.play(*animations, **play_kwargs)
+        self.adopt(scene, introduced)
+
+    def adopt(self, scene, introduced):
+        """Moves the (parent, mobject) pairs a transition added to the scene into the model."""
+        for parent, mobject in introduced:
+            scene.remove(mobject)
+            parent.add(mobject)
+
+
+def get_shell_speed(index):
+    """Angular speed of the orbit updaters of the element scenes."""
+    return max(2.0 - index * 0.3, 0.5)
+
+
+class ElectronPool(VGroup):
+    """
+    The electrons of an atom as arrays instead of one Circle each.
+
+    Every electron is a (shell, angle, size) entry of preallocated arrays;
+    each shell is drawn as a single VMobject holding all its electron
+    outlines. ``set_config`` assigns the electrons of a new configuration
+    to the existing entries (same shell and slot), so an animation
+    between configurations just interpolates angles and sizes: kept
+    electrons slide to their new spacing, new ones grow, surplus ones
+    shrink away. Shells also rotate like the orbit updaters of the
+    element scenes.
+    """
+
+    def __init__(self, capacity=118, lod=None, **kwargs):
+        super().__init__(**kwargs)
+        lod = lod or LevelOfDetail()
+        self.template = Circle(radius=ELECTRON_RADIUS).points.copy()
+        self.center_point = np.zeros(3)
+        self.progress = 1.0
+        self.electron_config = [0] * len(SHELL_NAMES)
+        self.phases = np.zeros(len(SHELL_NAMES))
+        self.speeds = np.array([get_shell_speed(index) for index in range(len(SHELL_NAMES))])
+        self.radii = get_shell_radius(np.arange(len(SHELL_NAMES)))
+
+        # Kept and leaving electrons of a transition: at most twice the capacity
+        size = 2 * capacity
+        self.count = 0
+        self.shells = np.zeros(size, dtype=int)
+        self.start_angles = np.zeros(size)
+        self.end_angles = np.zeros(size)
+        self.start_sizes = np.zeros(size)
+        self.end_sizes = np.zeros(size)
+
+        for name in SHELL_NAMES:
+            self.add(VMobject(
+                fill_color=SHELL_COLORS[name],
+                fill_opacity=1,
+                stroke_color=WHITE,
+                stroke_width=lod.stroke_width(1),
+            ))
+
+    def move_center_to(self, point):
+        self.center_point = np.array(point, dtype=float)
+        return self.redraw()
+
+    def set_config(self, electron_config):
+        """Starts a transition to electron_config; animate it with set_progress."""
+        entries = []
+        for index, (old_count, count) in enumerate(zip(self.electron_config, electron_config)):
+            for slot in range(max(old_count, count)):
+                old_angle = 2 * PI * slot / old_count if slot < old_count else None
+                new_angle = 2 * PI * slot / count if slot < count else None
+                entries.append((
+                    index,
+                    old_angle if old_angle is not None else new_angle,
+                    new_angle if new_angle is not None else old_angle,
+                    float(slot < old_count),
+                    float(slot < count),
+                ))
+        self.count = len(entries)
+        if entries:
+            columns = np.array(entries).T
+            self.shells[:self.count] = columns[0]
+            self.start_angles[:self.count] = columns[1]
+            self.end_angles[:self.count] = columns[2]
+            self.start_sizes[:self.count] = columns[3]
+            self.end_sizes[:self.count] = columns[4]
+        self.electron_config = list(electron_config)
+        self.progress = 0.0
+        return self
+
+    def set_progress(self, alpha):
+        self.progress = alpha
+        return self.redraw()
+
+    def animate_config(self, electron_config, **kwargs):
+        """Animation from the current to the given configuration."""
+        self.set_config(electron_config)
+        return UpdateFromAlphaFunc(self, lambda pool, alpha: pool.set_progress(alpha), **kwargs)
+
+    def rotate_shells(self, dt):
+        """Updater: advances every shell by its orbit speed."""
+        self.phases += self.speeds * dt
+        return self.redraw()
+
+    def redraw(self):
+        count = self.count
+        shells = self.shells[:count]
+        alpha = self.progress
+        angles = (self.start_angles[:count] * (1 - alpha) + self.end_angles[:count] * alpha
+                  + self.phases[shells])
+        sizes = self.start_sizes[:count] * (1 - alpha) + self.end_sizes[:count] * alpha
+        radii = self.radii[shells]
+        centers = self.center_point + np.stack(
+            [radii * np.cos(angles), radii * np.sin(angles), np.zeros(count)], axis=1)
+
+        for index, shell in enumerate(self.submobjects):
+            visible = (shells == index) & (sizes > 0)
+            if not visible.any():
+                shell.clear_points()
+                continue
+            outlines = (self.template[None] * sizes[visible, None, None]
+                        + centers[visible, None, :])
+            shell.set_points(outlines.reshape(-1, 3))
+        return self
@@ -0,0 +1,115 @@
+"""
+Electron configurations / Elektronenkonfigurationen
+
+Derives the ground-state configuration of every element from the
+Madelung rule (subshells fill by increasing n + l, then n) and a short
+table of known exceptions, where one or two electrons sit in a different
+subshell than the rule predicts (Cr, Cu, Pd, Au...). Results are memoized.
+The shell occupation of every element in ``chemistry/data.py`` comes from
+``get_shell_config``.
+"""
+
+from functools import lru_cache
+
+from .constants import SHELL_NAMES
+
+SUBSHELL_LETTERS = "spdf"
+
+# (n, l) in filling order
+MADELUNG_ORDER = sorted(
+    ((n, l) for n in range(1, len(SHELL_NAMES) + 1) for l in range(min(n, len(SUBSHELL_LETTERS)))),
+    key=lambda subshell: (sum(subshell), subshell[0]),
+)
+
+# Atomic number -> (from subshell, to subshell, electrons moved)
+EXCEPTIONS = {
+    24: ("4s", "3d", 1),  # Cr
+    29: ("4s", "3d", 1),  # Cu
+    41: ("5s", "4d", 1),  # Nb
+    42: ("5s", "4d", 1),  # Mo
+    44: ("5s", "4d", 1),  # Ru
+    45: ("5s", "4d", 1),  # Rh
+    46: ("5s", "4d", 2),  # Pd
+    47: ("5s", "4d", 1),  # Ag
+    57: ("4f", "5d", 1),  # La
+    58: ("4f", "5d", 1),  # Ce
+    64: ("4f", "5d", 1),  # Gd
+    78: ("6s", "5d", 1),  # Pt
+    79: ("6s", "5d", 1),  # Au
+    89: ("5f", "6d", 1),  # Ac
+    90: ("5f", "6d", 2),  # Th
+    91: ("5f", "6d", 1),  # Pa
+    92: ("5f", "6d", 1),  # U
+    93: ("5f", "6d", 1),  # Np
+    96: ("5f", "6d", 1),  # Cm
+    103: ("6d", "7p", 1),  # Lr
+    110: ("7s", "6d", 1),  # Ds
+    111: ("7s", "6d", 1),  # Rg
+}
+
+# Atomic number -> symbol of the noble gases used as cores ("[Ar] 3d⁶ 4s²")
+NOBLE_GAS_CORES = {2: "He", 10: "Ne", 18: "Ar", 36: "Kr", 54: "Xe", 86: "Rn"}
+
+SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+def get_capacity(l):
+    return 2 * (2 * l + 1)
+
+
+def get_subshell_label(n, l):
+    return f"{n}{SUBSHELL_LETTERS[l]}"
+
+
+def parse_subshell_label(label):
+    return int(label[:-1]), SUBSHELL_LETTERS.index(label[-1])
+
+
+@lru_cache(maxsize=None)
+def get_subshell_config(number):
+    """Occupied subshells of element ``number`` as ((n, l), electrons) in filling order."""
+    occupancy = {}
+    remaining = number
+    for n, l in MADELUNG_ORDER:
+        if remaining == 0:
+            break
+        occupancy[(n, l)] = min(get_capacity(l), remaining)
+        remaining -= occupancy[(n, l)]
+    if remaining:
+        raise ValueError(f"no ground-state configuration for Z = {number}")
+
+    if number in EXCEPTIONS:
+        source, target, count = EXCEPTIONS[number]
+        source, target = parse_subshell_label(source), parse_subshell_label(target)
+        occupancy[source] -= count
+        occupancy[target] = occupancy.get(target, 0) + count
+    return tuple((subshell, count) for subshell, count in occupancy.items() if count)
+
+
+@lru_cache(maxsize=None)
+def get_shell_config(number):
+    """Electrons in the shells K to Q of element ``number``."""
+    shells = [0] * len(SHELL_NAMES)
+    for (n, _), count in get_subshell_config(number):
+        shells[n - 1] += count
+    return tuple(shells)
+
+
+def format_subshell_config(number, core=True):
+    """
+    Configuration in the usual notation, sorted by shell:
+    ``[Ar] 3d⁶ 4s²``, or ``1s² 2s² 2p⁶ ...`` without the noble gas core.
+    """
+    subshells = dict(get_subshell_config(number))
+    prefix = []
+    cores = [core_number for core_number in NOBLE_GAS_CORES if core_number < number]
+    if core and cores:
+        core_number = max(cores)
+        prefix = [f"[{NOBLE_GAS_CORES[core_number]}]"]
+        for subshell, count in get_subshell_config(core_number):
+            subshells[subshell] -= count
+    return " ".join(prefix + [
+        get_subshell_label(n, l) + str(count).translate(SUPERSCRIPTS)
+        for (n, l), count in sorted(subshells.items()) if count
+    ])
+
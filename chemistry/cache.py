@@ -0,0 +1,56 @@
+"""
+Array caches / Zwischengespeicherte Arrays
+
+Base class of the caches that keep computed arrays in memory and as .npz
+files below the media directory (transforms, orbitals, nuclei). Files are
+written under a temporary name unique to the writing process and renamed
+into place, so parallel renders computing the same entry never share a
+half-written file: the last rename wins, with the same content.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import config
+
+
+def save_npz(path, **arrays):
+    """Writes arrays to path atomically through a process-unique temporary file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+class NpzCache:
+    """
+    Entries in memory and as ``<cache_dir>/<key parts joined by _>.npz``;
+    cache_dir defaults to ``media_dir/<directory_name>``.
+    """
+
+    directory_name = "cache"
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir
+        self.entries = {}
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is not None:
+            return Path(self._cache_dir)
+        return Path(config.media_dir) / self.directory_name
+
+    def get_path(self, key):
+        return self.cache_dir / ("_".join(str(part) for part in key) + ".npz")
+
+    def save(self, key, **arrays):
+        save_npz(self.get_path(key), **arrays)
@@ -0,0 +1,175 @@
+"""
+Shared chemistry constants / Gemeinsame Chemie-Konstanten
+
+Colours, periodic table layout and texts used by the element animations.
+The element scripts and the shared helpers of this package all read them
+from here.
+"""
+
+# =============================================================================
+# KONSTANTEN / CONSTANTS
+# =============================================================================
+
+# Farben / Colors
+COLORS = {
+    "proton": "#FF6B6B",   # Rot fuer Protonen / Red for protons
+    "neutron": "#868E96",  # Grau fuer Neutronen / Gray for neutrons
+    "electron": "#228BE6", # Blau fuer Elektronen / Blue for electrons
+    "orbit": "#495057",    # Elektronenbahn / Electron orbit
+    "nucleus": "#FF8787",  # Atomkern / Nucleus
+}
+
+# Elektronenhuellen-Farben / Electron shell colors
+SHELL_COLORS = {
+    "K": "#BE4BDB",  # Violett / Purple - 1. Schale
+    "L": "#228BE6",  # Blau / Blue - 2. Schale
+    "M": "#22B8CF",  # Cyan - 3. Schale
+    "N": "#51CF66",  # Gruen / Green - 4. Schale
+    "O": "#FFD43B",  # Gelb / Yellow - 5. Schale
+    "P": "#FF922B",  # Orange - 6. Schale
+    "Q": "#FF6B6B",  # Rot / Red - 7. Schale
+}
+
+SHELL_NAMES = ["K", "L", "M", "N", "O", "P", "Q"]
+
+# Elementgruppen-Farben / Element group colors
+ELEMENT_COLORS = {
+    "alkali": "#FF6B6B",
+    "alkaline": "#FFB347",
+    "transition": "#4ECDC4",
+    "post_transition": "#45B7D1",
+    "metalloid": "#96CEB4",
+    "nonmetal": "#FFEAA7",
+    "halogen": "#DDA0DD",
+    "noble": "#87CEEB",
+    "lanthanide": "#F0E68C",
+    "actinide": "#FFB6C1",
+}
+
+# Periodensystem / Periodic Table
+PERIODIC_TABLE = {
+    (0, 0): ("H", 1, "nonmetal"), (17, 0): ("He", 2, "noble"),
+    (0, 1): ("Li", 3, "alkali"), (1, 1): ("Be", 4, "alkaline"),
+    (12, 1): ("B", 5, "metalloid"), (13, 1): ("C", 6, "nonmetal"),
+    (14, 1): ("N", 7, "nonmetal"), (15, 1): ("O", 8, "nonmetal"),
+    (16, 1): ("F", 9, "halogen"), (17, 1): ("Ne", 10, "noble"),
+    (0, 2): ("Na", 11, "alkali"), (1, 2): ("Mg", 12, "alkaline"),
+    (12, 2): ("Al", 13, "post_transition"), (13, 2): ("Si", 14, "metalloid"),
+    (14, 2): ("P", 15, "nonmetal"), (15, 2): ("S", 16, "nonmetal"),
+    (16, 2): ("Cl", 17, "halogen"), (17, 2): ("Ar", 18, "noble"),
+    (0, 3): ("K", 19, "alkali"), (1, 3): ("Ca", 20, "alkaline"),
+    (2, 3): ("Sc", 21, "transition"), (3, 3): ("Ti", 22, "transition"),
+    (4, 3): ("V", 23, "transition"), (5, 3): ("Cr", 24, "transition"),
+    (6, 3): ("Mn", 25, "transition"), (7, 3): ("Fe", 26, "transition"),
+    (8, 3): ("Co", 27, "transition"), (9, 3): ("Ni", 28, "transition"),
+    (10, 3): ("Cu", 29, "transition"), (11, 3): ("Zn", 30, "transition"),
+    (12, 3): ("Ga", 31, "post_transition"), (13, 3): ("Ge", 32, "metalloid"),
+    (14, 3): ("As", 33, "metalloid"), (15, 3): ("Se", 34, "nonmetal"),
+    (16, 3): ("Br", 35, "halogen"), (17, 3): ("Kr", 36, "noble"),
+    (0, 4): ("Rb", 37, "alkali"), (1, 4): ("Sr", 38, "alkaline"),
+    (2, 4): ("Y", 39, "transition"), (3, 4): ("Zr", 40, "transition"),
+    (4, 4): ("Nb", 41, "transition"), (5, 4): ("Mo", 42, "transition"),
+    (6, 4): ("Tc", 43, "transition"), (7, 4): ("Ru", 44, "transition"),
+    (8, 4): ("Rh", 45, "transition"), (9, 4): ("Pd", 46, "transition"),
+    (10, 4): ("Ag", 47, "transition"), (11, 4): ("Cd", 48, "transition"),
+    (12, 4): ("In", 49, "post_transition"), (13, 4): ("Sn", 50, "post_transition"),
+    (14, 4): ("Sb", 51, "metalloid"), (15, 4): ("Te", 52, "metalloid"),
+    (16, 4): ("I", 53, "halogen"), (17, 4): ("Xe", 54, "noble"),
+    (0, 5): ("Cs", 55, "alkali"), (1, 5): ("Ba", 56, "alkaline"),
+    (2, 5): ("La", 57, "lanthanide"), (3, 5): ("Hf", 72, "transition"),
+    (4, 5): ("Ta", 73, "transition"), (5, 5): ("W", 74, "transition"),
+    (6, 5): ("Re", 75, "transition"), (7, 5): ("Os", 76, "transition"),
+    (8, 5): ("Ir", 77, "transition"), (9, 5): ("Pt", 78, "transition"),
+    (10, 5): ("Au", 79, "transition"), (11, 5): ("Hg", 80, "transition"),
+    (12, 5): ("Tl", 81, "post_transition"), (13, 5): ("Pb", 82, "post_transition"),
+    (14, 5): ("Bi", 83, "post_transition"), (15, 5): ("Po", 84, "metalloid"),
+    (16, 5): ("At", 85, "halogen"), (17, 5): ("Rn", 86, "noble"),
+    (0, 6): ("Fr", 87, "alkali"), (1, 6): ("Ra", 88, "alkaline"),
+    (2, 6): ("Ac", 89, "actinide"), (3, 6): ("Rf", 104, "transition"),
+    (4, 6): ("Db", 105, "transition"), (5, 6): ("Sg", 106, "transition"),
+    (6, 6): ("Bh", 107, "transition"), (7, 6): ("Hs", 108, "transition"),
+    (8, 6): ("Mt", 109, "transition"), (9, 6): ("Ds", 110, "transition"),
+    (10, 6): ("Rg", 111, "transition"), (11, 6): ("Cn", 112, "transition"),
+    (12, 6): ("Nh", 113, "post_transition"), (13, 6): ("Fl", 114, "post_transition"),
+    (14, 6): ("Mc", 115, "post_transition"), (15, 6): ("Lv", 116, "post_transition"),
+    (16, 6): ("Ts", 117, "halogen"), (17, 6): ("Og", 118, "noble"),
+    (3, 8): ("Ce", 58, "lanthanide"), (4, 8): ("Pr", 59, "lanthanide"),
+    (5, 8): ("Nd", 60, "lanthanide"), (6, 8): ("Pm", 61, "lanthanide"),
+    (7, 8): ("Sm", 62, "lanthanide"), (8, 8): ("Eu", 63, "lanthanide"),
+    (9, 8): ("Gd", 64, "lanthanide"), (10, 8): ("Tb", 65, "lanthanide"),
+    (11, 8): ("Dy", 66, "lanthanide"), (12, 8): ("Ho", 67, "lanthanide"),
+    (13, 8): ("Er", 68, "lanthanide"), (14, 8): ("Tm", 69, "lanthanide"),
+    (15, 8): ("Yb", 70, "lanthanide"), (16, 8): ("Lu", 71, "lanthanide"),
+    (3, 9): ("Th", 90, "actinide"), (4, 9): ("Pa", 91, "actinide"),
+    (5, 9): ("U", 92, "actinide"), (6, 9): ("Np", 93, "actinide"),
+    (7, 9): ("Pu", 94, "actinide"), (8, 9): ("Am", 95, "actinide"),
+    (9, 9): ("Cm", 96, "actinide"), (10, 9): ("Bk", 97, "actinide"),
+    (11, 9): ("Cf", 98, "actinide"), (12, 9): ("Es", 99, "actinide"),
+    (13, 9): ("Fm", 100, "actinide"), (14, 9): ("Md", 101, "actinide"),
+    (15, 9): ("No", 102, "actinide"), (16, 9): ("Lr", 103, "actinide"),
+}
+
+# Texte / Texts
+TEXT_DE = {
+    "periodic_table": "Periodensystem der Elemente",
+    "nucleus": "Atomkern",
+    "atomic_number": "Ordnungszahl",
+    "mass_number": "Massenzahl",
+    "latin_name": "Lateinisch",
+    "aufbau": "Aufbauprinzip",
+    "configuration": "Elektronenkonfiguration",
+    "orbitals": "Orbitale des Wasserstoffatoms",
+    "probability_density": "Aufenthaltswahrscheinlichkeit",
+    "emission_spectrum": "Emissionsspektrum wasserstoffaehnlicher Ionen",
+    "wavelength": "Wellenlaenge",
+    "transition": "Uebergang",
+    "xray": "Roentgen",
+    "ultraviolet": "UV",
+    "visible": "sichtbar",
+    "infrared": "IR",
+    "decay_series": "Zerfallsreihe von {name}",
+    "half_life": "Halbwertszeit",
+    "year_symbol": "a",
+    "periodic_trends": "Trends im Periodensystem",
+    "covalent_radius": "Kovalenzradius",
+    "electronegativity": "Elektronegativitaet (Pauling)",
+    "ionization_energy": "Erste Ionisierungsenergie",
+    "atomic_mass": "Atommasse",
+    "valence_electrons": "Valenzelektronen (Hauptgruppen)",
+    "no_data": "keine Daten",
+}
+
+TEXT_EN = {
+    "periodic_table": "Periodic Table of Elements",
+    "nucleus": "Nucleus",
+    "atomic_number": "Atomic Number",
+    "mass_number": "Mass Number",
+    "latin_name": "Latin",
+    "aufbau": "Aufbau Principle",
+    "configuration": "Electron Configuration",
+    "orbitals": "Orbitals of the Hydrogen Atom",
+    "probability_density": "Probability density",
+    "emission_spectrum": "Emission Spectrum of Hydrogen-like Ions",
+    "wavelength": "Wavelength",
+    "transition": "Transition",
+    "xray": "X-ray",
+    "ultraviolet": "UV",
+    "visible": "visible",
+    "infrared": "IR",
+    "decay_series": "{name} Decay Series",
+    "half_life": "Half-life",
+    "year_symbol": "y",
+    "periodic_trends": "Periodic Trends",
+    "covalent_radius": "Covalent Radius",
+    "electronegativity": "Electronegativity (Pauling)",
+    "ionization_energy": "First Ionization Energy",
+    "atomic_mass": "Atomic Mass",
+    "valence_electrons": "Valence Electrons (Main Groups)",
+    "no_data": "no data",
+}
+
+
+def get_text(lang="de"):
+    """Gibt die Texte in der gewaehlten Sprache zurueck / Returns texts in selected language"""
+    return TEXT_DE if lang == "de" else TEXT_EN
+
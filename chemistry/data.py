@@ -0,0 +1,273 @@
+"""
+Element data / Elementdaten
+
+Symbol, names, mass, group, nucleus and shell occupation of all 118
+elements in one table. The element scripts look up their element here by
+symbol, and the scenes that show more than one element read the table.
+The shell occupation is not typed in: it is derived from the atomic
+number by the Madelung rule and its exceptions in ``aufbau.py``.
+"""
+
+from collections import namedtuple
+
+from .aufbau import get_shell_config
+
+# electron_config: electrons in the shells K, L, M, N, O, P, Q, filled in below
+Element = namedtuple("Element", [
+    "symbol", "number", "name_de", "name_en", "latin", "mass",
+    "group", "protons", "neutrons", "electron_config",
+], defaults=(None,))
+
+ELEMENTS = [
+    Element("H", 1, "Wasserstoff", "Hydrogen", "Hydrogenium",
+            "1.008 u", "nonmetal", 1, 0),
+    Element("He", 2, "Helium", "Helium", "Helium",
+            "4.003 u", "noble", 2, 2),
+    Element("Li", 3, "Lithium", "Lithium", "Lithium",
+            "6.941 u", "alkali", 3, 4),
+    Element("Be", 4, "Beryllium", "Beryllium", "Beryllium",
+            "9.012 u", "alkaline", 4, 5),
+    Element("B", 5, "Bor", "Boron", "Borum",
+            "10.81 u", "metalloid", 5, 6),
+    Element("C", 6, "Kohlenstoff", "Carbon", "Carboneum",
+            "12.01 u", "nonmetal", 6, 6),
+    Element("N", 7, "Stickstoff", "Nitrogen", "Nitrogenium",
+            "14.01 u", "nonmetal", 7, 7),
+    Element("O", 8, "Sauerstoff", "Oxygen", "Oxygenium",
+            "16.00 u", "nonmetal", 8, 8),
+    Element("F", 9, "Fluor", "Fluorine", "Fluorum",
+            "19.00 u", "halogen", 9, 10),
+    Element("Ne", 10, "Neon", "Neon", "Neon",
+            "20.18 u", "noble", 10, 10),
+    Element("Na", 11, "Natrium", "Sodium", "Natrium",
+            "22.99 u", "alkali", 11, 12),
+    Element("Mg", 12, "Magnesium", "Magnesium", "Magnesium",
+            "24.31 u", "alkaline", 12, 12),
+    Element("Al", 13, "Aluminium", "Aluminum", "Aluminium",
+            "26.98 u", "post_transition", 13, 14),
+    Element("Si", 14, "Silicium", "Silicon", "Silicium",
+            "28.09 u", "metalloid", 14, 14),
+    Element("P", 15, "Phosphor", "Phosphorus", "Phosphorus",
+            "30.97 u", "nonmetal", 15, 16),
+    Element("S", 16, "Schwefel", "Sulfur", "Sulphur",
+            "32.07 u", "nonmetal", 16, 16),
+    Element("Cl", 17, "Chlor", "Chlorine", "Chlorum",
+            "35.45 u", "halogen", 17, 18),
+    Element("Ar", 18, "Argon", "Argon", "Argon",
+            "39.95 u", "noble", 18, 22),
+    Element("K", 19, "Kalium", "Potassium", "Kalium",
+            "39.10 u", "alkali", 19, 20),
+    Element("Ca", 20, "Calcium", "Calcium", "Calcium",
+            "40.08 u", "alkaline", 20, 20),
+    Element("Sc", 21, "Scandium", "Scandium", "Scandium",
+            "44.96 u", "transition", 21, 24),
+    Element("Ti", 22, "Titan", "Titanium", "Titanium",
+            "47.87 u", "transition", 22, 26),
+    Element("V", 23, "Vanadium", "Vanadium", "Vanadium",
+            "50.94 u", "transition", 23, 28),
+    Element("Cr", 24, "Chrom", "Chromium", "Chromium",
+            "52.00 u", "transition", 24, 28),
+    Element("Mn", 25, "Mangan", "Manganese", "Manganum",
+            "54.94 u", "transition", 25, 30),
+    Element("Fe", 26, "Eisen", "Iron", "Ferrum",
+            "55.85 u", "transition", 26, 30),
+    Element("Co", 27, "Cobalt", "Cobalt", "Cobaltum",
+            "58.93 u", "transition", 27, 32),
+    Element("Ni", 28, "Nickel", "Nickel", "Niccolum",
+            "58.69 u", "transition", 28, 30),
+    Element("Cu", 29, "Kupfer", "Copper", "Cuprum",
+            "63.55 u", "transition", 29, 34),
+    Element("Zn", 30, "Zink", "Zinc", "Zincum",
+            "65.38 u", "transition", 30, 34),
+    Element("Ga", 31, "Gallium", "Gallium", "Gallium",
+            "69.72 u", "post_transition", 31, 38),
+    Element("Ge", 32, "Germanium", "Germanium", "Germanium",
+            "72.63 u", "metalloid", 32, 42),
+    Element("As", 33, "Arsen", "Arsenic", "Arsenicum",
+            "74.92 u", "metalloid", 33, 42),
+    Element("Se", 34, "Selen", "Selenium", "Selenium",
+            "78.97 u", "nonmetal", 34, 46),
+    Element("Br", 35, "Brom", "Bromine", "Bromum",
+            "79.90 u", "halogen", 35, 44),
+    Element("Kr", 36, "Krypton", "Krypton", "Krypton",
+            "83.80 u", "noble", 36, 48),
+    Element("Rb", 37, "Rubidium", "Rubidium", "Rubidium",
+            "85.47 u", "alkali", 37, 48),
+    Element("Sr", 38, "Strontium", "Strontium", "Strontium",
+            "87.62 u", "alkaline", 38, 50),
+    Element("Y", 39, "Yttrium", "Yttrium", "Yttrium",
+            "88.91 u", "transition", 39, 50),
+    Element("Zr", 40, "Zirconium", "Zirconium", "Zirconium",
+            "91.22 u", "transition", 40, 51),
+    Element("Nb", 41, "Niob", "Niobium", "Niobium",
+            "92.91 u", "transition", 41, 52),
+    Element("Mo", 42, "Molybdän", "Molybdenum", "Molybdaenum",
+            "95.95 u", "transition", 42, 54),
+    Element("Tc", 43, "Technetium", "Technetium", "Technetium",
+            "98 u", "transition", 43, 55),
+    Element("Ru", 44, "Ruthenium", "Ruthenium", "Ruthenium",
+            "101.07 u", "transition", 44, 58),
+    Element("Rh", 45, "Rhodium", "Rhodium", "Rhodium",
+            "102.91 u", "transition", 45, 58),
+    Element("Pd", 46, "Palladium", "Palladium", "Palladium",
+            "106.42 u", "transition", 46, 60),
+    Element("Ag", 47, "Silber", "Silver", "Argentum",
+            "107.87 u", "transition", 47, 61),
+    Element("Cd", 48, "Cadmium", "Cadmium", "Cadmium",
+            "112.41 u", "transition", 48, 66),
+    Element("In", 49, "Indium", "Indium", "Indium",
+            "114.82 u", "post_transition", 49, 66),
+    Element("Sn", 50, "Zinn", "Tin", "Stannum",
+            "118.71 u", "post_transition", 50, 69),
+    Element("Sb", 51, "Antimon", "Antimony", "Stibium",
+            "121.76 u", "metalloid", 51, 70),
+    Element("Te", 52, "Tellur", "Tellurium", "Tellurium",
+            "127.60 u", "metalloid", 52, 78),
+    Element("I", 53, "Iod", "Iodine", "Iodium",
+            "126.90 u", "halogen", 53, 74),
+    Element("Xe", 54, "Xenon", "Xenon", "Xenon",
+            "131.29 u", "noble", 54, 77),
+    Element("Cs", 55, "Caesium", "Caesium", "Caesium",
+            "132.91 u", "alkali", 55, 78),
+    Element("Ba", 56, "Barium", "Barium", "Barium",
+            "137.33 u", "alkaline", 56, 81),
+    Element("La", 57, "Lanthan", "Lanthanum", "Lanthanum",
+            "138.91 u", "lanthanide", 57, 82),
+    Element("Ce", 58, "Cer", "Cerium", "Cerium",
+            "140.12 u", "lanthanide", 58, 82),
+    Element("Pr", 59, "Praseodym", "Praseodymium", "Praseodymium",
+            "140.91 u", "lanthanide", 59, 82),
+    Element("Nd", 60, "Neodym", "Neodymium", "Neodymium",
+            "144.24 u", "lanthanide", 60, 84),
+    Element("Pm", 61, "Promethium", "Promethium", "Promethium",
+            "145 u", "lanthanide", 61, 84),
+    Element("Sm", 62, "Samarium", "Samarium", "Samarium",
+            "150.36 u", "lanthanide", 62, 90),
+    Element("Eu", 63, "Europium", "Europium", "Europium",
+            "151.96 u", "lanthanide", 63, 90),
+    Element("Gd", 64, "Gadolinium", "Gadolinium", "Gadolinium",
+            "157.25 u", "lanthanide", 64, 93),
+    Element("Tb", 65, "Terbium", "Terbium", "Terbium",
+            "158.93 u", "lanthanide", 65, 94),
+    Element("Dy", 66, "Dysprosium", "Dysprosium", "Dysprosium",
+            "162.50 u", "lanthanide", 66, 97),
+    Element("Ho", 67, "Holmium", "Holmium", "Holmium",
+            "164.93 u", "lanthanide", 67, 98),
+    Element("Er", 68, "Erbium", "Erbium", "Erbium",
+            "167.26 u", "lanthanide", 68, 99),
+    Element("Tm", 69, "Thulium", "Thulium", "Thulium",
+            "168.93 u", "lanthanide", 69, 100),
+    Element("Yb", 70, "Ytterbium", "Ytterbium", "Ytterbium",
+            "173.05 u", "lanthanide", 70, 103),
+    Element("Lu", 71, "Lutetium", "Lutetium", "Lutetium",
+            "174.97 u", "lanthanide", 71, 104),
+    Element("Hf", 72, "Hafnium", "Hafnium", "Hafnium",
+            "178.49 u", "transition", 72, 106),
+    Element("Ta", 73, "Tantal", "Tantalum", "Tantalum",
+            "180.95 u", "transition", 73, 108),
+    Element("W", 74, "Wolfram", "Tungsten", "Wolframium",
+            "183.84 u", "transition", 74, 110),
+    Element("Re", 75, "Rhenium", "Rhenium", "Rhenium",
+            "186.21 u", "transition", 75, 111),
+    Element("Os", 76, "Osmium", "Osmium", "Osmium",
+            "190.23 u", "transition", 76, 114),
+    Element("Ir", 77, "Iridium", "Iridium", "Iridium",
+            "192.22 u", "transition", 77, 115),
+    Element("Pt", 78, "Platin", "Platinum", "Platinum",
+            "195.08 u", "transition", 78, 117),
+    Element("Au", 79, "Gold", "Gold", "Aurum",
+            "196.97 u", "transition", 79, 118),
+    Element("Hg", 80, "Quecksilber", "Mercury", "Hydrargyrum",
+            "200.59 u", "transition", 80, 121),
+    Element("Tl", 81, "Thallium", "Thallium", "Thallium",
+            "204.38 u", "post_transition", 81, 123),
+    Element("Pb", 82, "Blei", "Lead", "Plumbum",
+            "207.2 u", "post_transition", 82, 125),
+    Element("Bi", 83, "Wismut", "Bismuth", "Bismuthum",
+            "208.98 u", "post_transition", 83, 126),
+    Element("Po", 84, "Polonium", "Polonium", "Polonium",
+            "209 u", "metalloid", 84, 125),
+    Element("At", 85, "Astat", "Astatine", "Astatinum",
+            "210 u", "halogen", 85, 125),
+    Element("Rn", 86, "Radon", "Radon", "Radon",
+            "222 u", "noble", 86, 136),
+    Element("Fr", 87, "Francium", "Francium", "Francium",
+            "223 u", "alkali", 87, 136),
+    Element("Ra", 88, "Radium", "Radium", "Radium",
+            "226 u", "alkaline", 88, 138),
+    Element("Ac", 89, "Actinium", "Actinium", "Actinium",
+            "227 u", "actinide", 89, 138),
+    Element("Th", 90, "Thorium", "Thorium", "Thorium",
+            "232.04 u", "actinide", 90, 142),
+    Element("Pa", 91, "Protactinium", "Protactinium", "Protactinium",
+            "231.04 u", "actinide", 91, 140),
+    Element("U", 92, "Uran", "Uranium", "Uranium",
+            "238.03 u", "actinide", 92, 146),
+    Element("Np", 93, "Neptunium", "Neptunium", "Neptunium",
+            "237 u", "actinide", 93, 144),
+    Element("Pu", 94, "Plutonium", "Plutonium", "Plutonium",
+            "244 u", "actinide", 94, 150),
+    Element("Am", 95, "Americium", "Americium", "Americium",
+            "243 u", "actinide", 95, 148),
+    Element("Cm", 96, "Curium", "Curium", "Curium",
+            "247 u", "actinide", 96, 151),
+    Element("Bk", 97, "Berkelium", "Berkelium", "Berkelium",
+            "247 u", "actinide", 97, 150),
+    Element("Cf", 98, "Californium", "Californium", "Californium",
+            "251 u", "actinide", 98, 153),
+    Element("Es", 99, "Einsteinium", "Einsteinium", "Einsteinium",
+            "252 u", "actinide", 99, 153),
+    Element("Fm", 100, "Fermium", "Fermium", "Fermium",
+            "257 u", "actinide", 100, 157),
+    Element("Md", 101, "Mendelevium", "Mendelevium", "Mendelevium",
+            "258 u", "actinide", 101, 157),
+    Element("No", 102, "Nobelium", "Nobelium", "Nobelium",
+            "259 u", "actinide", 102, 157),
+    Element("Lr", 103, "Lawrencium", "Lawrencium", "Lawrencium",
+            "266 u", "actinide", 103, 163),
+    Element("Rf", 104, "Rutherfordium", "Rutherfordium", "Rutherfordium",
+            "267 u", "transition", 104, 163),
+    Element("Db", 105, "Dubnium", "Dubnium", "Dubnium",
+            "268 u", "transition", 105, 163),
+    Element("Sg", 106, "Seaborgium", "Seaborgium", "Seaborgium",
+            "269 u", "transition", 106, 163),
+    Element("Bh", 107, "Bohrium", "Bohrium", "Bohrium",
+            "270 u", "transition", 107, 163),
+    Element("Hs", 108, "Hassium", "Hassium", "Hassium",
+            "269 u", "transition", 108, 161),
+    Element("Mt", 109, "Meitnerium", "Meitnerium", "Meitnerium",
+            "278 u", "transition", 109, 169),
+    Element("Ds", 110, "Darmstadtium", "Darmstadtium", "Darmstadtium",
+            "281 u", "transition", 110, 171),
+    Element("Rg", 111, "Roentgenium", "Roentgenium", "Roentgenium",
+            "282 u", "transition", 111, 171),
+    Element("Cn", 112, "Copernicium", "Copernicium", "Copernicium",
+            "285 u", "transition", 112, 173),
+    Element("Nh", 113, "Nihonium", "Nihonium", "Nihonium",
+            "286 u", "post_transition", 113, 173),
+    Element("Fl", 114, "Flerovium", "Flerovium", "Flerovium",
+            "289 u", "post_transition", 114, 175),
+    Element("Mc", 115, "Moscovium", "Moscovium", "Moscovium",
+            "290 u", "post_transition", 115, 175),
+    Element("Lv", 116, "Livermorium", "Livermorium", "Livermorium",
+            "293 u", "post_transition", 116, 177),
+    Element("Ts", 117, "Tenness", "Tennessine", "Tennessinum",
+            "294 u", "halogen", 117, 177),
+    Element("Og", 118, "Oganesson", "Oganesson", "Oganessonum",
+            "[294] u", "noble", 118, 176),
+]
+ELEMENTS = [element._replace(electron_config=get_shell_config(element.number))
+            for element in ELEMENTS]
+
+ELEMENTS_BY_SYMBOL = {element.symbol: element for element in ELEMENTS}
+
+
+def get_element(key):
+    """Element by symbol ("Fe") or atomic number (26)."""
+    if isinstance(key, str):
+        return ELEMENTS_BY_SYMBOL[key]
+    return ELEMENTS[key - 1]
+
+
+def get_element_name(element, lang="de"):
+    return element.name_en if lang == "en" else element.name_de
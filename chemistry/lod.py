@@ -0,0 +1,77 @@
+"""
+Level of detail for atom models / Detailstufe fuer Atommodelle
+
+Simplifies Bohr model geometry based on the output pixel size of the
+current render quality. At 4K every dash, stroke and glyph is built
+exactly as designed; at preview resolutions details that would be
+thinner than a pixel are dropped or merged.
+"""
+
+import numpy as np
+from manim import PI, VMobject, config
+
+
+class LevelOfDetail:
+    """
+    Decides how much geometry is worth building at the current resolution.
+    """
+
+    # Full detail from this output height on (4K)
+    FULL_DETAIL_PIXEL_HEIGHT = 2160
+
+    # Minimum on-screen sizes in pixels
+    MIN_DASH_PIXELS = 24
+    MIN_STROKE_PIXELS = 1.0
+    MIN_LABEL_PIXELS = 12
+
+    # Orbits never drop below this many dashes
+    MIN_DASHES = 12
+
+    # Cairo draws a stroke of width w as w * 0.01 scene units
+    STROKE_WIDTH_UNIT = 0.01
+
+    def __init__(self, pixel_height=None, frame_height=None):
+        self.pixel_height = pixel_height or config.pixel_height
+        self.frame_height = frame_height or config.frame_height
+        self.pixels_per_unit = self.pixel_height / self.frame_height
+        self.full_detail = self.pixel_height >= self.FULL_DETAIL_PIXEL_HEIGHT
+
+    def to_pixels(self, length):
+        return length * self.pixels_per_unit
+
+    def num_dashes(self, radius, num_dashes):
+        """Dash count for an orbit, keeping each dash at least MIN_DASH_PIXELS long."""
+        if self.full_detail:
+            return num_dashes
+        affordable = int(self.to_pixels(2 * PI * radius) / self.MIN_DASH_PIXELS)
+        return min(num_dashes, max(self.MIN_DASHES, affordable))
+
+    def stroke_width(self, stroke_width):
+        """Stroke width, or 0 if the stroke would be thinner than a pixel."""
+        if self.full_detail:
+            return stroke_width
+        pixels = self.to_pixels(stroke_width * self.STROKE_WIDTH_UNIT)
+        return stroke_width if pixels >= self.MIN_STROKE_PIXELS else 0
+
+    def simplify_label(self, text):
+        """Merges the glyphs of a tiny label into a single VMobject."""
+        if self.full_detail or self.to_pixels(text.height) >= self.MIN_LABEL_PIXELS:
+            return text
+        return merge_paths(text)
+
+
+def merge_paths(mobject):
+    """
+    Combines all outlines of a mobject family into one VMobject.
+
+    The outlines become subpaths of a single path, so Cairo fills them in
+    one draw call instead of one per glyph or shape. The style is taken
+    from the first outline, so all parts should share it.
+    """
+    parts = mobject.family_members_with_points()
+    merged = VMobject()
+    if not parts:
+        return merged
+    merged.match_style(parts[0])
+    merged.set_points(np.concatenate([part.points for part in parts]))
+    return merged
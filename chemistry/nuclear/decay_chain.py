@@ -0,0 +1,253 @@
+"""
+Radioaktive Zerfallsreihen - YouTube Version (16:9, 4K)
+Radioactive Decay Series
+
+Animation zeigt:
+1. Die Glieder der Uran-238- bzw. Thorium-232-Reihe als Elementkaesten
+2. Den Anteil jedes Nuklids (logarithmisch) auf einer Zeitachse von 0,1
+   Mikrosekunden bis 10^11 Jahre: kurzlebige Toechter entstehen zuerst,
+   nach und nach stellt sich das Gleichgewicht ein, am Ende bleibt Blei
+
+Die Anteile kommen aus den Bateman-Gleichungen (chemistry/decay.py), fuer
+alle Zeitpunkte und Nuklide einmal berechnet; die Animation liest pro
+Bild nur eine Zeile des Arrays.
+Populations come from the Bateman equations, computed once for all times
+and members; every frame only reads one row of the array.
+"""
+
+from manim import *
+
+from chemistry import (
+    ELEMENT_COLORS,
+    create_element_box,
+    get_element,
+    get_element_name,
+    get_text,
+)
+from chemistry.aufbau import SUPERSCRIPTS
+from chemistry.decay import DAY, DECAY_SERIES, HOUR, MINUTE, TIME_RANGE, YEAR, get_populations
+
+BOX_SIZE = 0.55
+ROW_Y = 2.35
+ROW_WIDTH = 11.6
+BAR_WIDTH = 0.4
+BAR_BOTTOM = -1.7
+BAR_HEIGHT = 3.0
+LOG_FLOOR = -24
+TIME_AXIS_Y = -2.55
+TIME_AXIS_WIDTH = 12.2
+
+TIMELINE_DURATION = 30
+
+# Labelled times on the time axis (s) and their labels; years get the symbol of the language
+TIME_MARKS = [
+    (1e-6, "1 µs"), (1e-3, "1 ms"), (1, "1 s"), (HOUR, "1 h"), (DAY, "1 d"),
+    (YEAR, "1 {year}"), (1e3 * YEAR, "10³ {year}"), (1e6 * YEAR, "10⁶ {year}"),
+    (1e9 * YEAR, "10⁹ {year}"),
+]
+
+
+def format_number(value):
+    """value rounded to one significant digit: ``200``, ``4``, ``0.1``."""
+    rounded = float(f"{value:.1g}")
+    return f"{rounded:.{max(0, -int(np.floor(np.log10(rounded))))}f}"
+
+
+def format_duration(seconds, year_symbol):
+    """``200 µs``, ``4 d``, ``5 · 10⁹ a``: one significant digit, so it changes rarely."""
+    for unit, factor, limit in (("µs", 1e-6, 1e-3), ("ms", 1e-3, 1), ("s", 1, MINUTE),
+                                ("min", MINUTE, HOUR), ("h", HOUR, DAY), ("d", DAY, YEAR)):
+        if seconds < limit:
+            return f"{format_number(seconds / factor)} {unit}"
+    years = float(f"{seconds / YEAR:.1g}")
+    if years < 1e4:
+        return f"{format_number(years)} {year_symbol}"
+    exponent = int(np.floor(np.log10(years)))
+    power = "10" + str(exponent).translate(SUPERSCRIPTS)
+    mantissa = round(years / 10 ** exponent)
+    return f"{mantissa} · {power} {year_symbol}" if mantissa > 1 else f"{power} {year_symbol}"
+
+
+class DecayChain(Scene):
+    SERIES = "U-238"
+
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    def create_nuclide_box(self, nuclide):
+        element = get_element(nuclide.number)
+        box = create_element_box(nuclide.symbol, nuclide.number, element.group, size=BOX_SIZE)
+        mass = Text(str(nuclide.mass_number), font_size=12, color=GRAY)
+        mass.next_to(box, UP, buff=0.06)
+        return VGroup(box, mass)
+
+    def create_bar(self, nuclide, x):
+        color = ELEMENT_COLORS.get(get_element(nuclide.number).group, WHITE)
+        bar = VMobject(fill_color=color, fill_opacity=0.7, stroke_color=color, stroke_width=1)
+        bar.base = np.array([x, BAR_BOTTOM, 0])
+        return bar
+
+    def set_bar_heights(self, bars, populations):
+        """Redraws all bars for one row of populations, on a log scale above LOG_FLOOR."""
+        with np.errstate(divide="ignore"):
+            logs = np.log10(populations)
+        heights = np.clip((logs - LOG_FLOOR) / -LOG_FLOOR, 0, 1) * BAR_HEIGHT
+        for bar, height in zip(bars, heights):
+            # A bar of zero height keeps a hairline so that it stays drawable
+            height = max(height, 1e-3)
+            corners = bar.base + np.array([[-BAR_WIDTH / 2, 0, 0], [BAR_WIDTH / 2, 0, 0],
+                                           [BAR_WIDTH / 2, height, 0], [-BAR_WIDTH / 2, height, 0],
+                                           [-BAR_WIDTH / 2, 0, 0]])
+            bar.set_points_as_corners(corners)
+        return bars
+
+    def create_population_axis(self, x):
+        axis = NumberLine(
+            x_range=[LOG_FLOOR, 0, 6],
+            length=BAR_HEIGHT,
+            scaling=LogBase(custom_labels=True),
+            include_numbers=True,
+            font_size=16,
+            color=GRAY,
+            rotation=90 * DEGREES,
+            label_direction=LEFT,
+        )
+        # The line, not the line with its labels, starts at the bar bottom
+        return axis.shift([x, BAR_BOTTOM, 0] - axis.get_start())
+
+    def create_time_axis(self, year_symbol):
+        low, high = np.log10(TIME_RANGE)
+        axis = NumberLine(x_range=[low, high, 1], length=TIME_AXIS_WIDTH,
+                          scaling=LogBase(custom_labels=False), color=GRAY)
+        axis.move_to([0, TIME_AXIS_Y, 0])
+        labels = VGroup()
+        for seconds, label in TIME_MARKS:
+            text = Text(label.format(year=year_symbol), font_size=13, color=GRAY)
+            labels.add(text.next_to(axis.n2p(seconds), DOWN, buff=0.15))
+        return axis, labels
+
+    def construct(self):
+        chain = DECAY_SERIES[self.SERIES]
+        times, populations = get_populations(self.SERIES)
+        year_symbol = self.text["year_symbol"]
+
+        parent = chain[0]
+        name = f"{get_element_name(get_element(parent.number), self.lang)}-{parent.mass_number}"
+        title = Text(self.text["decay_series"].format(name=name), font_size=36, color=WHITE)
+        title.to_edge(UP, buff=0.35)
+
+        # Chain of nuclide boxes with the decay mode between neighbours
+        spacing = min(0.85, ROW_WIDTH / len(chain))
+        xs = (np.arange(len(chain)) - (len(chain) - 1) / 2) * spacing
+        boxes = VGroup(*[self.create_nuclide_box(nuclide).move_to([x, ROW_Y, 0])
+                         for nuclide, x in zip(chain, xs)])
+        for box in boxes:
+            box.shift((ROW_Y - box[0].get_center()[1]) * UP)
+        modes = VGroup(*[
+            Text(nuclide.mode, font_size=13, color=YELLOW)
+            .move_to([(x + next_x) / 2, ROW_Y + BOX_SIZE / 2 + 0.12, 0])
+            for nuclide, x, next_x in zip(chain, xs, xs[1:])
+        ])
+
+        # Bars of the populations below the boxes
+        bars = VGroup(*[self.create_bar(nuclide, x) for nuclide, x in zip(chain, xs)])
+        self.set_bar_heights(bars, populations[0])
+        population_axis = self.create_population_axis(xs[0] - spacing / 2 - 0.1)
+        population_label = Text("N / N₀", font_size=14, color=GRAY)
+        population_label.next_to(population_axis, UP, buff=0.15)
+        baseline = Line([xs[0] - spacing / 2, BAR_BOTTOM, 0], [xs[-1] + spacing / 2, BAR_BOTTOM, 0],
+                        color=GRAY, stroke_width=1)
+
+        # Time axis with the half-lives of the members and a cursor
+        time_axis, time_labels = self.create_time_axis(year_symbol)
+        half_life_marks = VGroup(*[
+            Triangle(color=bar.get_fill_color(), fill_opacity=1, stroke_width=0)
+            .scale(0.06).move_to(time_axis.n2p(nuclide.half_life) + UP * 0.12)
+            for nuclide, bar in zip(chain[:-1], bars)
+        ])
+        half_life_label = VGroup(
+            Triangle(color=GRAY, fill_opacity=1, stroke_width=0).scale(0.06),
+            Text(self.text["half_life"], font_size=13, color=GRAY),
+        ).arrange(RIGHT, buff=0.1)
+        half_life_label.next_to(time_labels, DOWN, buff=0.25).align_to(time_axis, LEFT)
+        cursor = Triangle(color=WHITE, fill_opacity=1).scale(0.1).rotate(PI)
+        cursor.move_to(time_axis.n2p(times[0]) + UP * 0.3)
+        readout = Text(f"t = {format_duration(times[0], year_symbol)}", font_size=24, color=YELLOW)
+        readout.next_to(time_labels, DOWN, buff=0.2)
+
+        # Animation
+        self.play(Write(title), run_time=1)
+        self.play(LaggedStart(*[FadeIn(box, shift=DOWN * 0.2) for box in boxes], lag_ratio=0.08),
+                  run_time=2)
+        self.play(FadeIn(modes), run_time=0.8)
+        self.play(Create(population_axis), FadeIn(population_label), Create(baseline),
+                  Create(time_axis), FadeIn(time_labels), run_time=1.5)
+        self.play(FadeIn(half_life_marks), FadeIn(half_life_label), FadeIn(bars),
+                  FadeIn(cursor), FadeIn(readout), run_time=1)
+        self.wait(0.5)
+
+        # One clock runs through the precomputed time grid. The bars, cursor and
+        # readout are already in the scene; the clock has to update before them
+        clock = ValueTracker(0)
+        clock.add_updater(lambda mob, dt: mob.increment_value(dt))
+        self.bring_to_back(clock)
+        last_index = len(times) - 1
+
+        def get_index():
+            return min(int(clock.get_value() / TIMELINE_DURATION * last_index), last_index)
+
+        def update_bars(mob):
+            self.set_bar_heights(mob, populations[get_index()])
+
+        def update_cursor(mob):
+            mob.move_to(time_axis.n2p(times[get_index()]) + UP * 0.3)
+
+        shown = [f"t = {format_duration(times[0], year_symbol)}"]
+
+        def update_readout(mob):
+            text = f"t = {format_duration(times[get_index()], year_symbol)}"
+            if text != shown[0]:
+                shown[0] = text
+                mob.become(Text(text, font_size=24, color=YELLOW).move_to(mob, aligned_edge=LEFT))
+
+        bars.add_updater(update_bars)
+        cursor.add_updater(update_cursor)
+        readout.add_updater(update_readout)
+        self.wait(TIMELINE_DURATION)
+
+        for mob in (clock, bars, cursor, readout):
+            mob.clear_updaters()
+        self.wait(2)
+
+        self.play(FadeOut(Group(*self.mobjects)), run_time=1.5)
+        self.wait(0.5)
+
+
+class UraniumSeries(DecayChain):
+    SERIES = "U-238"
+
+
+class ThoriumSeries(DecayChain):
+    SERIES = "Th-232"
+
+
+class UraniumSeriesDE(UraniumSeries):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class UraniumSeriesEN(UraniumSeries):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
+
+
+class ThoriumSeriesDE(ThoriumSeries):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class ThoriumSeriesEN(ThoriumSeries):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
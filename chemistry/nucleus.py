@@ -0,0 +1,172 @@
+"""
+Packed nucleus / Kern aus Nukleonen
+
+Places the protons and neutrons of a nucleus as touching spheres in a
+compact ball and draws them. Positions come from a relaxation in whole
+NumPy arrays: nucleons start at random points of a ball, are pulled
+towards the centre and pushed apart wherever two overlap. Overlapping
+pairs are found with a neighbour grid of one nucleon diameter, so a step
+only looks at nearby nucleons. Results are cached per (protons,
+neutrons, seed) in memory and as .npz files below the media directory.
+
+The ball is drawn in depth layers, back to front, with one merged path
+per layer and kind of nucleon: a few dozen VMobjects for Og instead of
+294 circles.
+"""
+
+import itertools
+
+import numpy as np
+from manim import BLACK, Circle, ManimColor, VGroup, VMobject, interpolate_color
+
+from .cache import NpzCache
+from .constants import COLORS
+from .lod import LevelOfDetail
+
+# Lengths in nucleon radii
+NUCLEON_DIAMETER = 2.0
+PACKING_FRACTION = 0.6   # random close packing is about 0.64
+RELAX_STEPS = 300
+CENTER_PULL = 0.02       # fraction of the distance to the centre per step
+OVERLAP_RELAXATION = 0.5
+NEIGHBOUR_SKIN = 0.5     # pair list range beyond contact
+REBUILD_INTERVAL = 10
+
+# Drawing
+MAX_NUCLEON_RADIUS = 0.12
+LAYER_DEPTH = 1.0        # nucleon radii per depth layer
+BACK_BRIGHTNESS = 0.45
+
+
+def get_neighbour_pairs(positions, cutoff):
+    """
+    Index pairs (i < j) of all points closer than cutoff, found through a
+    grid of cells of size cutoff: only points in the same or adjacent
+    cells are compared.
+    """
+    cells = np.floor(positions / cutoff).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    dims = cells.max(axis=0) + 2
+    keys = np.ravel_multi_index(cells.T, dims)
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    index = np.arange(len(positions))
+
+    first, second = [], []
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        neighbour_keys = np.ravel_multi_index((cells + offset).T, dims)
+        starts = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+        counts = np.searchsorted(sorted_keys, neighbour_keys, side="right") - starts
+        # All (point, member of neighbour cell) combinations without a Python loop
+        owners = np.repeat(index, counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        members = order[np.repeat(starts, counts) + within]
+        keep = owners < members
+        first.append(owners[keep])
+        second.append(members[keep])
+    first, second = np.concatenate(first), np.concatenate(second)
+
+    distances = np.linalg.norm(positions[second] - positions[first], axis=1)
+    close = distances < cutoff
+    return first[close], second[close]
+
+
+def pack_nucleons(protons, neutrons, seed=0):
+    """
+    Centres of protons + neutrons touching spheres of radius 1 in a
+    compact ball, shape (count, 3), and whether each one is a proton.
+    Protons and neutrons are mixed at random.
+    """
+    count = protons + neutrons
+    rng = np.random.default_rng(seed)
+    radius = (count / PACKING_FRACTION) ** (1 / 3)
+    directions = rng.normal(size=(count, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    positions = directions * radius * rng.random((count, 1)) ** (1 / 3)
+
+    for step in range(RELAX_STEPS if count > 1 else 0):
+        if step % REBUILD_INTERVAL == 0:
+            first, second = get_neighbour_pairs(positions, NUCLEON_DIAMETER + NEIGHBOUR_SKIN)
+        # The pull fades out, so that the last steps only separate overlaps
+        pull = CENTER_PULL * (1 - step / RELAX_STEPS) ** 2
+        positions -= pull * (positions - positions.mean(axis=0))
+
+        delta = positions[second] - positions[first]
+        distances = np.maximum(np.linalg.norm(delta, axis=1), 1e-9)
+        overlap = np.maximum(NUCLEON_DIAMETER - distances, 0)
+        push = delta * (OVERLAP_RELAXATION * overlap / (2 * distances))[:, None]
+        # Sum the pushes per nucleon, both partners in opposite directions
+        for axis in range(3):
+            positions[:, axis] += (np.bincount(second, push[:, axis], minlength=count)
+                                   - np.bincount(first, push[:, axis], minlength=count))
+
+    positions -= positions.mean(axis=0)
+    is_proton = np.zeros(count, dtype=bool)
+    is_proton[rng.permutation(count)[:protons]] = True
+    return positions, is_proton
+
+
+class NucleusCache(NpzCache):
+    """Packed nuclei, kept in memory and as .npz files below the media directory."""
+
+    directory_name = "nucleus_cache"
+
+    def get(self, protons, neutrons, seed=0):
+        """Positions and proton flags of a nucleus, packed only on the first request."""
+        key = (protons, neutrons, seed)
+        if key in self.entries:
+            return self.entries[key]
+        path = self.get_path(key)
+        if path.exists():
+            with np.load(path) as data:
+                entry = data["positions"].astype(np.float64), data["is_proton"]
+        else:
+            entry = pack_nucleons(protons, neutrons, seed)
+            self.save(key, positions=entry[0].astype(np.float32), is_proton=entry[1])
+        self.entries[key] = entry
+        return entry
+
+
+NUCLEUS_CACHE = NucleusCache()
+
+
+class NucleonCluster(VGroup):
+    """
+    Protons and neutrons of a nucleus as a ball of spheres of at most
+    ``radius``, centred on the origin.
+
+    Nucleons are sorted into depth layers of LAYER_DEPTH; each layer holds
+    one VMobject of all its proton outlines and one of its neutron
+    outlines, darker towards the back, and layers are added back to
+    front so nearer nucleons cover farther ones.
+    """
+
+    def __init__(self, protons, neutrons, radius, seed=0, cache=None, lod=None, **kwargs):
+        super().__init__(**kwargs)
+        cache = cache if cache is not None else NUCLEUS_CACHE
+        lod = lod or LevelOfDetail()
+        positions, is_proton = cache.get(protons, neutrons, seed)
+
+        extent = np.linalg.norm(positions, axis=1).max() + 1
+        self.nucleon_radius = min(MAX_NUCLEON_RADIUS, radius / extent)
+        template = Circle(radius=self.nucleon_radius).points
+        centers = positions * self.nucleon_radius * [1, 1, 0]
+
+        depth = positions[:, 2] - positions[:, 2].min()
+        layers = (depth / LAYER_DEPTH).astype(int)
+        num_layers = layers.max() + 1
+        for layer in range(num_layers):
+            brightness = np.interp(layer + 1, [0, num_layers], [BACK_BRIGHTNESS, 1])
+            for kind, color in ((True, COLORS["proton"]), (False, COLORS["neutron"])):
+                members = (layers == layer) & (is_proton == kind)
+                if not members.any():
+                    continue
+                part = VMobject(
+                    fill_color=interpolate_color(BLACK, ManimColor(color), brightness),
+                    fill_opacity=1,
+                    stroke_color=BLACK,
+                    stroke_opacity=0.5,
+                    stroke_width=lod.stroke_width(0.5),
+                )
+                part.set_points((template[None] + centers[members, None, :]).reshape(-1, 3))
+                self.add(part)
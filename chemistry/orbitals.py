@@ -0,0 +1,200 @@
+"""
+Hydrogen orbitals / Wasserstofforbitale
+
+Samples electron positions from |psi_nlm|^2 of hydrogen-like atoms and
+draws them as one point cloud. psi separates into a radial part R_nl(r)
+and a real spherical harmonic Y_lm: radii are drawn by inverting the
+cumulative r^2 R_nl^2 on a dense grid, directions by rejection sampling
+|Y_lm|^2 over the sphere, both in whole NumPy batches. Samples are cached
+per (n, l, m, points, seed) in memory and as .npz files below the media
+directory, so a re-render never samples again.
+"""
+
+import numpy as np
+from manim import UP, WHITE, ManimColor, PMobject, config
+
+from .cache import NpzCache
+from .constants import SHELL_COLORS, SHELL_NAMES
+
+RADIAL_GRID_SIZE = 8192
+ANGULAR_GRID_SIZE = (256, 512)  # cos(theta), phi
+SUBSHELL_LETTERS = "spdf"
+
+# Real orbital names of p and d; f orbitals are named by m
+ORBITAL_NAMES = {
+    (1, -1): "y", (1, 0): "z", (1, 1): "x",
+    (2, -2): "xy", (2, -1): "yz", (2, 0): "z²", (2, 1): "xz", (2, 2): "x²-y²",
+}
+
+
+def check_quantum_numbers(n, l, m):
+    if not (n >= 1 and 0 <= l < n and -l <= m <= l):
+        raise ValueError(f"invalid quantum numbers n={n}, l={l}, m={m}")
+
+
+def get_orbital_label(n, l, m):
+    """``2p_z``, ``3d_xy``, ``4f (m=-2)``..."""
+    label = f"{n}{SUBSHELL_LETTERS[l]}"
+    if l == 0:
+        return label
+    if (l, m) in ORBITAL_NAMES:
+        return f"{label}_{ORBITAL_NAMES[(l, m)]}"
+    return f"{label} (m={m})"
+
+
+def laguerre(k, alpha, x):
+    """Generalized Laguerre polynomial L_k^alpha(x) by recurrence."""
+    previous, current = np.zeros_like(x), np.ones_like(x)
+    for i in range(k):
+        previous, current = current, ((2 * i + 1 + alpha - x) * current - (i + alpha) * previous) / (i + 1)
+    return current
+
+
+def associated_legendre(l, m, x):
+    """Associated Legendre function P_l^m(x) for m >= 0 by recurrence (unnormalized)."""
+    p_mm = np.ones_like(x)
+    if m:
+        p_mm = np.prod(np.arange(1, 2 * m, 2)) * (1 - x * x) ** (m / 2) * (-1) ** m
+    if l == m:
+        return p_mm
+    previous, current = p_mm, x * (2 * m + 1) * p_mm
+    for degree in range(m + 2, l + 1):
+        previous, current = current, ((2 * degree - 1) * x * current
+                                      - (degree + m - 1) * previous) / (degree - m)
+    return current
+
+
+def radial_function(n, l, r, z=1):
+    """R_nl(r) up to a constant factor; r in Bohr radii."""
+    rho = 2 * z * r / n
+    return rho ** l * np.exp(-rho / 2) * laguerre(n - l - 1, 2 * l + 1, rho)
+
+
+def angular_function(l, m, cos_theta, phi):
+    """Real spherical harmonic Y_lm up to a constant factor."""
+    legendre = associated_legendre(l, abs(m), cos_theta)
+    if m > 0:
+        return legendre * np.cos(m * phi)
+    if m < 0:
+        return legendre * np.sin(-m * phi)
+    return legendre
+
+
+def get_radial_extent(n, z=1):
+    """Radius in Bohr radii beyond which r^2 R_nl^2 is negligible for all l."""
+    return (3 * n * n + 8 * n + 10) / z
+
+
+def sample_radii(n, l, count, rng, z=1):
+    """Radii distributed as r^2 R_nl(r)^2, by inverse transform sampling."""
+    grid = np.linspace(0, get_radial_extent(n, z), RADIAL_GRID_SIZE)
+    density = (grid * radial_function(n, l, grid, z)) ** 2
+    cdf = np.cumsum(density)
+    cdf /= cdf[-1]
+    return np.interp(rng.random(count), cdf, grid)
+
+
+def sample_directions(l, m, count, rng):
+    """(cos theta, phi) distributed as |Y_lm|^2 over the sphere, by rejection."""
+    cos_grid = np.linspace(-1, 1, ANGULAR_GRID_SIZE[0])[:, None]
+    phi_grid = np.linspace(0, 2 * np.pi, ANGULAR_GRID_SIZE[1])[None, :]
+    peak = np.max(angular_function(l, m, cos_grid, phi_grid) ** 2) * 1.05
+
+    cos_theta = np.empty(0)
+    phi = np.empty(0)
+    while len(cos_theta) < count:
+        # Draw enough candidates for the typical acceptance rate in one go
+        batch = 4 * (count - len(cos_theta)) + 1024
+        candidate_cos = rng.uniform(-1, 1, batch)
+        candidate_phi = rng.uniform(0, 2 * np.pi, batch)
+        density = angular_function(l, m, candidate_cos, candidate_phi) ** 2
+        accepted = rng.random(batch) * peak < density
+        cos_theta = np.concatenate([cos_theta, candidate_cos[accepted]])
+        phi = np.concatenate([phi, candidate_phi[accepted]])
+    return cos_theta[:count], phi[:count]
+
+
+def sample_orbital(n, l, m, count, seed=0, z=1):
+    """
+    Samples count positions of an electron in orbital (n, l, m).
+
+    Returns the positions in Bohr radii, shape (count, 3), and the sign of
+    psi at each of them (+1 or -1) for colouring the lobes.
+    """
+    check_quantum_numbers(n, l, m)
+    rng = np.random.default_rng(seed)
+    radii = sample_radii(n, l, count, rng, z)
+    cos_theta, phi = sample_directions(l, m, count, rng)
+    sin_theta = np.sqrt(1 - cos_theta ** 2)
+    points = radii[:, None] * np.stack(
+        [sin_theta * np.cos(phi), sin_theta * np.sin(phi), cos_theta], axis=1)
+    psi = radial_function(n, l, radii, z) * angular_function(l, m, cos_theta, phi)
+    return points, np.where(psi < 0, -1, 1).astype(np.int8)
+
+
+class OrbitalCache(NpzCache):
+    """Sampled orbitals, kept in memory and as .npz files below the media directory."""
+
+    directory_name = "orbital_cache"
+
+    def get(self, n, l, m, count, seed=0, z=1):
+        """Positions and signs of orbital (n, l, m), sampled only on the first request."""
+        key = (n, l, m, count, seed, z)
+        if key in self.entries:
+            return self.entries[key]
+        path = self.get_path(key)
+        if path.exists():
+            with np.load(path) as data:
+                entry = data["points"].astype(np.float64), data["signs"]
+        else:
+            entry = sample_orbital(n, l, m, count, seed, z)
+            self.save(key, points=entry[0].astype(np.float32), signs=entry[1])
+        self.entries[key] = entry
+        return entry
+
+
+ORBITAL_CACHE = OrbitalCache()
+
+
+def get_lobe_colors(n):
+    """RGB of the positive and negative lobes: the colour of shell n and a lighter tint."""
+    positive = ManimColor(SHELL_COLORS[SHELL_NAMES[n - 1]]).to_rgb()
+    negative = positive + (ManimColor(WHITE).to_rgb() - positive) * 0.55
+    return np.array([positive, negative])
+
+
+class OrbitalCloud(PMobject):
+    """
+    Point cloud of one orbital, drawn as a single PMobject.
+
+    The cloud is scaled so that 99 % of the points lie within ``radius``.
+    ``turn`` rotates it about the vertical axis and shades points by
+    depth, which is enough for a 3D impression with the 2D camera.
+    """
+
+    def __init__(self, n, l, m, num_points=100_000, seed=0, radius=2.5, cache=None, **kwargs):
+        kwargs.setdefault("stroke_width", max(1, round(config.pixel_height / 1080)))
+        super().__init__(**kwargs)
+        cache = cache if cache is not None else ORBITAL_CACHE
+        points, signs = cache.get(n, l, m, num_points, seed)
+        # Tilt the z axis towards the viewer so that p_z and d_z² lobes keep their shape
+        points = points[:, [0, 2, 1]] * [1, 1, -1]
+        scale = radius / np.percentile(np.linalg.norm(points, axis=1), 99)
+        self.extent = radius
+        self.base_rgbs = get_lobe_colors(n)[(signs < 0).astype(int)]
+        rgbas = np.ones((len(points), 4))
+        rgbas[:, :3] = self.base_rgbs
+        self.add_points(points * scale, rgbas=rgbas)
+        self.label = get_orbital_label(n, l, m)
+        self.shade()
+
+    def shade(self):
+        """Darkens points towards the back (negative z)."""
+        depth = (self.points[:, 2] - self.get_center()[2]) / self.extent
+        brightness = np.clip(0.7 + 0.3 * depth, 0.35, 1.0)
+        self.rgbas[:, :3] = self.base_rgbs * brightness[:, None]
+        return self
+
+    def turn(self, angle):
+        self.rotate(angle, axis=UP, about_point=self.get_center())
+        return self.shade()
@@ -0,0 +1,135 @@
+"""
+Aufbauprinzip - YouTube Version (16:9, 4K)
+Aufbau Principle
+
+Animation zeigt:
+1. Ein Atomkern, dessen Schalen von Z = 1 bis Z = 118 aufgefuellt werden
+2. Elementsymbol, Name und Elektronenkonfiguration zu jedem Schritt
+
+Die Konfigurationen kommen aus der Madelung-Regel mit Ausnahmetabelle
+(chemistry/aufbau.py). Alle Elektronen liegen in einem ElectronPool; pro
+Schritt werden nur dessen Arrays neu belegt, es entstehen keine neuen
+Kreise.
+Configurations come from the Madelung rule plus exceptions; all electrons
+live in one ElectronPool whose arrays are reassigned per step.
+"""
+
+from manim import *
+
+from chemistry import (
+    COLORS,
+    ELEMENT_COLORS,
+    ELEMENTS,
+    SHELL_COLORS,
+    SHELL_NAMES,
+    ElectronPool,
+    LevelOfDetail,
+    format_subshell_config,
+    get_element_name,
+    get_shell_config,
+    get_text,
+)
+from chemistry.atom import NUCLEUS_RADIUS, get_shell_radius
+
+NUCLEUS_CENTER = RIGHT * 3.0 + DOWN * 0.3
+PANEL_CENTER = LEFT * 3.6 + DOWN * 0.3
+
+STEP_TIME = 0.5
+HOLD_TIME = 0.2
+
+
+class AufbauFilling(Scene):
+    ELEMENTS = ELEMENTS
+
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    def create_nucleus(self):
+        nucleus = Circle(
+            radius=NUCLEUS_RADIUS,
+            fill_color=COLORS["proton"],
+            fill_opacity=0.9,
+            stroke_color=WHITE,
+            stroke_width=2
+        )
+        return nucleus.move_to(NUCLEUS_CENTER)
+
+    def create_orbits(self):
+        """Dashed orbits of all shells; each is shown when its shell is first occupied."""
+        lod = LevelOfDetail()
+        orbits = []
+        for index, name in enumerate(SHELL_NAMES):
+            radius = get_shell_radius(index)
+            orbit = Circle(
+                radius=radius,
+                stroke_color=SHELL_COLORS[name],
+                stroke_width=1.5,
+                stroke_opacity=0.6
+            )
+            orbit = DashedVMobject(orbit, num_dashes=lod.num_dashes(radius, 20 + index * 8))
+            orbits.append(orbit.move_to(NUCLEUS_CENTER))
+        return orbits
+
+    def create_element_panel(self, element):
+        """Symbol, name, proton count and configuration of one element."""
+        color = ELEMENT_COLORS.get(element.group, WHITE)
+        symbol = Text(element.symbol, font_size=96, color=color, weight=BOLD)
+        name = Text(get_element_name(element, self.lang), font_size=30, color=WHITE)
+        number = Text(f"Z = {element.number}", font_size=24, color=GRAY)
+        config_label = Text(self.text["configuration"] + ":", font_size=18, color=GRAY)
+        config_value = Text(format_subshell_config(element.number), font_size=22, color=WHITE)
+        shells = Text(
+            "  ".join(f"{name}: {count}" for name, count
+                      in zip(SHELL_NAMES, get_shell_config(element.number)) if count),
+            font_size=18, color=GRAY,
+        )
+        panel = VGroup(symbol, name, number, config_label, config_value, shells)
+        panel.arrange(DOWN, buff=0.3)
+        return panel.move_to(PANEL_CENTER)
+
+    def construct(self):
+        title = Text(self.text["aufbau"], font_size=42, color=WHITE)
+        title.to_edge(UP, buff=0.5)
+
+        nucleus = self.create_nucleus()
+        orbits = self.create_orbits()
+        pool = ElectronPool(capacity=len(self.ELEMENTS)).move_center_to(NUCLEUS_CENTER)
+        pool.add_updater(lambda mob, dt: mob.rotate_shells(dt))
+
+        first = self.ELEMENTS[0]
+        panel = self.create_element_panel(first)
+
+        self.play(Write(title), run_time=1)
+        self.play(FadeIn(nucleus), FadeIn(panel), run_time=1)
+        self.add(pool)
+
+        shown = set()
+        for element in self.ELEMENTS:
+            config = get_shell_config(element.number)
+            animations = [pool.animate_config(config)]
+            for index, count in enumerate(config):
+                if count and index not in shown:
+                    animations.append(Create(orbits[index]))
+                    shown.add(index)
+            if element is not first:
+                animations.append(Transform(panel, self.create_element_panel(element)))
+            self.play(*animations, run_time=STEP_TIME)
+            self.wait(HOLD_TIME)
+
+        self.wait(2)
+        pool.clear_updaters()
+        shown_orbits = [orbits[index] for index in sorted(shown)]
+        self.play(FadeOut(VGroup(title, nucleus, panel, pool, *shown_orbits)), run_time=1.5)
+        self.wait(0.5)
+
+
+class AufbauFillingDE(AufbauFilling):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class AufbauFillingEN(AufbauFilling):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
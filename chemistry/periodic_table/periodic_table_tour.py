@@ -0,0 +1,120 @@
+"""
+Rundgang durch das Periodensystem - YouTube Version (16:9, 4K)
+Periodic Table Tour
+
+Animation zeigt:
+1. Vollstaendiges Periodensystem der Elemente
+2. Alle 118 Elemente nacheinander: Markierung im Periodensystem,
+   Steckbrief und Bohr-Atommodell
+
+Das Periodensystem, der Steckbrief und das Atommodell werden nur einmal
+gebaut. Von einem Element zum naechsten werden nur die geaenderten Texte
+und die Schalen mit geaenderter Elektronenzahl animiert, der Aufwand
+waechst also linear mit der Zahl der Schritte.
+The table, card and atom model are built once; each step only animates
+the texts and shells that change.
+"""
+
+from manim import *
+
+from chemistry import (
+    ELEMENT_COLORS,
+    ELEMENTS,
+    BohrModel,
+    create_batched_periodic_table,
+    create_element_box,
+    create_element_detail_box,
+    get_cell_centers,
+    get_text,
+)
+
+TABLE_SCALE = 0.42
+TABLE_CENTER = LEFT * 3.55 + UP * 1.6
+CARD_SCALE = 0.6
+CARD_CENTER = LEFT * 3.55 + DOWN * 2.2
+NUCLEUS_CENTER = RIGHT * 3.6 + DOWN * 0.2
+
+STEP_TIME = 0.8
+HOLD_TIME = 0.4
+
+
+class PeriodicTableTour(Scene):
+    ELEMENTS = ELEMENTS
+
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    def create_periodic_table(self):
+        table, _ = create_batched_periodic_table(create_element_box, None)
+        return table
+
+    def create_element_detail_box(self, element):
+        card = create_element_detail_box(element, self.text, self.lang)
+        card.scale(CARD_SCALE).move_to(CARD_CENTER)
+        return card
+
+    def create_bohr_model(self, element):
+        model = BohrModel(element.protons, element.neutrons, element.electron_config, self.text)
+        model.shift(NUCLEUS_CENTER - model.get_nucleus_center())
+        return model
+
+    def update_card(self, card, element, previous):
+        """Animations that turn the card of previous into the card of element."""
+        target = self.create_element_detail_box(element)
+        animations = []
+        if element.group != previous.group:
+            color = ELEMENT_COLORS.get(element.group, WHITE)
+            animations.append(card[0].animate.set_fill(color).set_stroke(color))
+        # number, symbol, name, latin name, mass
+        for part, new_part in zip(card[1:], target[1:]):
+            animations.append(Transform(part, new_part))
+        return animations
+
+    def construct(self):
+        pt_title = Text(self.text["periodic_table"], font_size=32, color=WHITE)
+        pt_title.to_edge(UP, buff=0.3)
+
+        table = self.create_periodic_table()
+        table.scale(TABLE_SCALE).move_to(TABLE_CENTER)
+        cell_centers = get_cell_centers(table)
+
+        self.play(Write(pt_title), run_time=1)
+        self.play(FadeIn(table), run_time=2)
+
+        first = self.ELEMENTS[0]
+        cell_size = 0.7 * TABLE_SCALE
+        highlight = Square(side_length=cell_size + 0.06, color=YELLOW, stroke_width=3)
+        highlight.move_to(cell_centers[first.symbol])
+        card = self.create_element_detail_box(first)
+        model = self.create_bohr_model(first)
+
+        self.play(Create(highlight), FadeIn(card), FadeIn(model), run_time=1)
+        self.wait(HOLD_TIME)
+
+        previous = first
+        for element in self.ELEMENTS[1:]:
+            self.play(
+                highlight.animate.move_to(cell_centers[element.symbol]),
+                *self.update_card(card, element, previous),
+                run_time=STEP_TIME / 2,
+            )
+            model.play_transition(self, element.protons, element.neutrons,
+                                  element.electron_config, run_time=STEP_TIME / 2)
+            self.wait(HOLD_TIME)
+            previous = element
+
+        self.wait(1)
+        self.play(FadeOut(VGroup(pt_title, table, highlight, card, model)), run_time=1.5)
+        self.wait(0.5)
+
+
+class PeriodicTableTourDE(PeriodicTableTour):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class PeriodicTableTourEN(PeriodicTableTour):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
@@ -0,0 +1,118 @@
+"""
+Trends im Periodensystem - YouTube Version (16:9, 4K)
+Periodic Trends
+
+Animation zeigt:
+1. Das Periodensystem in den Farben der Elementgruppen
+2. Nacheinander als Farbskala: Kovalenzradius, Elektronegativitaet,
+   erste Ionisierungsenergie, Atommasse und Valenzelektronen der
+   Hauptgruppen
+
+Das Periodensystem wird einmal gebaut; fuer jede Eigenschaft werden nur
+die Farbwerte der 118 Kaesten aus einer vorberechneten Tabelle
+(chemistry/trends.py) interpoliert.
+The table is built once; every trend only interpolates the colour arrays
+of its 118 cells from one precomputed table.
+"""
+
+from manim import *
+
+from chemistry import (
+    TRENDS,
+    TrendTable,
+    create_element_box,
+    format_trend_value,
+    get_text,
+    get_trend_colors,
+)
+from chemistry.trends import COLORMAP, NO_DATA_COLOR
+
+TABLE_SCALE = 0.86
+TABLE_CENTER = DOWN * 0.4
+COLORBAR_WIDTH = 4.2
+COLORBAR_HEIGHT = 0.22
+
+TRANSITION_TIME = 1.5
+HOLD_TIME = 3
+
+
+class PeriodicTrends(Scene):
+    TRENDS = TRENDS
+
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    def get_legend_center(self, table):
+        """Centre of the empty block above the transition metals (columns 3-12, rows 1-3)."""
+        hydrogen, magnesium = table.get_cell(1), table.get_cell(12)
+        scandium, zinc = table.get_cell(21), table.get_cell(30)
+        return np.array([(scandium.get_x() + zinc.get_x()) / 2,
+                         (hydrogen.get_y() + magnesium.get_y()) / 2, 0])
+
+    def create_colorbar(self):
+        colorbar = Rectangle(width=COLORBAR_WIDTH, height=COLORBAR_HEIGHT, stroke_width=0)
+        colorbar.set_fill(COLORMAP, opacity=1).set_sheen_direction(RIGHT)
+        no_data = VGroup(
+            Square(side_length=COLORBAR_HEIGHT, fill_color=NO_DATA_COLOR, fill_opacity=1,
+                   stroke_width=0),
+            Text(self.text["no_data"], font_size=14, color=GRAY),
+        ).arrange(RIGHT, buff=0.12)
+        no_data.next_to(colorbar, DOWN, buff=0.18).align_to(colorbar, LEFT)
+        return VGroup(colorbar, no_data)
+
+    def create_trend_labels(self, index, colorbar):
+        """Name of a trend and its smallest and largest value at the ends of the colorbar."""
+        trend, colors = self.TRENDS[index], get_trend_colors(self.TRENDS)
+        name = Text(self.text[trend.key], font_size=26, color=WHITE)
+        name.next_to(colorbar, UP, buff=0.25)
+        low = Text(format_trend_value(colors.low[index], trend.unit), font_size=16, color=GRAY)
+        low.next_to(colorbar, LEFT, buff=0.12)
+        high = Text(format_trend_value(colors.high[index], trend.unit), font_size=16, color=GRAY)
+        high.next_to(colorbar, RIGHT, buff=0.12)
+        return VGroup(name, low, high)
+
+    def construct(self):
+        title = Text(self.text["periodic_trends"], font_size=36, color=WHITE)
+        title.to_edge(UP, buff=0.3)
+
+        table = TrendTable(create_element_box)
+        table.scale(TABLE_SCALE).move_to(TABLE_CENTER)
+        trend_colors = get_trend_colors(self.TRENDS).colors
+
+        colorbar, no_data = self.create_colorbar()
+        VGroup(colorbar, no_data).move_to(self.get_legend_center(table))
+        labels = self.create_trend_labels(0, colorbar)
+
+        self.play(Write(title), run_time=1)
+        self.play(FadeIn(table), run_time=2)
+        self.wait(1)
+
+        self.play(
+            table.animate_colors(trend_colors[0]),
+            FadeIn(colorbar), FadeIn(no_data), FadeIn(labels),
+            run_time=TRANSITION_TIME,
+        )
+        self.wait(HOLD_TIME)
+
+        for index in range(1, len(self.TRENDS)):
+            self.play(
+                table.animate_colors(trend_colors[index]),
+                Transform(labels, self.create_trend_labels(index, colorbar)),
+                run_time=TRANSITION_TIME,
+            )
+            self.wait(HOLD_TIME)
+
+        self.play(FadeOut(VGroup(title, table, colorbar, no_data, labels)), run_time=1.5)
+        self.wait(0.5)
+
+
+class PeriodicTrendsDE(PeriodicTrends):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class PeriodicTrendsEN(PeriodicTrends):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
@@ -0,0 +1,286 @@
+"""
+Emissionsspektrum wasserstoffaehnlicher Ionen - YouTube Version (16:9, 4K)
+Emission Spectrum of Hydrogen-like Ions
+
+Animation zeigt:
+1. Bohr-Modell mit den sieben Schalen; das Elektron springt zwischen den
+   Bahnen und sendet je ein Photon aus, dessen Linie im Spektrum erscheint
+2. Alle Linien des Wasserstoffatoms auf einer logarithmischen Wellenlaengenachse
+3. Schwerere Kerne (He+, Li2+ ... Og117+): alle Linien wandern mit 1/Z^2
+   vom Infrarot bis in den Roentgenbereich
+
+Die Wellenlaengen aller Uebergaenge aller 118 Elemente stehen in einer
+einzigen, einmal berechneten Tabelle (chemistry/spectra.py); die Szene
+liest daraus nur Zeilen und verschiebt die vorhandenen Linien.
+The wavelengths of all transitions of all 118 elements are one table that
+is computed once; the scene only reads rows from it and moves its lines.
+"""
+
+from manim import *
+
+from chemistry import (
+    ELEMENT_COLORS,
+    ELEMENTS,
+    SHELL_COLORS,
+    SHELL_NAMES,
+    BohrModel,
+    create_orbit,
+    format_wavelength,
+    get_element_name,
+    get_spectral_lines,
+    get_text,
+    wavelength_to_rgb,
+)
+from chemistry.atom import get_shell_radius
+from chemistry.aufbau import SUPERSCRIPTS
+
+NUCLEUS_CENTER = LEFT * 4.2 + UP * 0.35
+PANEL_CENTER = RIGHT * 3.2 + UP * 0.6
+SPECTRUM_CENTER = DOWN * 3.0
+SPECTRUM_WIDTH = 12.4
+SPECTRUM_HEIGHT = 0.45
+WAVELENGTH_EXPONENTS = [-3, 5, 1]  # 1 pm to 100 µm, in nm
+ELECTRON_DIRECTION = np.array([np.cos(35 * DEGREES), np.sin(35 * DEGREES), 0])
+
+# Jumps (n_i, n_f) shown one by one for hydrogen
+JUMPS = [(3, 2), (4, 2), (5, 2), (6, 2), (2, 1), (4, 3)]
+REFERENCE_JUMP = (3, 2)
+# Atomic numbers the spectrum moves through afterwards
+NUMBERS = [2, 3, 6, 26, 79, 118]
+
+# Wavelength ranges (nm) of the labelled regions
+REGIONS = [
+    ("xray", 1e-3, 10),
+    ("ultraviolet", 10, 380),
+    ("visible", 380, 750),
+    ("infrared", 750, 1e5),
+]
+
+JUMP_TIME = 0.6
+PHOTON_TIME = 1.0
+STEP_TIME = 1.5
+HOLD_TIME = 1.0
+
+
+def get_ion_name(element):
+    """``H``, ``He⁺``, ``Fe²⁵⁺``: the element with only one electron left."""
+    charge = element.number - 1
+    if charge == 0:
+        return element.symbol
+    return element.symbol + (str(charge) if charge > 1 else "").translate(SUPERSCRIPTS) + "⁺"
+
+
+class EmissionSpectrum(Scene):
+    JUMPS = JUMPS
+    NUMBERS = NUMBERS
+
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    # -------------------------------------------------------------------------
+    # Spectrum
+    # -------------------------------------------------------------------------
+
+    def create_spectrum(self):
+        """Wavelength axis, dark strip, visible band and region labels."""
+        axis = NumberLine(
+            x_range=WAVELENGTH_EXPONENTS,
+            length=SPECTRUM_WIDTH,
+            scaling=LogBase(custom_labels=True),
+            include_numbers=True,
+            font_size=18,
+            color=GRAY,
+        )
+        # Align the line itself, not the line with its labels, to the strip
+        axis.shift(SPECTRUM_CENTER + DOWN * SPECTRUM_HEIGHT / 2
+                   - (axis.get_start() + axis.get_end()) / 2)
+        unit = Text(f"{self.text['wavelength']} λ (nm)", font_size=14, color=GRAY)
+        unit.next_to(axis, DOWN, buff=0.1).align_to(axis, RIGHT)
+
+        strip = Rectangle(width=SPECTRUM_WIDTH, height=SPECTRUM_HEIGHT,
+                          fill_color=BLACK, fill_opacity=1, stroke_color=GRAY, stroke_width=1)
+        strip.move_to(SPECTRUM_CENTER)
+
+        band_wavelengths = np.linspace(*REGIONS[2][1:], 12)
+        band = Line(axis.n2p(band_wavelengths[0]), axis.n2p(band_wavelengths[-1]), stroke_width=6)
+        band.set_stroke(color=[rgb_to_color(rgb) for rgb in wavelength_to_rgb(band_wavelengths)])
+        band_x = band.get_center()[0]
+        band.next_to(strip, UP, buff=0.05).set_x(band_x)
+
+        labels = VGroup()
+        for key, start, end in REGIONS:
+            label = Text(self.text[key], font_size=14, color=GRAY)
+            label.next_to(axis.n2p(np.sqrt(start * end)), UP, buff=SPECTRUM_HEIGHT + 0.2)
+            labels.add(label)
+        labels[2].next_to(band, UP, buff=0.08)
+        return axis, unit, strip, band, labels
+
+    def get_line_state(self, row, axis, lines_data):
+        """x positions, RGB colours and opacities of all lines of one element."""
+        shell_rgbs = np.array([color_to_rgb(SHELL_COLORS[name]) for name in SHELL_NAMES])
+        visible = lines_data.visible[row]
+        xs = axis.n2p(lines_data.wavelengths[row])[:, 0]
+        rgbs = np.where(visible[:, None], lines_data.colors[row], shell_rgbs[lines_data.lower - 1])
+        opacities = np.where(visible, 1.0, 0.5)
+        return xs, rgbs, opacities
+
+    def apply_line_state(self, lines, state, shown):
+        xs, rgbs, opacities = state
+        for line, x, rgb, opacity, is_shown in zip(lines, xs, rgbs, opacities, shown):
+            line.set_x(x)
+            line.set_stroke(color=rgb_to_color(rgb), opacity=opacity * is_shown)
+        return lines
+
+    # -------------------------------------------------------------------------
+    # Atom and readouts
+    # -------------------------------------------------------------------------
+
+    def get_orbit_point(self, level):
+        return NUCLEUS_CENTER + get_shell_radius(level - 1) * ELECTRON_DIRECTION
+
+    def create_photon(self, color, start, end):
+        photon = FunctionGraph(lambda x: 0.07 * np.sin(14 * x), x_range=[-0.35, 0.35],
+                               color=color, stroke_width=3)
+        photon.rotate(angle_of_vector(end - start)).move_to(start)
+        return photon
+
+    def create_ion_label(self, element):
+        color = ELEMENT_COLORS.get(element.group, WHITE)
+        ion = Text(get_ion_name(element), font_size=64, color=color, weight=BOLD)
+        name = Text(f"{get_element_name(element, self.lang)}   Z = {element.number}",
+                    font_size=22, color=WHITE)
+        name.next_to(ion, DOWN, buff=0.2)
+        return VGroup(ion, name).move_to(PANEL_CENTER + UP * 1.6)
+
+    def create_transition_label(self, upper, lower, wavelength):
+        transition = Text(f"{self.text['transition']}:  n = {upper} → {lower}",
+                          font_size=22, color=SHELL_COLORS[SHELL_NAMES[lower - 1]])
+        value = Text(f"λ = {format_wavelength(wavelength)}", font_size=26, color=YELLOW)
+        value.next_to(transition, DOWN, buff=0.2)
+        return VGroup(transition, value).move_to(PANEL_CENTER + DOWN * 1.3)
+
+    def construct(self):
+        lines_data = get_spectral_lines()
+        transitions = list(zip(lines_data.upper.tolist(), lines_data.lower.tolist()))
+        reference = transitions.index(REFERENCE_JUMP)
+        hydrogen = ELEMENTS[0]
+
+        title = Text(self.text["emission_spectrum"], font_size=36, color=WHITE)
+        title.to_edge(UP, buff=0.35)
+
+        # Atom: nucleus, all seven orbits and one electron
+        model = BohrModel(hydrogen.protons, hydrogen.neutrons, [0] * len(SHELL_NAMES), self.text)
+        model.shift(NUCLEUS_CENTER - model.get_nucleus_center())
+        orbits = VGroup(*[create_orbit(index, model.lod).move_to(NUCLEUS_CENTER)
+                          for index in range(len(SHELL_NAMES))])
+        electron = model.create_electron(0).move_to(self.get_orbit_point(1))
+
+        # Readouts
+        ion_label = self.create_ion_label(hydrogen)
+        formula = MathTex(r"\frac{1}{\lambda} = R\,Z^2"
+                          r"\left(\frac{1}{n_f^2} - \frac{1}{n_i^2}\right)",
+                          font_size=38, color=WHITE)
+        formula.move_to(PANEL_CENTER + UP * 0.1)
+
+        # Spectrum: one line per transition, hidden until it is emitted
+        axis, unit, strip, band, region_labels = self.create_spectrum()
+        lines = VGroup(*[Line(strip.get_bottom(), strip.get_top(), stroke_width=3)
+                         for _ in transitions])
+        shown = np.zeros(len(transitions))
+        state = self.get_line_state(0, axis, lines_data)
+        self.apply_line_state(lines, state, shown)
+
+        # Animation
+        self.play(Write(title), run_time=1)
+        self.play(FadeIn(model), Create(orbits), run_time=2)
+        self.play(FadeIn(electron, scale=0.5), Write(ion_label), Write(formula), run_time=1)
+        self.play(Create(strip), Create(axis), FadeIn(unit), Create(band),
+                  FadeIn(region_labels), run_time=1.5)
+        self.add(lines)
+
+        # Hydrogen: single jumps, each emitting one photon
+        level = 1
+        transition_label = None
+        for upper, lower in self.JUMPS:
+            if level != upper:
+                self.play(electron.animate.move_to(self.get_orbit_point(upper))
+                          .set_fill(SHELL_COLORS[SHELL_NAMES[upper - 1]]),
+                          run_time=JUMP_TIME)
+            index = transitions.index((upper, lower))
+            line = lines[index]
+            target = line.get_top() + UP * 0.1
+            photon = self.create_photon(rgb_to_color(state[1][index]),
+                                        self.get_orbit_point(upper), target)
+            new_label = self.create_transition_label(upper, lower,
+                                                     lines_data.wavelengths[0, index])
+            label_animation = (FadeIn(new_label) if transition_label is None
+                               else Transform(transition_label, new_label))
+            self.play(electron.animate.move_to(self.get_orbit_point(lower))
+                      .set_fill(SHELL_COLORS[SHELL_NAMES[lower - 1]]),
+                      FadeIn(photon), label_animation, run_time=JUMP_TIME)
+            if transition_label is None:
+                transition_label = new_label
+            level = lower
+
+            self.play(photon.animate.move_to(target), run_time=PHOTON_TIME)
+            self.remove(photon)
+            shown[index] = 1
+            line.set_stroke(opacity=state[2][index])
+            self.play(Create(line), Flash(target, color=line.get_stroke_color(),
+                                          line_length=0.15, flash_radius=0.15),
+                      run_time=0.5)
+            self.wait(0.3)
+
+        # All lines of hydrogen
+        remaining = VGroup(*[line for line, is_shown in zip(lines, shown) if not is_shown])
+        shown[:] = 1
+        self.apply_line_state(lines, state, shown)
+        self.play(electron.animate.move_to(self.get_orbit_point(1))
+                  .set_fill(SHELL_COLORS[SHELL_NAMES[0]]),
+                  Create(remaining, lag_ratio=0.1), run_time=2)
+
+        marker = Triangle(color=YELLOW, fill_opacity=1).scale(0.08).rotate(PI)
+        marker.add_updater(lambda mob: mob.next_to(lines[reference], UP, buff=0.05))
+        self.play(FadeIn(marker), Transform(transition_label, self.create_transition_label(
+            *REFERENCE_JUMP, lines_data.wavelengths[0, reference])), run_time=0.8)
+        self.wait(HOLD_TIME)
+
+        # Heavier nuclei: the lines move with 1/Z^2 (rows of the same table)
+        for number in self.NUMBERS:
+            element = ELEMENTS[number - 1]
+            row = number - 1
+            new_state = self.get_line_state(row, axis, lines_data)
+            old_state = state
+
+            def move_lines(mob, alpha, old_state=old_state, new_state=new_state):
+                self.apply_line_state(mob, [interpolate(old, new, alpha)
+                                            for old, new in zip(old_state, new_state)], shown)
+
+            self.play(
+                UpdateFromAlphaFunc(lines, move_lines),
+                Transform(ion_label, self.create_ion_label(element)),
+                Transform(transition_label, self.create_transition_label(
+                    *REFERENCE_JUMP, lines_data.wavelengths[row, reference])),
+                run_time=STEP_TIME,
+            )
+            model.play_transition(self, element.protons, element.neutrons,
+                                  [0] * len(SHELL_NAMES), run_time=0.5)
+            state = new_state
+            self.wait(HOLD_TIME)
+
+        marker.clear_updaters()
+        self.wait(1)
+        self.play(FadeOut(Group(*self.mobjects)), run_time=1.5)
+        self.wait(0.5)
+
+
+class EmissionSpectrumDE(EmissionSpectrum):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class EmissionSpectrumEN(EmissionSpectrum):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
@@ -0,0 +1,100 @@
+"""
+Orbitale des Wasserstoffatoms - YouTube Version (16:9, 4K)
+Orbitals of the Hydrogen Atom
+
+Animation zeigt:
+1. Orbitale 1s bis 4f als Punktwolken der Aufenthaltswahrscheinlichkeit |psi|^2
+2. Uebergaenge zwischen den Orbitalen, Punktwolken drehen sich langsam
+
+Jede Wolke ist ein einzelnes PMobject; die Punkte werden einmal gezogen
+und pro (n, l, m, Punktzahl, Seed) zwischengespeichert.
+Each cloud is a single PMobject whose points are sampled once and cached.
+"""
+
+from manim import *
+
+from chemistry import SHELL_COLORS, SHELL_NAMES, LevelOfDetail, OrbitalCloud, get_text
+from chemistry.orbitals import ORBITAL_NAMES, SUBSHELL_LETTERS
+
+# (n, l, m) in order of appearance
+ORBITALS = [
+    (1, 0, 0),
+    (2, 0, 0),
+    (2, 1, 0),
+    (2, 1, 1),
+    (3, 2, 0),
+    (3, 2, -2),
+    (4, 3, 0),
+]
+
+CLOUD_CENTER = RIGHT * 2.5 + DOWN * 0.3
+LABEL_CENTER = LEFT * 4.2 + DOWN * 0.3
+TURN_SPEED = 0.4
+
+
+class HydrogenOrbitals(Scene):
+    ORBITALS = ORBITALS
+
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    def get_num_points(self):
+        return 200_000 if LevelOfDetail().full_detail else 50_000
+
+    def create_orbital_cloud(self, n, l, m):
+        cloud = OrbitalCloud(n, l, m, num_points=self.get_num_points(), radius=2.8)
+        return cloud.shift(CLOUD_CENTER - cloud.get_center())
+
+    def create_orbital_label(self, n, l, m):
+        color = SHELL_COLORS[SHELL_NAMES[n - 1]]
+        name = Text(f"{n}{SUBSHELL_LETTERS[l]}", font_size=72, color=color, weight=BOLD)
+        label = VGroup(name)
+        if l:
+            index = Text(ORBITAL_NAMES.get((l, m), f"m={m}"), font_size=36, color=color)
+            index.next_to(name, RIGHT, buff=0.08, aligned_edge=DOWN).shift(DOWN * 0.15)
+            label.add(index)
+        numbers = Text(f"n = {n}    l = {l}    m = {m}", font_size=22, color=GRAY)
+        numbers.next_to(label, DOWN, buff=0.4)
+        return VGroup(label, numbers).move_to(LABEL_CENTER)
+
+    def construct(self):
+        title = Text(self.text["orbitals"], font_size=42, color=WHITE)
+        title.to_edge(UP, buff=0.5)
+        subtitle = Text(self.text["probability_density"] + "  |ψ|²", font_size=22, color=GRAY)
+        subtitle.next_to(title, DOWN, buff=0.2)
+
+        self.play(Write(title), FadeIn(subtitle), run_time=1)
+
+        cloud = None
+        label = None
+        for n, l, m in self.ORBITALS:
+            new_cloud = self.create_orbital_cloud(n, l, m)
+            new_label = self.create_orbital_label(n, l, m)
+            if cloud is None:
+                self.play(GrowFromCenter(new_cloud), FadeIn(new_label), run_time=1.5)
+            else:
+                cloud.clear_updaters()
+                # Point i of one cloud flows to point i of the next
+                self.play(ReplacementTransform(cloud, new_cloud),
+                          ReplacementTransform(label, new_label), run_time=1.5)
+            cloud, label = new_cloud, new_label
+
+            cloud.add_updater(lambda mob, dt: mob.turn(dt * TURN_SPEED))
+            self.wait(4)
+
+        cloud.clear_updaters()
+        self.play(FadeOut(VGroup(title, subtitle, label)), ShrinkToCenter(cloud), run_time=1.5)
+        self.remove(cloud)
+        self.wait(0.5)
+
+
+class HydrogenOrbitalsDE(HydrogenOrbitals):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class HydrogenOrbitalsEN(HydrogenOrbitals):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
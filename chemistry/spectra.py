@@ -0,0 +1,102 @@
+"""
+Emission spectra / Emissionsspektren
+
+Wavelengths of the lines of hydrogen-like ions (one electron around a
+nucleus of charge Z) from the Rydberg formula
+
+    1/lambda = R_M Z^2 (1/n_f^2 - 1/n_i^2),
+
+for every transition between the seven drawn shells and every element at
+once, as one (elements, transitions) array. R_M contains the reduced mass
+correction for the mass number of the element. The table and its colours
+are computed on first use and shared by all scenes of a render.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .constants import SHELL_NAMES
+from .data import ELEMENTS
+
+RYDBERG_CONSTANT = 1.0973731568160e7  # 1/m
+ELECTRON_MASS = 5.48579909065e-4      # u
+VISIBLE_RANGE = (380, 750)            # nm
+
+# Knots of the piecewise linear visible spectrum (nm -> RGB)
+SPECTRUM_KNOTS = [380, 440, 490, 510, 580, 645, 750]
+SPECTRUM_RGB = [
+    [1, 0, 0, 0, 1, 1, 1],
+    [0, 0, 1, 1, 1, 0, 0],
+    [1, 1, 1, 0, 0, 0, 0],
+]
+# Brightness falls off towards both ends of the visible range
+INTENSITY_KNOTS = [380, 420, 700, 750]
+INTENSITY = [0.3, 1, 1, 0.3]
+GAMMA = 0.8
+
+SpectralLines = namedtuple("SpectralLines", [
+    "upper",        # (transitions,) initial level n_i
+    "lower",        # (transitions,) final level n_f
+    "wavelengths",  # (elements, transitions) in nm
+    "colors",       # (elements, transitions, 3) RGB, black outside the visible range
+    "visible",      # (elements, transitions) bool
+])
+
+
+def get_transitions(max_level=len(SHELL_NAMES)):
+    """All (n_i, n_f) with n_i > n_f, grouped by series: Lyman, Balmer, Paschen..."""
+    lower, upper = np.triu_indices(max_level, k=1)
+    return upper + 1, lower + 1
+
+
+def get_rydberg_constant(mass_number):
+    """Rydberg constant (1/m) for a nucleus of the given mass number."""
+    return RYDBERG_CONSTANT / (1 + ELECTRON_MASS / np.asarray(mass_number, dtype=float))
+
+
+def get_wavelengths(numbers, mass_numbers, upper, lower):
+    """Wavelengths in nm, shape (len(numbers), len(upper))."""
+    numbers = np.asarray(numbers, dtype=float)[:, None]
+    rydberg = get_rydberg_constant(mass_numbers)[:, None]
+    wavenumbers = rydberg * numbers ** 2 * (1 / np.asarray(lower) ** 2 - 1 / np.asarray(upper) ** 2)
+    return 1e9 / wavenumbers
+
+
+def wavelength_to_rgb(wavelengths):
+    """Approximate RGB (0 to 1) of light of the given wavelengths in nm."""
+    wavelengths = np.asarray(wavelengths, dtype=float)
+    rgb = np.stack([np.interp(wavelengths, SPECTRUM_KNOTS, channel) for channel in SPECTRUM_RGB],
+                   axis=-1)
+    rgb *= np.interp(wavelengths, INTENSITY_KNOTS, INTENSITY)[..., None]
+    visible = (wavelengths >= VISIBLE_RANGE[0]) & (wavelengths <= VISIBLE_RANGE[1])
+    return np.where(visible[..., None], rgb ** GAMMA, 0.0)
+
+
+@lru_cache(maxsize=None)
+def get_spectral_lines(elements=tuple(ELEMENTS)):
+    """Spectral lines of all elements, row i belonging to ``elements[i]``."""
+    upper, lower = get_transitions()
+    numbers = [element.number for element in elements]
+    mass_numbers = [element.protons + element.neutrons for element in elements]
+    wavelengths = get_wavelengths(numbers, mass_numbers, upper, lower)
+    lines = SpectralLines(
+        upper=upper,
+        lower=lower,
+        wavelengths=wavelengths,
+        colors=wavelength_to_rgb(wavelengths),
+        visible=(wavelengths >= VISIBLE_RANGE[0]) & (wavelengths <= VISIBLE_RANGE[1]),
+    )
+    for array in lines:
+        array.setflags(write=False)
+    return lines
+
+
+def format_wavelength(wavelength):
+    """``656.5 nm``, ``1.875 µm``, ``6.65 pm``..."""
+    for unit, factor in (("µm", 1e3), ("nm", 1), ("pm", 1e-3)):
+        if wavelength >= factor or unit == "pm":
+            value = wavelength / factor
+            break
+    return f"{value:.4g} {unit}"
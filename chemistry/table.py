@@ -0,0 +1,143 @@
+"""
+Batched periodic table / Gebuendeltes Periodensystem
+
+Builds the periodic table for rendering: all boxes of one group colour are
+merged into a single multi-subpath VMobject and all symbols into one white
+VMobject. Instead of 236 separate Cairo draws per frame the table costs one
+draw per colour plus one for the symbols. The target element stays a normal
+box so it can still be transformed on its own.
+
+``TrendTable`` keeps one background per cell instead, for heat maps of
+periodic trends: its cells are recoloured by writing into their colour
+arrays, so changing the colouring never rebuilds a box.
+"""
+
+import numpy as np
+from manim import ORIGIN, UL, WHITE, UpdateFromAlphaFunc, VGroup
+
+from .constants import ELEMENT_COLORS, PERIODIC_TABLE
+from .lod import merge_paths
+
+
+def get_cell_position(col, row, cell_size=0.7, gap=0.05):
+    """Position of a table cell; lanthanides/actinides sit half a row lower."""
+    x = col * (cell_size + gap)
+    if row >= 8:
+        y = -(row + 0.5) * (cell_size + gap)
+    else:
+        y = -row * (cell_size + gap)
+    return [x, y, 0]
+
+
+def create_batched_periodic_table(create_element_box, target_symbol,
+                                  cell_size=0.7, gap=0.05):
+    """
+    Creates the periodic table from batched box and symbol outlines.
+
+    ``create_element_box(symbol, number, group, size)`` must return a
+    ``VGroup(background, symbol_text)`` like the element scenes build it.
+
+    Returns ``(table, target_box)``. The table holds one VMobject per group
+    colour, one VMobject with all symbols and, last, the unbatched target
+    box, so ``[elem for elem in table if elem != target_box]`` still selects
+    everything except the target.
+    """
+    backgrounds = {}
+    symbols = VGroup()
+    target_box = None
+
+    for (col, row), (symbol, number, group) in PERIODIC_TABLE.items():
+        box = create_element_box(symbol, number, group, size=cell_size)
+        box.move_to(get_cell_position(col, row, cell_size, gap))
+
+        if symbol == target_symbol:
+            target_box = box
+            continue
+
+        bg, sym_text = box
+        color = ELEMENT_COLORS.get(group, WHITE)
+        backgrounds.setdefault(color, VGroup()).add(bg)
+        symbols.add(sym_text)
+
+    table = VGroup(*[merge_paths(group) for group in backgrounds.values()])
+    table.add(merge_paths(symbols))
+    if target_box is not None:
+        table.add(target_box)
+
+    table.move_to(ORIGIN)
+    return table, target_box
+
+
+def get_cell_centers(table, cell_size=0.7, gap=0.05):
+    """
+    Centres of all cells of a table from create_batched_periodic_table,
+    by symbol, wherever the table has been moved or scaled to.
+    """
+    positions = {symbol: np.array(get_cell_position(col, row, cell_size, gap), dtype=float)
+                 for (col, row), (symbol, _, _) in PERIODIC_TABLE.items()}
+    points = np.array(list(positions.values()))
+    corner = np.array([points[:, 0].min() - cell_size / 2, points[:, 1].max() + cell_size / 2, 0])
+    scale = table.width / (np.ptp(points[:, 0]) + cell_size)
+    origin = table.get_corner(UL)
+    return {symbol: origin + (position - corner) * scale for symbol, position in positions.items()}
+
+
+class TrendTable(VGroup):
+    """
+    Periodic table whose cells can be coloured one by one.
+
+    Holds ``cells``, one background per element in atomic-number order, and
+    ``symbols``, all symbols merged into one path as in the batched table.
+    Colours are (elements, 3) RGB arrays: ``set_colors`` starts a
+    transition from the current colours to new ones and ``set_progress``
+    writes the interpolated colours straight into the fill and stroke
+    arrays of the cells, so the table is built once however often it is
+    recoloured.
+    """
+
+    def __init__(self, create_element_box, cell_size=0.7, gap=0.05, fill_opacity=0.7, **kwargs):
+        super().__init__(**kwargs)
+        boxes = {}
+        for (col, row), (symbol, number, group) in PERIODIC_TABLE.items():
+            box = create_element_box(symbol, number, group, size=cell_size)
+            boxes[number] = box.move_to(get_cell_position(col, row, cell_size, gap))
+        ordered = [boxes[number] for number in sorted(boxes)]
+
+        self.cells = VGroup(*[bg for bg, _ in ordered]).set_fill(opacity=fill_opacity)
+        self.symbols = merge_paths(VGroup(*[sym_text for _, sym_text in ordered]))
+        self.add(self.cells, self.symbols)
+        self.move_to(ORIGIN)
+
+        # Starts with the group colours of create_element_box
+        self.start_colors = np.array([cell.fill_rgbas[0, :3] for cell in self.cells])
+        self.end_colors = self.start_colors.copy()
+        self.progress = 1.0
+
+    def get_cell(self, number):
+        return self.cells[number - 1]
+
+    def get_colors(self):
+        alpha = self.progress
+        return self.start_colors * (1 - alpha) + self.end_colors * alpha
+
+    def set_colors(self, colors):
+        """Starts a transition to colors; animate it with set_progress."""
+        self.start_colors = self.get_colors()
+        self.end_colors = np.asarray(colors, dtype=float)
+        self.progress = 0.0
+        return self
+
+    def set_progress(self, alpha):
+        self.progress = alpha
+        return self.redraw()
+
+    def animate_colors(self, colors, **kwargs):
+        """Animation from the current to the given colours."""
+        self.set_colors(colors)
+        return UpdateFromAlphaFunc(self, lambda table, alpha: table.set_progress(alpha), **kwargs)
+
+    def redraw(self):
+        for cell, color in zip(self.cells, self.get_colors()):
+            cell.fill_rgbas[:, :3] = color
+            cell.stroke_rgbas[:, :3] = color
+        return self
@@ -0,0 +1,133 @@
+"""
+Cached transforms / Zwischengespeicherte Transformationen
+
+ReplacementTransform has to align the submobject families of the small
+table box and the detail card and resample their Bezier points before the
+first frame. The result only depends on the two mobjects, so it is stored
+per (element, language, resolution) and reused by later renders; the
+transition then only interpolates.
+"""
+
+import hashlib
+
+import numpy as np
+from manim import Animation, ReplacementTransform, VMobject, config
+
+from .cache import NpzCache
+
+# Per-submobject style data that Transform interpolates
+STYLE_ARRAYS = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "sheen_direction"]
+STYLE_SCALARS = ["stroke_width", "background_stroke_width", "sheen_factor"]
+
+
+def family_digest(*mobjects):
+    """Hash of the points and colours of all given mobject families."""
+    digest = hashlib.sha1()
+    for mobject in mobjects:
+        for part in mobject.family_members_with_points():
+            for array in (part.points, part.fill_rgbas, part.stroke_rgbas):
+                digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+            digest.update(b"|")
+        digest.update(b"#")
+    return digest.hexdigest()
+
+
+def pack_family(parts, prefix):
+    """Flattens points and style of a list of VMobjects into a few arrays."""
+    data = {
+        f"{prefix}_point_counts": np.array([len(part.points) for part in parts]),
+        f"{prefix}_points": np.concatenate([part.points for part in parts]),
+    }
+    for attr in STYLE_ARRAYS:
+        arrays = [np.atleast_2d(getattr(part, attr)) for part in parts]
+        data[f"{prefix}_{attr}_counts"] = np.array([len(array) for array in arrays])
+        data[f"{prefix}_{attr}"] = np.concatenate(arrays)
+    for attr in STYLE_SCALARS:
+        data[f"{prefix}_{attr}"] = np.array([float(getattr(part, attr)) for part in parts])
+    return data
+
+
+def unpack_family(data, prefix):
+    """Rebuilds the flat list of VMobjects stored by pack_family."""
+    counts = data[f"{prefix}_point_counts"]
+    parts = [VMobject() for _ in counts]
+    for part, points in zip(parts, np.split(data[f"{prefix}_points"], np.cumsum(counts)[:-1])):
+        part.points = points.copy()
+    for attr in STYLE_ARRAYS:
+        splits = np.cumsum(data[f"{prefix}_{attr}_counts"])[:-1]
+        for part, array in zip(parts, np.split(data[f"{prefix}_{attr}"], splits)):
+            value = array.copy()
+            setattr(part, attr, value[0] if attr == "sheen_direction" else value)
+    for attr in STYLE_SCALARS:
+        for part, value in zip(parts, data[f"{prefix}_{attr}"]):
+            setattr(part, attr, float(value))
+    return parts
+
+
+class TransformCache(NpzCache):
+    """
+    Aligned start and end arrays of transforms, kept in memory and as
+    .npz files below the media directory.
+    """
+
+    directory_name = "transform_cache"
+
+    def load(self, key, digest):
+        entry = self.entries.get(key)
+        if entry is None:
+            path = self.get_path(key)
+            if not path.exists():
+                return None
+            with np.load(path) as data:
+                entry = dict(data)
+            self.entries[key] = entry
+        if str(entry["digest"]) != digest:
+            return None
+        return entry
+
+    def store(self, key, digest, start_parts, end_parts):
+        entry = {"digest": np.array(digest)}
+        entry.update(pack_family(start_parts, "start"))
+        entry.update(pack_family(end_parts, "end"))
+        self.entries[key] = entry
+        self.save(key, **entry)
+
+
+TRANSFORM_CACHE = TransformCache()
+
+
+class CachedReplacementTransform(ReplacementTransform):
+    """
+    ReplacementTransform that reuses the family alignment of earlier renders.
+
+    ``cache_key`` identifies the transition, e.g. ``(symbol, lang)``; the
+    output resolution is appended automatically. A content digest of both
+    mobjects guards against stale entries, so a changed layout simply
+    recomputes the alignment.
+    """
+
+    def __init__(self, mobject, target_mobject, cache_key, cache=None, **kwargs):
+        self.cache_key = (*cache_key, f"{config.pixel_width}x{config.pixel_height}")
+        self.cache = cache if cache is not None else TRANSFORM_CACHE
+        super().__init__(mobject, target_mobject, **kwargs)
+
+    def begin(self):
+        digest = family_digest(self.mobject, self.target_mobject)
+        entry = self.cache.load(self.cache_key, digest)
+        if entry is None:
+            super().begin()
+            self.cache.store(
+                self.cache_key, digest,
+                self.starting_mobject.family_members_with_points(),
+                self.target_copy.family_members_with_points(),
+            )
+            return
+
+        # Replace the families with the already aligned flat copies
+        self.target_mobject = self.create_target()
+        self.target_copy = VMobject()
+        self.target_copy.add(*unpack_family(entry, "end"))
+        if isinstance(self.mobject, VMobject):
+            self.mobject.clear_points()
+        self.mobject.submobjects = unpack_family(entry, "start")
+        Animation.begin(self)
@@ -0,0 +1,144 @@
+"""
+Periodic trends / Periodische Eigenschaften
+
+Numeric properties of all 118 elements as columns in atomic-number order,
+and a colormap that turns every column into cell colours at once. The
+colours of all trends form one (trends, elements, 3) array, computed on
+first use, so a scene switching between trends only interpolates rows
+of it. Elements without a measured value are NaN and drawn in
+NO_DATA_COLOR.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .data import ELEMENTS
+
+NaN = float("nan")
+
+# Groups whose outermost shell alone does not hold the valence electrons
+OPEN_SHELL_GROUPS = {"transition", "lanthanide", "actinide"}
+
+# Covalent radii in pm (Cordero et al. 2008; low-spin values for Mn, Fe, Co)
+COVALENT_RADIUS = (
+    31, 28, 128, 96, 84, 76, 71, 66, 57, 58,
+    166, 141, 121, 111, 107, 105, 102, 106, 203, 176,
+    170, 160, 153, 139, 139, 132, 126, 124, 132, 122,
+    122, 120, 119, 120, 120, 116, 220, 195, 190, 175,
+    164, 154, 147, 146, 142, 139, 145, 144, 142, 139,
+    139, 138, 139, 140, 244, 215, 207, 204, 203, 201,
+    199, 198, 198, 196, 194, 192, 192, 189, 190, 187,
+    187, 175, 170, 162, 151, 144, 141, 136, 136, 132,
+    145, 146, 148, 140, 150, 150, 260, 221, 215, 206,
+    200, 196, 190, 187, 180, 169, NaN, NaN, NaN, NaN,
+    NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
+    NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
+)
+
+# Pauling electronegativity
+ELECTRONEGATIVITY = (
+    2.20, NaN, 0.98, 1.57, 2.04, 2.55, 3.04, 3.44, 3.98, NaN,
+    0.93, 1.31, 1.61, 1.90, 2.19, 2.58, 3.16, NaN, 0.82, 1.00,
+    1.36, 1.54, 1.63, 1.66, 1.55, 1.83, 1.88, 1.91, 1.90, 1.65,
+    1.81, 2.01, 2.18, 2.55, 2.96, 3.00, 0.82, 0.95, 1.22, 1.33,
+    1.6, 2.16, 1.9, 2.2, 2.28, 2.20, 1.93, 1.69, 1.78, 1.96,
+    2.05, 2.1, 2.66, 2.6, 0.79, 0.89, 1.10, 1.12, 1.13, 1.14,
+    1.13, 1.17, 1.2, 1.2, 1.1, 1.22, 1.23, 1.24, 1.25, 1.1,
+    1.27, 1.3, 1.5, 2.36, 1.9, 2.2, 2.20, 2.28, 2.54, 2.00,
+    1.62, 2.33, 2.02, 2.0, 2.2, 2.2, 0.79, 0.9, 1.1, 1.3,
+    1.5, 1.38, 1.36, 1.28, 1.13, 1.28, 1.3, 1.3, 1.3, 1.3,
+    1.3, 1.3, 1.3, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
+    NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
+)
+
+# First ionization energy in eV
+IONIZATION_ENERGY = (
+    13.598, 24.587, 5.392, 9.323, 8.298, 11.260, 14.534, 13.618, 17.423, 21.565,
+    5.139, 7.646, 5.986, 8.152, 10.487, 10.360, 12.968, 15.760, 4.341, 6.113,
+    6.561, 6.828, 6.746, 6.767, 7.434, 7.902, 7.881, 7.640, 7.726, 9.394,
+    5.999, 7.899, 9.789, 9.752, 11.814, 14.000, 4.177, 5.695, 6.217, 6.634,
+    6.759, 7.092, 7.28, 7.361, 7.459, 8.337, 7.576, 8.994, 5.786, 7.344,
+    8.608, 9.010, 10.451, 12.130, 3.894, 5.212, 5.577, 5.539, 5.473, 5.525,
+    5.582, 5.644, 5.670, 6.150, 5.864, 5.939, 6.022, 6.108, 6.184, 6.254,
+    5.426, 6.825, 7.550, 7.864, 7.834, 8.438, 8.967, 8.959, 9.226, 10.438,
+    6.108, 7.417, 7.286, 8.414, 9.318, 10.749, 4.073, 5.278, 5.380, 6.307,
+    5.89, 6.194, 6.266, 6.026, 5.974, 5.991, 6.198, 6.282, 6.368, 6.50,
+    6.58, 6.626, 4.96, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
+    NaN, NaN, NaN, NaN, NaN, NaN, NaN, NaN,
+)
+
+
+def get_atomic_masses(elements=ELEMENTS):
+    """Atomic masses in u from the "1.008 u" / "[294] u" strings of the element data."""
+    return tuple(float(element.mass.strip("[] u")) for element in elements)
+
+
+def get_valence_electrons(elements=ELEMENTS):
+    """
+    Electrons in the outermost shell of the main-group elements; NaN for
+    the d- and f-block, whose valence electrons are not that shell alone
+    (Pd has 18 there).
+    """
+    return tuple(NaN if element.group in OPEN_SHELL_GROUPS
+                 else [count for count in element.electron_config if count][-1]
+                 for element in elements)
+
+
+Trend = namedtuple("Trend", [
+    "key",     # TEXT key of the name
+    "unit",
+    "values",  # one per element, in atomic-number order
+])
+
+TRENDS = (
+    Trend("covalent_radius", "pm", COVALENT_RADIUS),
+    Trend("electronegativity", "", ELECTRONEGATIVITY),
+    Trend("ionization_energy", "eV", IONIZATION_ENERGY),
+    Trend("atomic_mass", "u", get_atomic_masses()),
+    Trend("valence_electrons", "", get_valence_electrons()),
+)
+
+# Colormap from low to high values, evenly spaced (viridis)
+COLORMAP = ["#440154", "#3B528B", "#21918C", "#5EC962", "#FDE725"]
+NO_DATA_COLOR = "#555555"
+
+TrendColors = namedtuple("TrendColors", [
+    "values",  # (trends, elements), NaN where unknown
+    "low",     # (trends,) smallest known value
+    "high",    # (trends,) largest known value
+    "colors",  # (trends, elements, 3) RGB
+])
+
+
+def hex_to_rgb(colors):
+    """(len(colors), 3) RGB (0 to 1) of "#RRGGBB" strings."""
+    return np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in colors]) / 255
+
+
+def apply_colormap(fractions, colormap=COLORMAP):
+    """RGB of fractions (0 to 1, any shape) on the colormap; NaN gives NO_DATA_COLOR."""
+    fractions = np.asarray(fractions, dtype=float)
+    knots = hex_to_rgb(colormap)
+    positions = np.linspace(0, 1, len(knots))
+    rgb = np.stack([np.interp(fractions, positions, channel) for channel in knots.T], axis=-1)
+    return np.where(np.isnan(fractions)[..., None], hex_to_rgb([NO_DATA_COLOR])[0], rgb)
+
+
+@lru_cache(maxsize=None)
+def get_trend_colors(trends=TRENDS):
+    """Values and colours of all trends, each scaled from its smallest to largest value."""
+    values = np.array([trend.values for trend in trends], dtype=float)
+    low = np.nanmin(values, axis=1)
+    high = np.nanmax(values, axis=1)
+    fractions = (values - low[:, None]) / (high - low)[:, None]
+    result = TrendColors(values=values, low=low, high=high, colors=apply_colormap(fractions))
+    for array in result:
+        array.setflags(write=False)
+    return result
+
+
+def format_trend_value(value, unit):
+    """``31 pm``, ``3.98``, ``24.59 eV``..."""
+    return f"{value:.4g} {unit}".strip()
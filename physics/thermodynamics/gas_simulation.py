@@ -0,0 +1,361 @@
+"""
+Kinetic gas simulation / Kinetische Gassimulation
+
+Particle model of water along the heating curve: molecules vibrate on a
+lattice as ice, move freely in the lower part of the box as water and
+fill the whole box as steam. The temperature and the share of each phase
+follow the heat added on the heating curve (``heating_curve.py``).
+
+The simulation runs in fixed time steps with vectorized integration.
+Elastic collisions are found with a uniform grid (spatial hash): only
+particles in the same or neighbouring cells are tested, instead of all
+N^2 pairs. The positions, speeds and phases of every video frame are
+written to an array-backed trajectory cache, which the render pass reads
+frame by frame; a second render of the same parameters simulates nothing.
+
+Usage:
+    trajectory = get_trajectory(GasParameters(particles=5000), frame_rate=60)
+    trajectory.positions[frame]   # (particles, 2) in box units
+"""
+
+import hashlib
+import json
+import shutil
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+from manim import config
+
+from heating_curve import PHASE_ENERGIES, get_temperature
+
+SOLID, LIQUID, GAS = 0, 1, 2
+
+ZERO_CELSIUS = 273.15
+
+# Seconds spent in each phase of the heating curve:
+# ice heating, melting, water heating, boiling, steam heating
+PHASE_DURATIONS = [3.0, 5.0, 4.0, 8.0, 4.0]
+
+GasParameters = namedtuple("GasParameters", [
+    "particles",      # number of molecules
+    "width",          # box width in scene units
+    "height",         # box height in scene units
+    "radius",         # molecule radius in scene units
+    "liquid_level",   # top of the water as a share of the box height
+    "sigma",          # speed scale (scene units/s) of the 2D Maxwell-Boltzmann distribution at 100 °C
+    "physics_step",   # longest time step in seconds
+    "seed",
+], defaults=[5000, 5.6, 4.4, 0.015, 0.45, 0.9, 1 / 120, 0])
+
+
+def get_program_times():
+    """Scene times (s) at the start of the curve and the end of each phase."""
+    return np.concatenate([[0.0], np.cumsum(PHASE_DURATIONS)])
+
+
+def get_duration():
+    return float(get_program_times()[-1])
+
+
+def get_energy(t):
+    """Heat (kJ) added after t seconds of the heating program."""
+    return np.interp(t, get_program_times(), [0.0] + PHASE_ENERGIES)
+
+
+def get_phase_shares(energy):
+    """Shares of molten and evaporated molecules after adding energy (kJ)."""
+    e1, e2, e3, e4, _ = PHASE_ENERGIES
+    melted = np.clip((energy - e1) / (e2 - e1), 0, 1)
+    evaporated = np.clip((energy - e3) / (e4 - e3), 0, 1)
+    return melted, evaporated
+
+
+def get_sigma(params, temperature):
+    """Speed scale at temperature (°C); kinetic energy is proportional to kelvin."""
+    return params.sigma * np.sqrt((temperature + ZERO_CELSIUS) / (100 + ZERO_CELSIUS))
+
+
+def create_lattice(params):
+    """Hexagonal ice lattice filling the lower part of the box, top rows first."""
+    area_height = params.liquid_level * params.height * 0.8
+    spacing = np.sqrt(params.width * area_height / params.particles * 2 / np.sqrt(3))
+    columns = int((params.width - 2 * params.radius) / spacing)
+    rows = int(np.ceil(params.particles / columns))
+    row, column = np.divmod(np.arange(params.particles), columns)
+    x = params.radius + spacing * (column + 0.5 * (row % 2) + 0.25)
+    y = params.radius + spacing * np.sqrt(3) / 2 * (rows - 1 - row) + spacing / 2
+    return np.stack([x, y], axis=1), spacing
+
+
+class SpatialHash:
+    """Uniform grid over the box for finding close pairs."""
+
+    # Neighbour cells checked from each cell, so that every pair is found once
+    OFFSETS = [(0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+    def __init__(self, width, height, cell_size):
+        self.cell_size = cell_size
+        self.columns = int(np.ceil(width / cell_size)) + 1
+        self.rows = int(np.ceil(height / cell_size)) + 1
+
+    def find_pairs(self, positions, max_distance):
+        """Index pairs (i, j) of particles closer than max_distance."""
+        cells = np.floor(positions / self.cell_size).astype(int)
+        cells[:, 0] = np.clip(cells[:, 0], 0, self.columns - 1)
+        cells[:, 1] = np.clip(cells[:, 1], 0, self.rows - 1)
+        cell_ids = cells[:, 0] + cells[:, 1] * self.columns
+
+        order = np.argsort(cell_ids, kind="stable")
+        counts = np.bincount(cell_ids, minlength=self.columns * self.rows)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+        firsts, seconds = [], []
+        for dx, dy in self.OFFSETS:
+            x = cells[:, 0] + dx
+            y = cells[:, 1] + dy
+            valid = (x >= 0) & (x < self.columns) & (y < self.rows)
+            particles = np.flatnonzero(valid)
+            neighbours = (x + y * self.columns)[valid]
+            repeat = counts[neighbours]
+            first = np.repeat(particles, repeat)
+            # Position of each candidate within its neighbour cell
+            within = np.arange(len(first)) - np.repeat(np.cumsum(repeat) - repeat, repeat)
+            second = order[np.repeat(starts[neighbours], repeat) + within]
+            if (dx, dy) == (0, 0):
+                keep = first < second
+                first, second = first[keep], second[keep]
+            firsts.append(first)
+            seconds.append(second)
+
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        delta = positions[first] - positions[second]
+        close = np.einsum("ij,ij->i", delta, delta) < max_distance ** 2
+        return first[close], second[close]
+
+
+class GasSimulation:
+    """Fixed-step simulation of the molecules along the heating program."""
+
+    def __init__(self, params):
+        self.params = params
+        self.rng = np.random.default_rng(params.seed)
+        self.sites, spacing = create_lattice(params)
+        self.vibration = 0.12 * spacing
+        self.positions = self.sites.copy()
+        self.velocities = np.zeros_like(self.positions)
+        self.states = np.full(params.particles, SOLID, dtype=np.int8)
+        # Lattice sites melt from the top
+        self.melt_order = np.argsort(-self.sites[:, 1], kind="stable")
+        self.grid = SpatialHash(params.width, params.height, 2 * params.radius)
+        self.time = 0.0
+
+    def get_ceilings(self):
+        ceilings = np.full(self.params.particles, self.params.height)
+        ceilings[self.states != GAS] = self.params.liquid_level * self.params.height
+        return ceilings - self.params.radius
+
+    def sample_velocities(self, count, temperature):
+        return self.rng.normal(0, get_sigma(self.params, temperature), (count, 2))
+
+    def update_phases(self, energy, temperature):
+        melted, evaporated = get_phase_shares(energy)
+        molten = self.melt_order[:int(melted * self.params.particles)]
+        newly_molten = molten[self.states[molten] == SOLID]
+        if len(newly_molten):
+            self.states[newly_molten] = LIQUID
+            self.velocities[newly_molten] = self.sample_velocities(len(newly_molten), temperature)
+
+        missing = int(evaporated * self.params.particles) - np.count_nonzero(self.states == GAS)
+        if missing > 0:
+            # The molecules closest to the surface leave the water first
+            liquid = np.flatnonzero(self.states == LIQUID)
+            surface = liquid[np.argsort(-self.positions[liquid, 1])[:missing]]
+            self.states[surface] = GAS
+
+    def vibrate(self, dt, temperature):
+        """Ornstein-Uhlenbeck motion of the ice molecules around their sites."""
+        solid = self.states == SOLID
+        if not solid.any():
+            return
+        amplitude = self.vibration * np.sqrt((temperature + ZERO_CELSIUS) / ZERO_CELSIUS)
+        rate = 20.0
+        offsets = self.positions[solid] - self.sites[solid]
+        noise = self.rng.normal(0, 1, offsets.shape)
+        offsets += -rate * offsets * dt + amplitude * np.sqrt(2 * rate * dt) * noise
+        self.positions[solid] = self.sites[solid] + offsets
+
+    def collide(self, rounds=4):
+        """
+        Elastic collisions; ice molecules act as fixed obstacles.
+
+        A molecule can touch several others in one step. Each round resolves
+        a set of pairs in which every molecule occurs at most once, which
+        keeps every collision energy-conserving; the remaining pairs are
+        resolved in the following rounds with the updated velocities.
+        """
+        first, second = self.grid.find_pairs(self.positions, 2 * self.params.radius)
+        inverse_mass = (self.states != SOLID).astype(float)
+        movable = inverse_mass[first] + inverse_mass[second] > 0
+        first, second = first[movable], second[movable]
+        delta = self.positions[first] - self.positions[second]
+        distance_squared = np.einsum("ij,ij->i", delta, delta)
+
+        for _ in range(rounds):
+            relative = self.velocities[first] - self.velocities[second]
+            approach = np.einsum("ij,ij->i", relative, delta)
+            pending = np.flatnonzero(approach < 0)
+            if not len(pending):
+                break
+            # Keep the pairs that come first for both of their molecules
+            ranks = np.full(self.params.particles, len(first))
+            np.minimum.at(ranks, first[pending], pending)
+            np.minimum.at(ranks, second[pending], pending)
+            chosen = pending[(ranks[first[pending]] == pending) & (ranks[second[pending]] == pending)]
+
+            i, j = first[chosen], second[chosen]
+            weights = inverse_mass[i] + inverse_mass[j]
+            impulse = (2 * approach[chosen] / (weights * distance_squared[chosen]))[:, None] * delta[chosen]
+            self.velocities[i] -= impulse * inverse_mass[i, None]
+            self.velocities[j] += impulse * inverse_mass[j, None]
+
+        # Push overlapping molecules apart so that dense water does not clump
+        distance = np.sqrt(np.maximum(distance_squared, 1e-12))
+        overlap = (2 * self.params.radius - distance) / distance
+        weights = inverse_mass[first] + inverse_mass[second]
+        shift = (overlap / weights)[:, None] * delta
+        np.add.at(self.positions, first, shift * inverse_mass[first, None])
+        np.add.at(self.positions, second, -shift * inverse_mass[second, None])
+
+    def bounce_walls(self):
+        radius = self.params.radius
+        low = np.array([radius, radius])
+        high = np.stack([np.full(self.params.particles, self.params.width - radius),
+                         self.get_ceilings()], axis=1)
+        below = self.positions < low
+        above = self.positions > high
+        self.positions = np.where(below, 2 * low - self.positions, self.positions)
+        self.positions = np.where(above, 2 * high - self.positions, self.positions)
+        self.velocities[below] = np.abs(self.velocities[below])
+        self.velocities[above] = -np.abs(self.velocities[above])
+        # Reflection is not enough for molecules further out than one step
+        np.clip(self.positions, low, high, out=self.positions)
+
+    def thermostat(self, temperature):
+        """Rescales the mobile molecules to the kinetic energy of the temperature."""
+        mobile = self.states != SOLID
+        if not mobile.any():
+            return
+        mean_square = np.mean(self.velocities[mobile] ** 2)
+        if mean_square > 0:
+            self.velocities[mobile] *= get_sigma(self.params, temperature) / np.sqrt(mean_square)
+
+    def step(self, dt):
+        energy = get_energy(self.time)
+        temperature = get_temperature(energy)
+        self.update_phases(energy, temperature)
+        self.vibrate(dt, temperature)
+        mobile = self.states != SOLID
+        self.positions[mobile] += self.velocities[mobile] * dt
+        self.collide()
+        self.bounce_walls()
+        self.thermostat(temperature)
+        self.time += dt
+
+
+class Trajectory:
+    """Frames of a simulation: positions, speeds and phases per particle, and the program state."""
+
+    ARRAYS = ["positions", "speeds", "states", "times", "energies", "temperatures"]
+
+    def __init__(self, arrays):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+
+    def __len__(self):
+        return len(self.times)
+
+    def get_frame_index(self, t):
+        return min(int(round(t * self.frame_rate)), len(self) - 1)
+
+    @property
+    def frame_rate(self):
+        return (len(self) - 1) / self.times[-1] if len(self) > 1 else 1.0
+
+
+def simulate(params, frame_rate, duration=None):
+    """Runs the simulation and records every frame into arrays."""
+    duration = get_duration() if duration is None else duration
+    num_frames = int(round(duration * frame_rate)) + 1
+    steps_per_frame = max(1, int(np.ceil(1 / (frame_rate * params.physics_step))))
+    dt = 1 / (frame_rate * steps_per_frame)
+
+    simulation = GasSimulation(params)
+    arrays = {
+        "positions": np.empty((num_frames, params.particles, 2), dtype=np.float32),
+        "speeds": np.empty((num_frames, params.particles), dtype=np.float32),
+        "states": np.empty((num_frames, params.particles), dtype=np.int8),
+        "times": np.arange(num_frames) / frame_rate,
+    }
+    for frame in range(num_frames):
+        if frame:
+            for _ in range(steps_per_frame):
+                simulation.step(dt)
+        arrays["positions"][frame] = simulation.positions
+        arrays["speeds"][frame] = np.linalg.norm(simulation.velocities, axis=1)
+        arrays["states"][frame] = simulation.states
+    arrays["energies"] = get_energy(arrays["times"])
+    arrays["temperatures"] = get_temperature(arrays["energies"])
+    return Trajectory(arrays)
+
+
+class TrajectoryCache:
+    """
+    Simulated trajectories as .npy files below the media directory, one
+    directory per parameter set and frame rate. Arrays are memory-mapped,
+    so the render pass only reads the frames it draws.
+    """
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is not None:
+            return Path(self._cache_dir)
+        return Path(config.media_dir) / "gas_cache"
+
+    def get_path(self, params, frame_rate, duration):
+        key = json.dumps([list(params), frame_rate, duration, PHASE_DURATIONS, PHASE_ENERGIES])
+        return self.cache_dir / hashlib.sha1(key.encode()).hexdigest()[:16]
+
+    def get(self, params, frame_rate, duration=None):
+        duration = get_duration() if duration is None else duration
+        path = self.get_path(params, frame_rate, duration)
+        if not path.exists():
+            trajectory = simulate(params, frame_rate, duration)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Own temp directory per process: parallel renders (DE and EN) share the key
+            tmp_path = Path(tempfile.mkdtemp(prefix=f".{path.name}.", dir=path.parent))
+            try:
+                for name in Trajectory.ARRAYS:
+                    np.save(tmp_path / f"{name}.npy", getattr(trajectory, name))
+                tmp_path.replace(path)
+            except OSError:
+                # Another process finished the same trajectory first
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                if not path.exists():
+                    raise
+            return trajectory
+        return Trajectory({name: np.load(path / f"{name}.npy", mmap_mode="r")
+                           for name in Trajectory.ARRAYS})
+
+
+TRAJECTORY_CACHE = TrajectoryCache()
+
+
+def get_trajectory(params=GasParameters(), frame_rate=None):
+    """Trajectory of params at the frame rate of the current render, cached."""
+    return TRAJECTORY_CACHE.get(params, frame_rate or config.frame_rate)
@@ -73,6 +73,23 @@ def get_text(lang="de"):
     return TEXT_DE if lang == "de" else TEXT_EN
 
 
+# =============================================================================
+# PHYSICAL PARAMETERS / PHYSIKALISCHE PARAMETER
+# =============================================================================
+
+# Heat added (kJ, 1 kg water) at the end of each phase:
+# ice heating, melting, water heating, boiling, steam heating
+PHASE_ENERGIES = [41.8, 375.8, 793.8, 3053.8, 3094]
+
+# Temperature (°C) at the start of the curve and at the end of each phase
+PHASE_TEMPERATURES = [-20, 0, 0, 100, 100, 120]
+
+
+def get_temperature(energy):
+    """Temperature (°C) on the heating curve after adding energy (kJ)"""
+    return np.interp(energy, [0] + PHASE_ENERGIES, PHASE_TEMPERATURES)
+
+
 # =============================================================================
 # LAYOUT MANAGER
 # =============================================================================
@@ -264,27 +281,19 @@ class HeatingCurve(Scene):
         self.text = get_text(lang)
         super().__init__(**kwargs)
 
-    def construct(self):
-        # Initialise layout manager
-        lm = LayoutManager()
-
-        # Title
+    def create_title(self, lm):
         title = Text(self.text["heating_curve"], font_size=40, color=WHITE)
         title.to_edge(UP, buff=lm.MARGIN_TOP)
         lm.set_title(title)
+        return title
 
+    def create_axes(self, lm):
+        """Axes in the content area below the title, with their labels"""
         # Calculate content area
         bounds = lm.get_content_bounds()
         content_height = bounds['top'] - bounds['bottom']
         content_width = bounds['right'] - bounds['left']
 
-        # Physical parameters (for 1 kg water)
-        E1 = 41.8      # End ice heating
-        E2 = 375.8     # End melting
-        E3 = 793.8     # End water heating
-        E4 = 3053.8    # End boiling
-        E5 = 3094      # End steam heating
-
         # Axes - centred, slightly lower
         axes_width = content_width * 0.85
         axes_height = content_height * 0.70
@@ -335,6 +344,13 @@ class HeatingCurve(Scene):
         zero_label.next_to(axes.y_axis.n2p(0), LEFT, buff=0.2)
         lm.register(zero_label)
 
+        return VGroup(axes, x_label, y_label, zero_label)
+
+    def create_curve(self, lm, axes):
+        """The five segments of the heating curve, plateaus with colour gradients"""
+        # Physical parameters (for 1 kg water)
+        E1, E2, E3, E4, E5 = PHASE_ENERGIES
+
         # Helper function for colour gradient
         def interpolate_color(color1, color2, t):
             """Interpolates between two colours (t from 0 to 1)"""
@@ -402,16 +418,18 @@ class HeatingCurve(Scene):
             stroke_width=4,
         )
 
-        # Invisible paths for MoveAlongPath animation
-        path2 = axes.plot(lambda Q: 0, x_range=[E1, E2], stroke_opacity=0)
-        path4 = axes.plot(lambda Q: 100, x_range=[E3, E4], stroke_opacity=0)
-
         lm.register(seg1)
         lm.register(seg2)
         lm.register(seg3)
         lm.register(seg4)
         lm.register(seg5)
 
+        return VGroup(seg1, seg2, seg3, seg4, seg5)
+
+    def create_phase_labels(self, lm, axes):
+        """Ice, water and steam next to their parts of the curve"""
+        E1, E2, E3, E4, E5 = PHASE_ENERGIES
+
         # Phase labels - BELOW or BESIDE the curve
         ice_label = Text(self.text["ice"], font_size=14, color=COLORS["ice"])
         ice_pos = axes.c2p(E1/2, -20)
@@ -440,7 +458,13 @@ class HeatingCurve(Scene):
             steam_label.move_to(pos)
         lm.register(steam_label)
 
-        # Heat annotations: brace -> value -> label (from bottom to top)
+        return VGroup(ice_label, water_label, steam_label)
+
+    def create_heat_annotations(self, lm, axes):
+        """Braces with latent heat and name over both plateaus"""
+        E1, E2, E3, E4, E5 = PHASE_ENERGIES
+
+        # Brace -> value -> label (from bottom to top)
         # Melting
         fusion_brace = Brace(Line(axes.c2p(E1, 0), axes.c2p(E2, 0)), UP, color=COLORS["highlight"])
         lm.register(fusion_brace)
@@ -465,6 +489,26 @@ class HeatingCurve(Scene):
         boiling_label.next_to(vapor_text, UP, buff=lm.PADDING_XS)
         lm.register(boiling_label)
 
+        return VGroup(fusion_brace, fusion_text, melting_label,
+                      vapor_brace, vapor_text, boiling_label)
+
+    def construct(self):
+        # Initialise layout manager
+        lm = LayoutManager()
+
+        title = self.create_title(lm)
+        axes, x_label, y_label, zero_label = self.create_axes(lm)
+        seg1, seg2, seg3, seg4, seg5 = self.create_curve(lm, axes)
+
+        # Invisible paths for MoveAlongPath animation
+        E1, E2, E3, E4, E5 = PHASE_ENERGIES
+        path2 = axes.plot(lambda Q: 0, x_range=[E1, E2], stroke_opacity=0)
+        path4 = axes.plot(lambda Q: 100, x_range=[E3, E4], stroke_opacity=0)
+
+        ice_label, water_label, steam_label = self.create_phase_labels(lm, axes)
+        (fusion_brace, fusion_text, melting_label,
+         vapor_brace, vapor_text, boiling_label) = self.create_heat_annotations(lm, axes)
+
         # Animated dot
         dot = Dot(color=COLORS["highlight"], radius=0.08)
         dot.move_to(axes.c2p(0, -20))
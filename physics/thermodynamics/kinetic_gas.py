@@ -0,0 +1,362 @@
+"""
+Kinetic Gas Model / Teilchenmodell von Wasser
+
+Standalone Manim animation showing thousands of water molecules while
+ice is heated to steam along the heating curve: vibrating ice lattice,
+melting, liquid water, boiling and steam filling the whole box. A live
+histogram of the molecule speeds is compared with the Maxwell-Boltzmann
+distribution of the current temperature.
+
+The particle motion is simulated once (gas_simulation.py) and cached
+below media/gas_cache; the render only reads the stored frames.
+
+Usage:
+    manim -qh kinetic_gas.py KineticGasEN  # English 4K
+    manim -qh kinetic_gas.py KineticGasDE  # German 4K
+
+Requirements:
+    - manim (pip install manim)
+    - numpy
+
+Source: https://github.com/Maik-0000FF/science-animations
+License: MIT
+"""
+
+from manim import *
+import numpy as np
+
+import heating_curve
+from heating_curve import COLORS, PHASE_ENERGIES, PHASE_TEMPERATURES, LayoutManager, calc_axis_range
+from gas_simulation import GAS, LIQUID, SOLID, GasParameters, get_duration, get_sigma, get_trajectory
+
+
+# =============================================================================
+# TEXTS / TEXTE
+# =============================================================================
+
+TEXT_DE = {
+    **heating_curve.TEXT_DE,
+    "kinetic_gas": "Teilchenmodell: Erwaermung von Wasser",
+    "particles": "Teilchen",
+    "speed": "Geschwindigkeit",
+    "maxwell_boltzmann": "Maxwell-Boltzmann-Verteilung",
+}
+
+TEXT_EN = {
+    **heating_curve.TEXT_EN,
+    "kinetic_gas": "Particle Model: Heating Water",
+    "particles": "particles",
+    "speed": "Speed",
+    "maxwell_boltzmann": "Maxwell-Boltzmann distribution",
+}
+
+
+def get_text(lang="de"):
+    """Returns texts in selected language / Gibt Texte in gewaehlter Sprache zurueck"""
+    return TEXT_DE if lang == "de" else TEXT_EN
+
+
+# Molecule colour per state / Teilchenfarbe je Zustand
+STATE_COLORS = {
+    SOLID: COLORS["ice"],
+    LIQUID: COLORS["water"],
+    GAS: COLORS["steam"],
+}
+
+
+# =============================================================================
+# PARTICLES / TEILCHEN
+# =============================================================================
+
+class GasParticles(PMobject):
+    """
+    All molecules as one point cloud. ``show_frame`` copies one frame of
+    the trajectory into the point and colour arrays in place.
+    """
+
+    def __init__(self, trajectory, params, **kwargs):
+        pixels = 2 * params.radius * config.pixel_height / config.frame_height
+        kwargs.setdefault("stroke_width", max(1, round(pixels)))
+        super().__init__(**kwargs)
+        self.trajectory = trajectory
+        self.palette = np.array([color_to_rgba(STATE_COLORS[state])
+                                 for state in (SOLID, LIQUID, GAS)])
+        self.origin = np.zeros(3)
+        self.add_points(np.zeros((params.particles, 3)))
+        self.show_frame(0)
+
+    def set_origin(self, point):
+        """Scene position of the lower left corner of the box."""
+        self.origin = np.array(point, dtype=float)
+        return self
+
+    def show_frame(self, frame):
+        self.frame = frame
+        self.points[:, :2] = self.origin[:2] + self.trajectory.positions[frame]
+        self.rgbas[:] = self.palette[self.trajectory.states[frame]]
+        return self
+
+
+class SpeedHistogram(VGroup):
+    """
+    Speed histogram of the moving molecules with the analytic 2D
+    Maxwell-Boltzmann density f(v) = v / sigma^2 * exp(-v^2 / (2 sigma^2)).
+
+    Binning and bar positions are fixed on the given axes. ``update_speeds``
+    counts with ``np.bincount`` from preallocated buffers and rewrites the
+    points of the bars (one VMobject with a subpath per bar) and of the
+    curve in place; nothing is rebuilt per frame.
+    """
+
+    def __init__(self, axes, num_bins, max_speed, num_particles,
+                 bar_color=COLORS["water"], curve_color=COLORS["highlight"], **kwargs):
+        super().__init__(**kwargs)
+        self.num_bins = num_bins
+        self.bin_width = max_speed / num_bins
+        self.origin = axes.c2p(0, 0)
+        self.x_unit = axes.c2p(1, 0)[0] - self.origin[0]
+        self.y_unit = axes.c2p(0, 1)[1] - self.origin[1]
+        self.max_height = axes.y_range[1] * self.y_unit
+
+        # Preallocated buffers: scaled speeds and bin index per molecule
+        self.scaled = np.empty(num_particles)
+        self.indices = np.empty(num_particles, dtype=np.intp)
+
+        # Bar corners BL, BR, TR, TL, BL; only the top ones change
+        edges = self.origin[0] + self.x_unit * self.bin_width * np.arange(num_bins + 1)
+        self.corners = np.zeros((num_bins, 5, 3))
+        self.corners[:, [0, 3, 4], 0] = edges[:-1, None]
+        self.corners[:, [1, 2], 0] = edges[1:, None]
+        self.corners[:, :, 1] = self.origin[1]
+        self.speed_grid = np.linspace(0, max_speed, 120)
+
+        self.bars = VMobject(fill_color=bar_color, fill_opacity=0.6,
+                             stroke_color=bar_color, stroke_width=1)
+        self.curve = VMobject(stroke_color=curve_color, stroke_width=3)
+        self.add(self.bars, self.curve)
+        self.update_speeds(np.zeros(0), np.zeros(0, dtype=bool), 1.0)
+
+    def update_speeds(self, speeds, moving, sigma):
+        """Counts speeds where moving is set, normalized to a density."""
+        count = np.count_nonzero(moving)
+        scaled = self.scaled[:len(speeds)]
+        indices = self.indices[:len(speeds)]
+        np.multiply(speeds, 1 / self.bin_width, out=scaled)
+        np.copyto(indices, scaled, casting="unsafe")
+        # Too fast molecules go to bin num_bins, resting ones to num_bins + 1
+        np.minimum(indices, self.num_bins, out=indices)
+        np.putmask(indices, ~moving, self.num_bins + 1)
+        counts = np.bincount(indices, minlength=self.num_bins + 2)[:self.num_bins]
+
+        density = counts / (max(count, 1) * self.bin_width)
+        heights = np.minimum(density * self.y_unit, self.max_height)
+        self.corners[:, [2, 3], 1] = self.origin[1] + heights[:, None]
+        starts, ends = self.corners[:, :-1], self.corners[:, 1:]
+        # Each edge as a straight cubic Bezier curve
+        handles = [starts, starts + (ends - starts) / 3, starts + 2 * (ends - starts) / 3, ends]
+        self.bars.set_points(np.stack(handles, axis=2).reshape(-1, 3))
+
+        grid = self.speed_grid
+        analytic = grid / sigma ** 2 * np.exp(-grid ** 2 / (2 * sigma ** 2)) if count else 0 * grid
+        curve_points = np.zeros((len(grid), 3))
+        curve_points[:, 0] = self.origin[0] + grid * self.x_unit
+        curve_points[:, 1] = self.origin[1] + np.minimum(analytic * self.y_unit, self.max_height)
+        self.curve.set_points_as_corners(curve_points)
+        return self
+
+
+# =============================================================================
+# KINETIC GAS SCENE
+# =============================================================================
+
+class KineticGas(Scene):
+    PARAMS = GasParameters(particles=5000)
+
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    def construct(self):
+        # Initialise layout manager
+        lm = LayoutManager()
+        params = self.PARAMS
+        trajectory = get_trajectory(params, config.frame_rate)
+
+        # Title
+        title = Text(self.text["kinetic_gas"], font_size=40, color=WHITE)
+        title.to_edge(UP, buff=lm.MARGIN_TOP)
+        lm.set_title(title)
+        bounds = lm.get_content_bounds()
+
+        # Box on the left
+        box = Rectangle(width=params.width, height=params.height,
+                        color=COLORS["axis"], stroke_width=2)
+        box.move_to([bounds['left'] + params.width / 2,
+                     (bounds['top'] + bounds['bottom']) / 2, 0])
+        lm.register(box, zone="box")
+
+        count_label = Text(f"N = {params.particles} {self.text['particles']}",
+                           font_size=14, color=COLORS["grid"])
+        lm.place_relative(count_label, box, DOWN, buff=lm.PADDING_XS, align=LEFT)
+
+        particles = GasParticles(trajectory, params)
+        particles.set_origin(box.get_corner(DL)).show_frame(0)
+
+        # Heating curve on the right
+        right_left = box.get_right()[0] + lm.PADDING_L * 2
+        curve_width = bounds['right'] - right_left
+        x_range, x_numbers = calc_axis_range([0, 1000, 2000, 3000, 4000])
+        y_range, y_numbers = calc_axis_range([-20, 20, 60, 100, 140], step=40)
+        axes = Axes(
+            x_range=x_range,
+            y_range=y_range,
+            x_length=curve_width,
+            y_length=1.8,
+            axis_config={
+                "color": COLORS["axis"],
+                "include_tip": True,
+                "tip_length": lm.AXIS_TIP_LENGTH,
+                "tip_width": lm.AXIS_TIP_WIDTH,
+            },
+            x_axis_config={"numbers_to_include": x_numbers, "font_size": 12},
+            y_axis_config={"numbers_to_include": y_numbers, "font_size": 12},
+        )
+        axes.move_to([right_left + curve_width / 2, bounds['top'] - 1.0, 0])
+        lm.register(axes, zone="graph")
+
+        x_label = Text(f"{self.text['energy']} Q (kJ)", font_size=12, color=WHITE)
+        lm.place_relative(x_label, axes.x_axis, DOWN, buff=lm.PADDING_S)
+        y_label = Text(f"T ({self.text['unit_temp']})", font_size=12, color=WHITE)
+        lm.place_relative(y_label, axes.y_axis, UP, buff=lm.PADDING_XS)
+
+        curve = axes.plot_line_graph(
+            x_values=[0] + PHASE_ENERGIES,
+            y_values=PHASE_TEMPERATURES,
+            add_vertex_dots=False,
+            stroke_width=3,
+        )
+        curve["line_graph"].set_stroke(color=[COLORS["ice"], COLORS["water"], COLORS["heat"]])
+        dot = Dot(axes.c2p(0, PHASE_TEMPERATURES[0]), color=COLORS["highlight"], radius=0.07)
+
+        # Readouts below the curve
+        temperature = DecimalNumber(PHASE_TEMPERATURES[0], num_decimal_places=0,
+                                    font_size=28, color=COLORS["highlight"])
+        temperature_label = Text(self.text["temperature"] + ":", font_size=18, color=WHITE)
+        unit = Text(self.text["unit_temp"], font_size=20, color=COLORS["highlight"])
+        readout = VGroup(temperature_label, temperature, unit).arrange(RIGHT, buff=lm.PADDING_S)
+        readout.next_to(x_label, DOWN, buff=lm.PADDING_M)
+        readout.align_to(axes, LEFT)
+        lm.register(readout)
+
+        phase_names = [self.text["ice"], self.text["melting"], self.text["water"],
+                       self.text["boiling"], self.text["steam"]]
+        phase_colors = [COLORS["ice"], COLORS["highlight"], COLORS["water"],
+                        COLORS["highlight"], COLORS["steam"]]
+        phase_labels = [Text(name, font_size=22, color=color)
+                        for name, color in zip(phase_names, phase_colors)]
+        phase_label = phase_labels[0].copy()
+        lm.place_relative(phase_label, readout, RIGHT, buff=lm.PADDING_L)
+        for label in phase_labels:
+            label.move_to(phase_label, aligned_edge=LEFT)
+
+        # Speed histogram below
+        speed_range, speed_numbers = calc_axis_range([0, 1, 2, 3, 4])
+        density_range, density_numbers = calc_axis_range([0, 0.4, 0.8, 1.2])
+        histogram_top = readout.get_bottom()[1] - lm.PADDING_L
+        histogram_height = histogram_top - bounds['bottom'] - 0.6
+        histogram_axes = Axes(
+            x_range=speed_range,
+            y_range=density_range,
+            x_length=curve_width,
+            y_length=histogram_height,
+            axis_config={
+                "color": COLORS["axis"],
+                "include_tip": True,
+                "tip_length": lm.AXIS_TIP_LENGTH,
+                "tip_width": lm.AXIS_TIP_WIDTH,
+            },
+            x_axis_config={"numbers_to_include": speed_numbers, "font_size": 12},
+            y_axis_config={"numbers_to_include": density_numbers, "font_size": 12},
+        )
+        histogram_axes.move_to([right_left + curve_width / 2,
+                                histogram_top - histogram_height / 2, 0])
+        lm.register(histogram_axes, zone="histogram")
+
+        speed_label = Text(f"{self.text['speed']} v", font_size=12, color=WHITE)
+        lm.place_relative(speed_label, histogram_axes.x_axis, DOWN, buff=lm.PADDING_S)
+        density_label = Text(self.text["maxwell_boltzmann"], font_size=12,
+                             color=COLORS["highlight"])
+        lm.place_relative(density_label, histogram_axes.y_axis, UP, buff=lm.PADDING_XS)
+        density_label.align_to(histogram_axes, LEFT)
+
+        histogram = SpeedHistogram(histogram_axes, num_bins=32, max_speed=speed_range[1],
+                                   num_particles=params.particles)
+
+        # Animation
+        self.play(Write(title), run_time=1)
+        self.play(Create(box), Create(axes), Write(x_label), Write(y_label),
+                  Create(histogram_axes), Write(speed_label), Write(density_label),
+                  FadeIn(count_label), run_time=2)
+        self.play(FadeIn(particles), Create(curve), FadeIn(dot),
+                  FadeIn(readout), FadeIn(phase_label), run_time=1)
+
+        # One clock drives everything. Updaters run in the order of self.mobjects,
+        # so it goes in front of the particles, dot and readouts that read it
+        clock = ValueTracker(0)
+        clock.add_updater(lambda mob, dt: mob.increment_value(dt))
+        self.bring_to_back(clock)
+
+        def update_particles(mob):
+            mob.show_frame(trajectory.get_frame_index(clock.get_value()))
+
+        def update_dot(mob):
+            frame = particles.frame
+            mob.move_to(axes.c2p(trajectory.energies[frame], trajectory.temperatures[frame]))
+
+        def update_temperature(mob):
+            mob.set_value(trajectory.temperatures[particles.frame])
+
+        phase = [0]
+
+        def update_phase(mob):
+            energy = trajectory.energies[particles.frame]
+            index = min(int(np.searchsorted(PHASE_ENERGIES, energy)), len(phase_labels) - 1)
+            if index != phase[0]:
+                phase[0] = index
+                mob.become(phase_labels[index])
+
+        particles.add_updater(update_particles)
+        dot.add_updater(update_dot)
+        temperature.add_updater(update_temperature)
+        phase_label.add_updater(update_phase)
+
+        def update_histogram(mob):
+            frame = particles.frame
+            mob.update_speeds(trajectory.speeds[frame], trajectory.states[frame] != SOLID,
+                              get_sigma(params, trajectory.temperatures[frame]))
+
+        self.add(histogram)
+        histogram.add_updater(update_histogram)
+
+        self.wait(get_duration())
+
+        for mob in (clock, particles, dot, temperature, phase_label, histogram):
+            mob.clear_updaters()
+        self.wait(1)
+
+        self.play(FadeOut(VGroup(title, box, count_label, axes, x_label, y_label,
+                                 curve, dot, readout, phase_label, histogram_axes,
+                                 speed_label, density_label, histogram)),
+                  FadeOut(particles), run_time=1.5)
+        self.wait(0.5)
+
+
+class KineticGasDE(KineticGas):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class KineticGasEN(KineticGas):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
@@ -0,0 +1,403 @@
+"""
+Phase Diagram of Water / Phasendiagramm von Wasser
+
+Standalone Manim animation of the pressure-temperature diagram of water:
+regions of ice, liquid water and steam, the coexistence curves between
+them, the triple point and the critical point. A state point then heats
+ice at normal pressure and finally goes around the critical point.
+
+The coexistence curves are evaluated once on dense grids (sublimation and
+melting by Clausius-Clapeyron, vaporization by the Antoine equation) and
+kept as read-only arrays; each curve is drawn as a single polyline.
+
+Usage:
+    manim -qh phase_diagram.py PhaseDiagramEN  # English 4K
+    manim -qh phase_diagram.py PhaseDiagramDE  # German 4K
+
+Requirements:
+    - manim (pip install manim)
+    - numpy
+
+Source: https://github.com/Maik-0000FF/science-animations
+License: MIT
+"""
+
+from functools import lru_cache
+
+from manim import *
+import numpy as np
+
+import heating_curve
+from heating_curve import COLORS, LayoutManager, calc_axis_range
+
+
+# =============================================================================
+# TEXTS / TEXTE
+# =============================================================================
+
+TEXT_DE = {
+    **heating_curve.TEXT_DE,
+    "phase_diagram": "Phasendiagramm von Wasser",
+    "pressure": "Druck",
+    "supercritical": "ueberkritisch",
+    "triple_point": "Tripelpunkt",
+    "critical_point": "Kritischer Punkt",
+}
+
+TEXT_EN = {
+    **heating_curve.TEXT_EN,
+    "phase_diagram": "Phase Diagram of Water",
+    "pressure": "Pressure",
+    "supercritical": "supercritical",
+    "triple_point": "Triple point",
+    "critical_point": "Critical point",
+}
+
+
+def get_text(lang="de"):
+    """Returns texts in selected language / Gibt Texte in gewaehlter Sprache zurueck"""
+    return TEXT_DE if lang == "de" else TEXT_EN
+
+
+# =============================================================================
+# PHYSICAL PARAMETERS / PHYSIKALISCHE PARAMETER
+# =============================================================================
+
+GAS_CONSTANT = 8.314          # J/(mol K)
+ZERO_CELSIUS = 273.15         # K
+
+TRIPLE_POINT = (273.16, 611.657)      # K, Pa
+CRITICAL_POINT = (647.096, 22.064e6)  # K, Pa
+
+SUBLIMATION_HEAT = 51.06e3    # J/mol
+FUSION_HEAT = 333.55e3        # J/kg
+FUSION_VOLUME = 1 / 999.8 - 1 / 916.7  # m^3/kg, negative: ice is less dense than water
+
+# Antoine coefficients (mmHg, °C) below and above the normal boiling point
+ANTOINE_LOW = (8.07131, 1730.63, 233.426)
+ANTOINE_HIGH = (8.14019, 1810.94, 244.485)
+ANTOINE_BLEND = (90, 110)     # °C range in which both sets are blended
+MMHG = 133.322                # Pa
+
+# Pressure range of the diagram (Pa), as powers of ten
+PRESSURE_EXPONENTS = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+
+# Phases / Phasen
+SOLID, LIQUID, GAS, SUPERCRITICAL = 0, 1, 2, 3
+
+
+def sublimation_pressure(temperature):
+    """Clausius-Clapeyron with constant heat of sublimation, through the triple point."""
+    t_triple, p_triple = TRIPLE_POINT
+    return p_triple * np.exp(-SUBLIMATION_HEAT / GAS_CONSTANT
+                             * (1 / np.asarray(temperature) - 1 / t_triple))
+
+
+def sublimation_temperature(pressure):
+    """Inverse of ``sublimation_pressure``."""
+    t_triple, p_triple = TRIPLE_POINT
+    return 1 / (1 / t_triple - GAS_CONSTANT / SUBLIMATION_HEAT * np.log(pressure / p_triple))
+
+
+def melting_temperature(pressure):
+    """Clausius-Clapeyron dp/dT = L / (T dv), integrated from the triple point."""
+    t_triple, p_triple = TRIPLE_POINT
+    return t_triple * np.exp((np.asarray(pressure) - p_triple) * FUSION_VOLUME / FUSION_HEAT)
+
+
+def antoine_log_pressure(temperature, coefficients):
+    """ln(p / Pa) from one set of Antoine coefficients."""
+    a, b, c = coefficients
+    return (a - b / (temperature - ZERO_CELSIUS + c)) * np.log(10) + np.log(MMHG)
+
+
+def vaporization_pressure(temperature):
+    """
+    Antoine equation, blended smoothly between the low and high temperature
+    sets and corrected linearly in T so that it meets the triple point and
+    the critical point exactly.
+    """
+    temperature = np.asarray(temperature, dtype=float)
+    start, end = np.array(ANTOINE_BLEND) + ZERO_CELSIUS
+    weight = np.clip((temperature - start) / (end - start), 0, 1)
+    weight = weight * weight * (3 - 2 * weight)
+    log_pressure = ((1 - weight) * antoine_log_pressure(temperature, ANTOINE_LOW)
+                    + weight * antoine_log_pressure(temperature, ANTOINE_HIGH))
+
+    (t_triple, p_triple), (t_critical, p_critical) = TRIPLE_POINT, CRITICAL_POINT
+    correction = np.interp(temperature, [t_triple, t_critical], [
+        np.log(p_triple) - antoine_log_pressure(t_triple, ANTOINE_LOW),
+        np.log(p_critical) - antoine_log_pressure(t_critical, ANTOINE_HIGH),
+    ])
+    return np.exp(log_pressure + correction)
+
+
+def get_phase(temperature, pressure):
+    """Phase (SOLID, LIQUID, GAS or SUPERCRITICAL) at each (T, p)."""
+    temperature = np.asarray(temperature, dtype=float)
+    pressure = np.asarray(pressure, dtype=float)
+    (t_triple, p_triple), (t_critical, p_critical) = TRIPLE_POINT, CRITICAL_POINT
+    solid = np.where(pressure < p_triple,
+                     pressure > sublimation_pressure(temperature),
+                     temperature < melting_temperature(pressure))
+    liquid = (temperature < t_critical) & (pressure > vaporization_pressure(temperature))
+    supercritical = (temperature >= t_critical) & (pressure >= p_critical)
+    return np.select([solid, supercritical, liquid], [SOLID, SUPERCRITICAL, LIQUID], GAS)
+
+
+@lru_cache(maxsize=None)
+def get_coexistence_curves(samples=2000):
+    """
+    Temperatures and pressures of the sublimation, melting and vaporization
+    curves within the pressure range of the diagram, each as a (samples, 2)
+    array. Computed once per sample count; the arrays are read-only.
+    """
+    (t_triple, p_triple), t_critical = TRIPLE_POINT, CRITICAL_POINT[0]
+    p_min, p_max = 10.0 ** PRESSURE_EXPONENTS[0], 10.0 ** PRESSURE_EXPONENTS[-1]
+
+    # Sample evenly in the plotted coordinates: 1/T resp. log p
+    sublimation_t = 1 / np.linspace(1 / sublimation_temperature(p_min), 1 / t_triple, samples)
+    melting_p = np.geomspace(p_triple, p_max, samples)
+    vaporization_t = np.linspace(t_triple, t_critical, samples)
+
+    curves = {
+        "sublimation": np.column_stack([sublimation_t, sublimation_pressure(sublimation_t)]),
+        "melting": np.column_stack([melting_temperature(melting_p), melting_p]),
+        "vaporization": np.column_stack([vaporization_t, vaporization_pressure(vaporization_t)]),
+    }
+    for curve in curves.values():
+        curve.setflags(write=False)
+    return curves
+
+
+# State point path: (T in K, p in Pa, duration of the leg to it in s)
+STATE_PATH = [
+    (230, 101325, 0),
+    (500, 101325, 6),       # heat ice at normal pressure: melting, boiling
+    (720, 101325, 2),
+    (720, 5e7, 2.5),        # compress the hot steam above the critical pressure
+    (450, 5e7, 3),          # cool down: liquid without boiling
+    (450, 101325, 2.5),     # expand: boils at 450 K
+]
+
+
+def get_state_path(path=STATE_PATH, frame_rate=60):
+    """
+    Times, temperatures, pressures and phases of the state point for every
+    frame. Legs are straight lines in (T, log p), as on the diagram.
+    """
+    temperatures, pressures, durations = np.array(path, dtype=float).T
+    leg_times = np.cumsum(durations)
+    times = np.arange(0, leg_times[-1] + 1 / frame_rate, 1 / frame_rate)
+    temperature = np.interp(times, leg_times, temperatures)
+    pressure = np.exp(np.interp(times, leg_times, np.log(pressures)))
+    return times, temperature, pressure, get_phase(temperature, pressure)
+
+
+# =============================================================================
+# PHASE DIAGRAM SCENE
+# =============================================================================
+
+class PhaseDiagram(Scene):
+    def __init__(self, lang="de", **kwargs):
+        self.lang = lang
+        self.text = get_text(lang)
+        super().__init__(**kwargs)
+
+    def construct(self):
+        # Initialise layout manager
+        lm = LayoutManager()
+
+        # Title
+        title = Text(self.text["phase_diagram"], font_size=40, color=WHITE)
+        title.to_edge(UP, buff=lm.MARGIN_TOP)
+        lm.set_title(title)
+        bounds = lm.get_content_bounds()
+        content_height = bounds['top'] - bounds['bottom']
+        content_width = bounds['right'] - bounds['left']
+
+        # Axes: temperature in K (linear), pressure in Pa (logarithmic)
+        axes_width = content_width * 0.68
+        axes_height = content_height * 0.82
+        x_range, x_numbers = calc_axis_range([100, 200, 300, 400, 500, 600, 700, 800])
+        y_range, _ = calc_axis_range(PRESSURE_EXPONENTS)
+        axes = Axes(
+            x_range=x_range,
+            y_range=y_range,
+            x_length=axes_width,
+            y_length=axes_height,
+            axis_config={
+                "color": COLORS["axis"],
+                "include_tip": True,
+                "tip_length": lm.AXIS_TIP_LENGTH,
+                "tip_width": lm.AXIS_TIP_WIDTH,
+            },
+            x_axis_config={"numbers_to_include": x_numbers, "font_size": 14},
+            y_axis_config={"scaling": LogBase(custom_labels=True), "font_size": 14},
+        )
+        axes.move_to([bounds['left'] + 0.6 + axes_width / 2,
+                      bounds['bottom'] + 0.3 + axes_height / 2, 0])
+        lm.register(axes, zone="graph")
+
+        x_label = Text(f"{self.text['temperature']} T (K)", font_size=16, color=WHITE)
+        lm.place_relative(x_label, axes.x_axis, DOWN, buff=lm.PADDING_S)
+        y_label = Text(f"{self.text['pressure']} p (Pa)", font_size=16, color=WHITE)
+        y_label.rotate(90 * DEGREES)
+        lm.place_relative(y_label, axes.y_axis, LEFT, buff=lm.PADDING_S)
+
+        # Coexistence curves, one polyline each
+        curves = get_coexistence_curves()
+        # c2p of (N, 2) rows gives (N, 3) points; separate x and y arrays would give (3, N)
+        curve_points = {name: axes.c2p(curve) for name, curve in curves.items()}
+        curve_colors = {
+            "sublimation": [COLORS["ice"], COLORS["steam"]],
+            "melting": [COLORS["ice"], COLORS["water"]],
+            "vaporization": [COLORS["water"], COLORS["steam"]],
+        }
+        lines = VGroup()
+        for name, points in curve_points.items():
+            line = VMobject(stroke_width=4).set_points_as_corners(points)
+            line.set_stroke(color=curve_colors[name])
+            lines.add(line)
+
+        # Regions, bounded by the curves and the axes
+        (t_min, t_max), (p_min, p_max) = x_range[:2], [10.0 ** y_range[0], 10.0 ** y_range[1]]
+        t_critical, p_critical = CRITICAL_POINT
+        sublimation, melting, vaporization = (curve_points[name] for name in
+                                              ("sublimation", "melting", "vaporization"))
+        melting_top = melting[-1]
+        corner = axes.c2p
+
+        def region(*parts, color):
+            points = np.vstack([np.atleast_2d(part) for part in parts])
+            return VMobject(fill_color=color, fill_opacity=0.18, stroke_width=0).set_points_as_corners(
+                np.vstack([points, points[:1]]))
+
+        regions = VGroup(
+            region(corner(t_min, p_min), sublimation, melting, corner(t_min, p_max),
+                   color=COLORS["ice"]),
+            region(vaporization, corner(t_critical, p_max), melting_top, melting[::-1],
+                   color=COLORS["water"]),
+            region(sublimation, vaporization, corner(t_max, p_critical), corner(t_max, p_min),
+                   color=COLORS["steam"]),
+            region(corner(t_critical, p_critical), corner(t_max, p_critical),
+                   corner(t_max, p_max), corner(t_critical, p_max),
+                   color=COLORS["heat"]),
+        )
+
+        region_labels = VGroup(
+            Text(self.text["ice"], font_size=20, color=COLORS["ice"]).move_to(corner(220, 1e6)),
+            Text(self.text["water"], font_size=20, color=COLORS["water"]).move_to(corner(430, 3e6)),
+            Text(self.text["steam"], font_size=20, color=COLORS["steam"]).move_to(corner(520, 1e2)),
+            Text(self.text["supercritical"], font_size=14, color=COLORS["heat"]).move_to(
+                corner((t_critical + t_max) / 2, 10 ** 7.4)),
+        )
+        for label in region_labels:
+            lm.register(label)
+
+        # Triple and critical point
+        triple_dot = Dot(corner(*TRIPLE_POINT), color=WHITE, radius=0.06)
+        critical_dot = Dot(corner(*CRITICAL_POINT), color=WHITE, radius=0.06)
+        triple_label = Text(self.text["triple_point"], font_size=13, color=WHITE)
+        triple_label.next_to(triple_dot, DR, buff=lm.PADDING_XS)
+        critical_label = Text(self.text["critical_point"], font_size=13, color=WHITE)
+        critical_label.next_to(critical_dot, DR, buff=lm.PADDING_XS)
+        lm.register(triple_label)
+        lm.register(critical_label)
+
+        # Readouts on the right
+        readout_left = axes.get_right()[0] + lm.PADDING_L
+        phase_names = [self.text["ice"], self.text["water"], self.text["steam"],
+                       self.text["supercritical"]]
+        phase_colors = [COLORS["ice"], COLORS["water"], COLORS["steam"], COLORS["heat"]]
+        phase_labels = [Text(name, font_size=24, color=color)
+                        for name, color in zip(phase_names, phase_colors)]
+
+        temperature = DecimalNumber(STATE_PATH[0][0], num_decimal_places=0,
+                                    font_size=28, color=COLORS["highlight"])
+        pressure = DecimalNumber(STATE_PATH[0][1] / 1000, num_decimal_places=1,
+                                 font_size=28, color=COLORS["highlight"])
+        temperature_row = VGroup(Text("T =", font_size=20, color=WHITE), temperature,
+                                 Text("K", font_size=20, color=COLORS["highlight"]))
+        pressure_row = VGroup(Text("p =", font_size=20, color=WHITE), pressure,
+                              Text("kPa", font_size=20, color=COLORS["highlight"]))
+        for row in (temperature_row, pressure_row):
+            row.arrange(RIGHT, buff=lm.PADDING_S)
+        readout = VGroup(temperature_row, pressure_row).arrange(DOWN, buff=lm.PADDING_M,
+                                                                aligned_edge=LEFT)
+        readout.move_to([readout_left, axes.get_center()[1], 0], aligned_edge=LEFT)
+        lm.register(readout, zone="readout")
+
+        phase_label = phase_labels[SOLID].copy()
+        lm.place_relative(phase_label, readout, UP, buff=lm.PADDING_L, align=LEFT)
+        for label in phase_labels:
+            label.move_to(phase_label, aligned_edge=LEFT)
+
+        # State point path, precomputed per frame
+        times, path_temperatures, path_pressures, path_phases = get_state_path(
+            frame_rate=config.frame_rate)
+        path_points = axes.c2p(np.column_stack([path_temperatures, path_pressures]))
+        way = DashedVMobject(
+            VMobject().set_points_as_corners(corner([[t, p] for t, p, _ in STATE_PATH])),
+            num_dashes=60,
+        ).set_stroke(COLORS["highlight"], width=1.5, opacity=0.6)
+        dot = Dot(path_points[0], color=COLORS["highlight"], radius=0.08)
+
+        # Animation
+        self.play(Write(title), run_time=1)
+        self.play(Create(axes), Write(x_label), Write(y_label), run_time=2)
+        self.play(FadeIn(regions), run_time=1)
+        self.play(Create(lines), run_time=3)
+        self.play(FadeIn(region_labels), run_time=1)
+        self.play(FadeIn(triple_dot, scale=0.5), Write(triple_label), run_time=1)
+        self.play(FadeIn(critical_dot, scale=0.5), Write(critical_label), run_time=1)
+        self.wait(1)
+
+        self.play(Create(way), FadeIn(dot), FadeIn(readout), FadeIn(phase_label), run_time=1.5)
+
+        # One clock drives the state point and the readouts
+        clock = ValueTracker(0)
+        clock.add_updater(lambda mob, dt: mob.increment_value(dt))
+        # Updaters run in the order of self.mobjects: the clock has to tick first
+        self.bring_to_back(clock)
+        frame = [0]
+
+        def update_dot(mob):
+            frame[0] = min(int(np.searchsorted(times, clock.get_value())), len(times) - 1)
+            mob.move_to(path_points[frame[0]])
+
+        def update_temperature(mob):
+            mob.set_value(path_temperatures[frame[0]])
+
+        def update_pressure(mob):
+            mob.set_value(path_pressures[frame[0]] / 1000)
+
+        phase = [SOLID]
+
+        def update_phase(mob):
+            if path_phases[frame[0]] != phase[0]:
+                phase[0] = path_phases[frame[0]]
+                mob.become(phase_labels[phase[0]])
+
+        dot.add_updater(update_dot)
+        temperature.add_updater(update_temperature)
+        pressure.add_updater(update_pressure)
+        phase_label.add_updater(update_phase)
+        self.wait(times[-1])
+
+        for mob in (clock, dot, temperature, pressure, phase_label):
+            mob.clear_updaters()
+        self.wait(1.5)
+
+        self.play(FadeOut(Group(*self.mobjects)), run_time=1.5)
+        self.wait(0.5)
+
+
+class PhaseDiagramDE(PhaseDiagram):
+    def __init__(self, **kwargs):
+        super().__init__(lang="de", **kwargs)
+
+
+class PhaseDiagramEN(PhaseDiagram):
+    def __init__(self, **kwargs):
+        super().__init__(lang="en", **kwargs)
@@ -0,0 +1,6 @@
+"""
+Render tooling for the science animations / Render-Werkzeuge
+
+Runs the animation scripts outside of ``manim render`` with optimized
+render pipelines. Use ``python -m render --help`` from the repository root.
+"""
@@ -0,0 +1,348 @@
+"""
+Command line interface / Kommandozeile
+
+Usage:
+    python -m render scene chemistry/elements/026_iron_atom.py IronAtomDE -q l
+    python -m render scene physics/thermodynamics/heating_curve.py HeatingCurveEN --pipeline threaded
+    python -m render batch chemistry/elements -q h --jobs 8 --memory-budget 24G
+    python -m render enqueue /shared/queue.db -q k
+    python -m render work /shared/queue.db /shared/videos --processes 4
+    python -m render store --prune 20G
+    python -m render footprint chemistry/elements --top 20
+    python -m render benchmark --tolerance 0.2
+    python -m render golden --jobs 8
+    python -m render still chemistry/elements/026_iron_atom.py IronAtomEN -t -2.5 -o iron.png
+    python -m render thumbnails chemistry/elements --size 640x360
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .batch import get_worker_env, parse_memory_size, run_batch
+from .benchmark import BASELINE_PATH, load_baseline, run_benchmark, save_baseline
+from .catalog import find_scenes, load_scene_class
+from .footprint import format_report, measure_scene
+from .golden import GOLDEN_DIR, check_scenes
+from .jobqueue import JobQueue, run_worker, start_local_workers
+from .manifest import RenderManifest
+from .runner import PIPELINES, load_project_config, render_scene
+from .profiling import PROFILE_ENV
+from .still import parse_resolution, render_still
+from .store import SEGMENT_STORE
+
+
+def add_render_arguments(parser):
+    parser.add_argument("-q", "--quality", choices=["l", "m", "h", "p", "k"],
+                        help="manim quality flag (default: manim.cfg settings)")
+    parser.add_argument("--pipeline", choices=sorted(PIPELINES), default="sync",
+                        help="renderer used for the frames (default: sync)")
+    parser.add_argument("--ring-size", type=int, default=3,
+                        help="frame buffers of the threaded pipeline (default: 3)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="write a Chrome trace of the render phases per scene to DIR")
+
+
+def get_renderer_options(args):
+    if args.pipeline == "threaded":
+        return {"ring_size": args.ring_size}
+    return {}
+
+
+def command_scene(args):
+    config_overrides = {}
+    if args.disable_caching:
+        config_overrides["disable_caching"] = True
+    if args.media_dir:
+        config_overrides["media_dir"] = args.media_dir
+    render_scene(
+        args.file, args.scene,
+        quality=args.quality,
+        pipeline=args.pipeline,
+        renderer_options=get_renderer_options(args),
+        config_overrides=config_overrides,
+    )
+
+
+def command_batch(args):
+    jobs = select_scenes(args)
+
+    def report(batch_job):
+        state = "ok" if batch_job.returncode == 0 else f"failed ({batch_job.returncode})"
+        print(f"{batch_job.job.scene_name}: {state}, {batch_job.seconds:.1f} s "
+              f"(predicted {batch_job.predicted_seconds:.1f} s), "
+              f"{batch_job.peak_rss / 1024 ** 2:.0f} MB peak")
+
+    finished = run_batch(
+        jobs,
+        quality=args.quality,
+        pipeline=args.pipeline,
+        workers=args.jobs,
+        memory_budget=args.memory_budget,
+        on_finished=report,
+        manifest=None if args.no_resume else RenderManifest(),
+        verify=args.verify,
+        ring_size=args.ring_size,
+    )
+    return 1 if any(batch_job.returncode for batch_job in finished) else 0
+
+
+def select_scenes(args):
+    jobs = find_scenes(args.paths)
+    if args.scene:
+        jobs = [job for job in jobs if job.scene_name in args.scene]
+    return jobs
+
+
+def command_enqueue(args):
+    queue = JobQueue(args.queue)
+    added = queue.enqueue(select_scenes(args), args.quality)
+    print(f"{added} jobs added, queue: {queue.counts()}")
+    queue.close()
+
+
+def command_work(args):
+    if args.processes > 1:
+        workers = start_local_workers(args.processes, args.queue, args.output,
+                                      args.pipeline, args.lease, args.ring_size)
+        return max(worker.wait() for worker in workers)
+
+    def report(row, succeeded):
+        print(f"{row['scene']} ({row['quality'] or 'default'}): "
+              f"{'done' if succeeded else 'not completed'}")
+
+    run_worker(args.queue, args.output, pipeline=args.pipeline,
+               lease_seconds=args.lease, wait=args.wait, on_job=report,
+               ring_size=args.ring_size)
+    return 0
+
+
+def command_status(args):
+    queue = JobQueue(args.queue)
+    for state, count in sorted(queue.counts().items()):
+        print(f"{state}: {count}")
+    for row in queue.connection.execute("SELECT * FROM jobs WHERE state = 'failed'"):
+        print(f"failed: {row['scene']} ({row['quality'] or 'default'}): {row['error']}")
+    queue.close()
+
+
+def command_store(args):
+    if args.prune is not None:
+        removed = SEGMENT_STORE.prune(args.prune)
+        print(f"{removed} segments removed")
+    segments = sum(1 for _ in SEGMENT_STORE.iter_segments())
+    print(f"{SEGMENT_STORE.root}: {segments} segments, "
+          f"{SEGMENT_STORE.get_size() / 1024 ** 2:.0f} MB")
+
+
+def command_footprint(args):
+    recorders = []
+    failed = False
+    for job in select_scenes(args):
+        try:
+            recorders.append(measure_scene(job, args.quality))
+        except Exception as error:
+            print(f"{job.scene_name}: {error}")
+            failed = True
+    print(format_report(recorders, args.top))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as report:
+            json.dump([recorder.to_dict() for recorder in recorders], report, indent=1)
+    return 1 if failed else 0
+
+
+def command_benchmark(args):
+    baseline = load_baseline(args.baseline)
+    failed = run_benchmark(baseline, tolerance=args.tolerance, repeat=args.repeat,
+                           update=args.update_baseline)
+    if args.update_baseline:
+        save_baseline(baseline, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    print(f"{failed} of {len(baseline['scenes'])} scenes regressed or have no baseline")
+    return 1 if failed else 0
+
+
+def command_golden(args):
+    problems = 0
+    for job, status, drifted in check_scenes(select_scenes(args), args.golden,
+                                             args.update, args.quality, args.jobs):
+        print(f"{job.scene_name}: {status}")
+        for seconds, distance, similarity in drifted:
+            if seconds is None:
+                print("  sample times differ from the golden set, run with --update")
+            else:
+                print(f"  t={seconds:.2f} s: hash distance {distance}, SSIM {similarity:.3f}")
+        if status not in ("ok", "updated"):
+            problems += 1
+    return 1 if problems else 0
+
+
+def command_still(args):
+    scene_cls = load_scene_class(args.file, args.scene)
+    output = args.output or f"{args.scene}.png"
+    render_still(scene_cls, args.time, parse_resolution(args.size), output)
+    print(output)
+
+
+def command_thumbnails(args):
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def render_thumbnail(job):
+        command = [sys.executable, "-m", "render", "still", str(job.file_path), job.scene_name,
+                   "-t", str(args.time), "--size", args.size,
+                   "-o", str(output_dir / f"{job.scene_name}.png")]
+        result = subprocess.run(command, env=get_worker_env(), capture_output=True)
+        return job, result.returncode
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=args.jobs or os.cpu_count()) as executor:
+        for job, returncode in executor.map(render_thumbnail, select_scenes(args)):
+            print(f"{job.scene_name}: {'ok' if returncode == 0 else 'failed'}")
+            failed += returncode != 0
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scene_parser = commands.add_parser("scene", help="render a single scene")
+    scene_parser.add_argument("file", help="path of the scene script")
+    scene_parser.add_argument("scene", help="name of the scene class")
+    scene_parser.add_argument("--disable-caching", action="store_true",
+                              help="render every animation, ignoring cached partial movies")
+    scene_parser.add_argument("--media-dir", help="output directory instead of ./media")
+    add_render_arguments(scene_parser)
+    scene_parser.set_defaults(func=command_scene)
+
+    batch_parser = commands.add_parser("batch", help="render many scenes in parallel")
+    batch_parser.add_argument("paths", nargs="*",
+                              help="scripts or directories (default: all scenes)")
+    batch_parser.add_argument("--scene", action="append",
+                              help="only render this scene class (repeatable)")
+    batch_parser.add_argument("-j", "--jobs", type=int,
+                              help="parallel worker processes (default: CPU count)")
+    batch_parser.add_argument("--memory-budget", type=parse_memory_size,
+                              help="predicted peak memory of all workers, e.g. 16G "
+                                   "(default: 80%% of RAM)")
+    batch_parser.add_argument("--no-resume", action="store_true",
+                              help="render every scene, even if recorded as complete")
+    batch_parser.add_argument("--verify", action="store_true",
+                              help="check the SHA-256 of completed movies before skipping them")
+    add_render_arguments(batch_parser)
+    batch_parser.set_defaults(func=command_batch)
+
+    enqueue_parser = commands.add_parser("enqueue", help="add scenes to a render queue")
+    enqueue_parser.add_argument("queue", help="path of the SQLite queue database")
+    enqueue_parser.add_argument("paths", nargs="*",
+                                help="scripts or directories (default: all scenes)")
+    enqueue_parser.add_argument("--scene", action="append",
+                                help="only enqueue this scene class (repeatable)")
+    enqueue_parser.add_argument("-q", "--quality", choices=["l", "m", "h", "p", "k"],
+                                help="manim quality flag (default: manim.cfg settings)")
+    enqueue_parser.set_defaults(func=command_enqueue)
+
+    work_parser = commands.add_parser("work", help="render jobs of a render queue")
+    work_parser.add_argument("queue", help="path of the SQLite queue database")
+    work_parser.add_argument("output", help="shared directory the movies are published to")
+    work_parser.add_argument("--processes", type=int, default=1,
+                             help="local worker processes (default: 1)")
+    work_parser.add_argument("--lease", type=float, default=60,
+                             help="lease duration in seconds, renewed while rendering")
+    work_parser.add_argument("--wait", action="store_true",
+                             help="keep polling when the queue is empty")
+    work_parser.add_argument("--pipeline", choices=sorted(PIPELINES), default="sync",
+                             help="renderer used for the frames (default: sync)")
+    work_parser.add_argument("--ring-size", type=int, default=3,
+                             help="frame buffers of the threaded pipeline (default: 3)")
+    work_parser.set_defaults(func=command_work)
+
+    status_parser = commands.add_parser("status", help="show the state of a render queue")
+    status_parser.add_argument("queue", help="path of the SQLite queue database")
+    status_parser.set_defaults(func=command_status)
+
+    store_parser = commands.add_parser("store", help="show or prune the segment store")
+    store_parser.add_argument("--prune", type=parse_memory_size, metavar="SIZE",
+                              help="delete least recently used segments down to SIZE, e.g. 20G")
+    store_parser.set_defaults(func=command_store)
+
+    footprint_parser = commands.add_parser("footprint", help="report mobject counts and memory")
+    footprint_parser.add_argument("paths", nargs="*",
+                                  help="scripts or directories (default: all scenes)")
+    footprint_parser.add_argument("--scene", action="append",
+                                  help="only this scene class (repeatable)")
+    footprint_parser.add_argument("-q", "--quality", choices=["l", "m", "h", "p", "k"], default="l",
+                                  help="quality the scenes are built for (default: l)")
+    footprint_parser.add_argument("--top", type=int, help="only list the N heaviest scenes")
+    footprint_parser.add_argument("--json", metavar="PATH",
+                                  help="also write all snapshots as JSON")
+    footprint_parser.set_defaults(func=command_footprint)
+
+    benchmark_parser = commands.add_parser("benchmark",
+                                           help="compare render performance with the baseline")
+    benchmark_parser.add_argument("--baseline", default=BASELINE_PATH,
+                                  help="baseline JSON (default: benchmarks/baseline.json)")
+    benchmark_parser.add_argument("--tolerance", type=float,
+                                  help="allowed relative slowdown, e.g. 0.2 (default: from baseline)")
+    benchmark_parser.add_argument("--repeat", type=int, default=1,
+                                  help="runs per scene, the median is compared (default: 1)")
+    benchmark_parser.add_argument("--update-baseline", action="store_true",
+                                  help="store the measurements as the new baseline")
+    benchmark_parser.set_defaults(func=command_benchmark)
+
+    golden_parser = commands.add_parser("golden", help="compare sampled frames with golden frames")
+    golden_parser.add_argument("paths", nargs="*",
+                               help="scripts or directories (default: all scenes)")
+    golden_parser.add_argument("--scene", action="append",
+                               help="only this scene class (repeatable)")
+    golden_parser.add_argument("-q", "--quality", choices=["l", "m"], default="l",
+                               help="quality the frames are rendered in (default: l)")
+    golden_parser.add_argument("-j", "--jobs", type=int,
+                               help="scenes rendered in parallel (default: CPU count)")
+    golden_parser.add_argument("--golden", default=GOLDEN_DIR,
+                               help="golden frame directory (default: benchmarks/golden)")
+    golden_parser.add_argument("--update", action="store_true",
+                               help="store the rendered frames as the new golden set")
+    golden_parser.set_defaults(func=command_golden)
+
+    still_parser = commands.add_parser("still", help="render a single frame as PNG")
+    still_parser.add_argument("file", help="path of the scene script")
+    still_parser.add_argument("scene", help="name of the scene class")
+    still_parser.add_argument("-t", "--time", type=float, default=-2.5,
+                              help="seconds into the scene, negative from the end (default: -2.5)")
+    still_parser.add_argument("--size", default="1920x1080", help="WIDTHxHEIGHT (default: 1920x1080)")
+    still_parser.add_argument("-o", "--output", help="PNG path (default: <scene>.png)")
+    still_parser.set_defaults(func=command_still)
+
+    thumbnails_parser = commands.add_parser("thumbnails", help="render a poster frame per scene")
+    thumbnails_parser.add_argument("paths", nargs="*",
+                                   help="scripts or directories (default: all scenes)")
+    thumbnails_parser.add_argument("--scene", action="append",
+                                   help="only this scene class (repeatable)")
+    thumbnails_parser.add_argument("-t", "--time", type=float, default=-2.5,
+                                   help="seconds into the scene, negative from the end "
+                                        "(default: -2.5, the finished Bohr model)")
+    thumbnails_parser.add_argument("--size", default="1280x720",
+                                   help="WIDTHxHEIGHT (default: 1280x720)")
+    thumbnails_parser.add_argument("--output-dir", default="media/thumbnails",
+                                   help="directory of the PNGs (default: media/thumbnails)")
+    thumbnails_parser.add_argument("-j", "--jobs", type=int,
+                                   help="scenes rendered in parallel (default: CPU count)")
+    thumbnails_parser.set_defaults(func=command_thumbnails)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "profile", None):
+        os.environ[PROFILE_ENV] = os.path.abspath(args.profile)
+    load_project_config()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
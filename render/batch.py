@@ -0,0 +1,174 @@
+"""
+Batch rendering / Stapel-Rendering
+
+Renders many scenes in parallel worker processes. Jobs start longest
+first according to the CostModel, so heavy scenes like oganesson do not
+end up as stragglers at the tail of the batch, and a job only starts
+while the predicted peak memory of all running jobs fits in the budget.
+Every finished job is recorded to calibrate later predictions.
+
+With a RenderManifest the batch is resumable: jobs whose movie is already
+recorded for their current fingerprint are skipped, and each successful
+job is appended to the manifest as soon as it finishes.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from manim import config
+
+from .catalog import REPO_ROOT, get_quality_config
+from .costmodel import CostModel, get_scene_features
+
+MEMORY_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_memory_size(text):
+    """Parses sizes like ``512M`` or ``16G`` into bytes."""
+    text = text.strip().upper()
+    if text.endswith("B"):
+        text = text[:-1]
+    if text and text[-1] in MEMORY_UNITS:
+        return int(float(text[:-1]) * MEMORY_UNITS[text[-1]])
+    return int(text)
+
+
+def get_default_memory_budget():
+    """80 % of the physical memory."""
+    return int(os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") * 0.8)
+
+
+def get_output_settings(quality=None):
+    """Pixel size and frame rate a batch renders with."""
+    if quality is not None:
+        return get_quality_config(quality)
+    return {
+        "pixel_width": config.pixel_width,
+        "pixel_height": config.pixel_height,
+        "frame_rate": config.frame_rate,
+    }
+
+
+def get_scene_command(job, quality=None, pipeline="sync", ring_size=None):
+    command = [sys.executable, "-m", "render", "scene", str(job.file_path), job.scene_name,
+               "--pipeline", pipeline]
+    if quality is not None:
+        command += ["-q", quality]
+    if ring_size is not None:
+        command += ["--ring-size", str(ring_size)]
+    return command
+
+
+def get_exit_code(status):
+    """Exit code of an ``os.wait`` status, negative signal number if killed (as Popen)."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def get_worker_env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+class BatchJob:
+    """A scene job with its features, predictions and result."""
+
+    def __init__(self, job, features, seconds, peak_rss):
+        self.job = job
+        self.features = features
+        self.predicted_seconds = seconds
+        self.predicted_rss = peak_rss
+        self.process = None
+        self.start_time = None
+        self.seconds = None
+        self.peak_rss = None
+        self.returncode = None
+
+    def __repr__(self):
+        return f"BatchJob({self.job.scene_name})"
+
+
+def plan_batch(jobs, model, quality=None):
+    """Wraps scene jobs in BatchJobs with predictions, longest first."""
+    settings = get_output_settings(quality)
+    batch = []
+    for job in jobs:
+        features = get_scene_features(job, **settings)
+        batch.append(BatchJob(job, features, *model.predict(features, job)))
+    batch.sort(key=lambda batch_job: batch_job.predicted_seconds, reverse=True)
+    return batch
+
+
+def pick_next_job(pending, free_memory, idle):
+    """
+    First (longest) pending job whose predicted memory fits; when nothing
+    is running the longest job starts regardless, so the batch never stalls.
+    """
+    for index, batch_job in enumerate(pending):
+        if batch_job.predicted_rss <= free_memory:
+            return pending.pop(index)
+    if idle and pending:
+        return pending.pop(0)
+    return None
+
+
+def run_batch(jobs, quality=None, pipeline="sync", workers=None,
+              memory_budget=None, model=None, start_job=None, on_finished=None,
+              manifest=None, verify=False, ring_size=None):
+    """
+    Renders all jobs in worker processes and returns the finished BatchJobs.
+
+    Jobs completed according to ``manifest`` are skipped (``verify`` also
+    compares the checksum of their movie).
+
+    ``start_job(batch_job)`` may replace the way a worker is started and
+    must return a Popen; ``on_finished(batch_job)`` is called after every
+    job. Peak RSS comes from the kernel's accounting of the child process.
+    """
+    workers = workers or os.cpu_count() or 1
+    memory_budget = memory_budget or get_default_memory_budget()
+    if model is None:
+        model = CostModel()
+        model.fit()
+    if start_job is None:
+        def start_job(batch_job):
+            return subprocess.Popen(get_scene_command(batch_job.job, quality, pipeline, ring_size),
+                                    env=get_worker_env())
+
+    settings = get_output_settings(quality)
+    if manifest is not None:
+        jobs = [job for job in jobs if not manifest.is_complete(job, settings, verify)]
+
+    pending = plan_batch(jobs, model, quality)
+    running = {}
+    finished = []
+    while pending or running:
+        while pending and len(running) < workers:
+            reserved = sum(batch_job.predicted_rss for batch_job in running.values())
+            batch_job = pick_next_job(pending, memory_budget - reserved, not running)
+            if batch_job is None:
+                break
+            batch_job.start_time = time.monotonic()
+            batch_job.process = start_job(batch_job)
+            running[batch_job.process.pid] = batch_job
+
+        pid, status, usage = os.wait4(-1, 0)
+        batch_job = running.pop(pid, None)
+        if batch_job is None:
+            continue
+        batch_job.seconds = time.monotonic() - batch_job.start_time
+        batch_job.peak_rss = usage.ru_maxrss * 1024  # kilobytes on Linux
+        batch_job.returncode = get_exit_code(status)
+        batch_job.process.returncode = batch_job.returncode
+        if batch_job.returncode == 0:
+            model.record(batch_job.job, batch_job.features, batch_job.seconds, batch_job.peak_rss)
+            if manifest is not None:
+                manifest.record(batch_job.job, settings)
+        finished.append(batch_job)
+        if on_finished is not None:
+            on_finished(batch_job)
+    return finished
@@ -0,0 +1,133 @@
+"""
+Performance regression gate / Performance-Regressionstest
+
+Renders a fixed, representative set of scenes at low quality and compares
+setup time, frames per second and peak memory with the committed baseline
+``benchmarks/baseline.json``. Each scene runs in its own process with a
+fresh media directory and caching disabled, so nothing is reused between
+runs; the metrics come from the profiling trace and the kernel's peak RSS
+of the process. Everything runs locally, no network access is needed.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from .batch import get_exit_code, get_worker_env
+from .catalog import REPO_ROOT
+from .profiling import PROFILE_ENV
+
+BASELINE_PATH = REPO_ROOT / "benchmarks" / "baseline.json"
+
+# Metric name -> True if larger values are better
+METRICS = {
+    "setup_seconds": False,
+    "fps": True,
+    "peak_rss_mb": False,
+}
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path, encoding="utf-8") as baseline:
+        return json.load(baseline)
+
+
+def save_baseline(baseline, path=BASELINE_PATH):
+    Path(path).write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def run_benchmark_scene(file_path, scene_name, quality, pipeline="sync"):
+    """Renders one scene in a fresh process and returns its metrics."""
+    with tempfile.TemporaryDirectory(prefix="render-benchmark-") as work_dir:
+        env = get_worker_env()
+        env[PROFILE_ENV] = work_dir
+        command = [
+            sys.executable, "-m", "render", "scene", str(REPO_ROOT / file_path), scene_name,
+            "-q", quality, "--pipeline", pipeline,
+            "--disable-caching", "--media-dir", str(Path(work_dir) / "media"),
+        ]
+        process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = get_exit_code(status)
+        if process.returncode != 0:
+            raise RuntimeError(f"{scene_name} failed with exit code {process.returncode}")
+
+        with open(Path(work_dir) / f"{scene_name}.trace.json", encoding="utf-8") as trace_file:
+            trace = json.load(trace_file)
+
+    summary = trace["otherData"]["summary"]
+    frames = next(event["args"]["frames"] for event in trace["traceEvents"]
+                  if event["name"] == "render")
+    # Setup is __init__ plus the create_* builders construct calls; a scene that
+    # builds inline would only report __init__ and hide layout regressions
+    if not any(event["name"].startswith("create_") for event in trace["traceEvents"]):
+        raise RuntimeError(f"{scene_name} has no create_* builders, its setup time "
+                           f"would not cover construct")
+    play_seconds = summary.get("animation", 0.0) + summary.get("wait", 0.0)
+    return {
+        "setup_seconds": summary.get("setup", 0.0),
+        "fps": frames / play_seconds if play_seconds else 0.0,
+        "peak_rss_mb": usage.ru_maxrss / 1024,  # kilobytes on Linux
+    }
+
+
+def measure_scene(scene, quality, repeat=1, pipeline="sync"):
+    """Median of each metric over ``repeat`` runs."""
+    runs = [run_benchmark_scene(scene["file"], scene["scene"], quality, pipeline)
+            for _ in range(repeat)]
+    return {metric: statistics.median(run[metric] for run in runs) for metric in METRICS}
+
+
+def compare(measured, expected, tolerance):
+    """
+    Regressions of one scene as (metric, measured, expected) tuples.
+
+    Metrics without a baseline value are not compared.
+    """
+    regressions = []
+    for metric, larger_is_better in METRICS.items():
+        base = expected.get(metric)
+        if base is None:
+            continue
+        value = measured[metric]
+        if larger_is_better:
+            regressed = value < base * (1 - tolerance)
+        else:
+            regressed = value > base * (1 + tolerance)
+        if regressed:
+            regressions.append((metric, value, base))
+    return regressions
+
+
+def run_benchmark(baseline, tolerance=None, repeat=1, update=False, report=print):
+    """
+    Measures all baseline scenes; returns the number of failed scenes.
+
+    A scene fails when a metric regressed or has no baseline value yet, so
+    the gate cannot pass against an empty baseline. With ``update`` the
+    measurements replace the baseline values instead.
+    """
+    quality = baseline["quality"]
+    tolerance = baseline["tolerance"] if tolerance is None else tolerance
+    failed = 0
+    for scene in baseline["scenes"]:
+        measured = measure_scene(scene, quality, repeat)
+        report(f"{scene['scene']}: setup {measured['setup_seconds']:.2f} s, "
+               f"{measured['fps']:.1f} fps, {measured['peak_rss_mb']:.0f} MB peak")
+        if update:
+            scene.update({metric: round(value, 3) for metric, value in measured.items()})
+            continue
+        regressions = compare(measured, scene, tolerance)
+        for metric, value, base in regressions:
+            report(f"  regression: {metric} {value:.3f} vs. baseline {base:.3f} "
+                   f"(tolerance {tolerance:.0%})")
+        missing = [metric for metric in METRICS if scene.get(metric) is None]
+        if missing:
+            report(f"  no baseline for {', '.join(missing)}, run with --update-baseline")
+        if regressions or missing:
+            failed += 1
+    return failed
@@ -0,0 +1,130 @@
+"""
+Scene catalog / Szenenkatalog
+
+Locates the animation scripts of this repository and loads their scene
+classes the same way ``manim render`` does.
+"""
+
+import ast
+import importlib.util
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+from manim import constants
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Top-level directories that hold animation scripts
+SCENE_DIRS = ["chemistry", "physics"]
+
+# One renderable scene class of a script
+SceneJob = namedtuple("SceneJob", ["file_path", "scene_name"])
+
+# Quality flags as used by ``manim render -q<flag>``
+QUALITY_FLAGS = {
+    values["flag"]: name
+    for name, values in constants.QUALITIES.items()
+    if values["flag"] is not None
+}
+
+
+def get_quality_config(quality):
+    """Returns pixel size and frame rate for a quality flag (l, m, h, p, k) or name."""
+    name = QUALITY_FLAGS.get(quality, quality)
+    if name not in constants.QUALITIES:
+        raise ValueError(f"Unknown quality: {quality}")
+    values = constants.QUALITIES[name]
+    return {
+        "pixel_width": values["pixel_width"],
+        "pixel_height": values["pixel_height"],
+        "frame_rate": values["frame_rate"],
+    }
+
+
+def load_scene_class(file_path, scene_name):
+    """
+    Imports a scene script and returns the requested scene class.
+
+    Like manim, the script's directory is put on ``sys.path``; the
+    repository root is added as well so the shared packages resolve.
+    """
+    file_path = Path(file_path).resolve()
+    for path in (REPO_ROOT, file_path.parent):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    module_name = "scene_" + file_path.stem
+    module = sys.modules.get(module_name)
+    if module is None or getattr(module, "__file__", None) != str(file_path):
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+    try:
+        return getattr(module, scene_name)
+    except AttributeError:
+        raise ValueError(f"{scene_name} is not in {file_path}") from None
+
+
+def parse_script(file_path):
+    return ast.parse(Path(file_path).read_text(encoding="utf-8"), filename=str(file_path))
+
+
+def get_scene_names(file_path):
+    """
+    Names of the renderable scenes of a script, without importing it.
+
+    A scene is a class derived from ``Scene`` (directly or via classes of
+    the same file) that no other class of the file derives from, i.e. the
+    language variants like ``IronAtomDE`` and not their base ``IronAtom``.
+    """
+    bases = {
+        node.name: [base.id for base in node.bases if isinstance(base, ast.Name)]
+        for node in parse_script(file_path).body
+        if isinstance(node, ast.ClassDef)
+    }
+
+    def is_scene(name, seen=()):
+        if name == "Scene":
+            return True
+        if name not in bases or name in seen:
+            return False
+        return any(is_scene(base, (*seen, name)) for base in bases[name])
+
+    parents = {base for names in bases.values() for base in names}
+    return [name for name in bases if name not in parents and is_scene(name)]
+
+
+def read_constants(file_path):
+    """Module-level constants of a script that are plain literals."""
+    constants = {}
+    for node in parse_script(file_path).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id.isupper():
+                try:
+                    constants[target.id] = ast.literal_eval(node.value)
+                except ValueError:
+                    pass
+    return constants
+
+
+def find_scenes(paths=None):
+    """
+    Lists the scenes of the given scripts or directories as SceneJobs.
+
+    Without paths, all scripts below SCENE_DIRS are searched. Package
+    modules (``__init__.py`` and helpers without scenes) are skipped.
+    """
+    if not paths:
+        paths = [REPO_ROOT / name for name in SCENE_DIRS]
+    jobs = []
+    for path in map(Path, paths):
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file_path in files:
+            if file_path.name.startswith("__"):
+                continue
+            jobs += [SceneJob(file_path, name) for name in get_scene_names(file_path)]
+    return jobs
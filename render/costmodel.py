@@ -0,0 +1,185 @@
+"""
+Render cost model / Kostenmodell
+
+Predicts wall time and peak memory of a scene render from a few features
+of the scene (electrons, shells) and of the output (pixels, frame rate).
+The model is a linear least-squares fit over recorded runs, pulled
+towards hand-made prior coefficients so it is usable from the first run
+and sharpens as the history grows.
+
+Electrons and shells only describe the element scenes; the length of the
+tour, the particle count of the kinetic gas and the like are not in the
+features. Every recorded scene therefore also gets a factor, its last
+recorded runtime over the model's prediction for that run, which scales
+its later predictions (also at other resolutions and frame rates).
+Scenes that were never recorded take the factor of another scene of the
+same script, or else are assumed as costly, relative to the model, as
+the costliest recorded scene, so they start early instead of trailing
+the batch.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+from manim import config
+
+from chemistry.data import get_element
+
+from .catalog import read_constants
+
+MEGABYTE = 1024 ** 2
+
+# Feature vectors; a render costs per frame, so most time terms scale with fps
+TIME_FEATURES = ["base", "fps", "fps_megapixels", "fps_electrons", "fps_megapixels_shells"]
+MEMORY_FEATURES = ["base", "megapixels", "electrons"]
+
+# Prior coefficients (seconds / bytes per feature unit), rough 4K60 estimates
+TIME_PRIOR = np.array([5.0, 0.2, 0.12, 0.004, 0.01])
+MEMORY_PRIOR = np.array([300.0, 45.0, 0.5]) * MEGABYTE
+
+# Weight of the prior, in recorded runs
+PRIOR_WEIGHT = 2.0
+
+
+def get_electron_config(file_path):
+    """Shell occupation of the element a script shows (its ELEMENT_SYMBOL); empty for other scripts."""
+    symbol = read_constants(file_path).get("ELEMENT_SYMBOL")
+    return get_element(symbol).electron_config if symbol else ()
+
+
+def get_scene_features(job, pixel_width, pixel_height, frame_rate):
+    """Raw features of a scene job at the given output settings."""
+    electron_config = get_electron_config(job.file_path)
+    return {
+        "electrons": sum(electron_config),
+        "shells": sum(1 for count in electron_config if count),
+        "megapixels": pixel_width * pixel_height / 1e6,
+        "fps": frame_rate,
+    }
+
+
+def get_scene_key(job):
+    return str(job.file_path), job.scene_name
+
+
+def get_time_vector(features):
+    fps, megapixels = features["fps"], features["megapixels"]
+    return np.array([
+        1.0,
+        fps,
+        fps * megapixels,
+        fps * features["electrons"],
+        fps * megapixels * features["shells"],
+    ])
+
+
+def get_memory_vector(features):
+    return np.array([1.0, features["megapixels"], features["electrons"]])
+
+
+def fit_coefficients(rows, targets, prior):
+    """Least squares fit of ``rows @ w = targets``, regularized towards ``prior``."""
+    if not len(rows):
+        return prior.copy()
+    # Scale every feature to unit size so the prior weighs all of them alike
+    rows = np.asarray(rows, dtype=np.float64)
+    scale = np.maximum(np.abs(rows).max(axis=0), 1e-9)
+    scaled = rows / scale
+    regularizer = np.sqrt(PRIOR_WEIGHT) * np.eye(len(prior))
+    a = np.vstack([scaled, regularizer])
+    b = np.concatenate([targets, regularizer @ (prior * scale)])
+    solution, *_ = np.linalg.lstsq(a, b, rcond=None)
+    return solution / scale
+
+
+class CostModel:
+    """
+    Runtime and peak RSS predictions, calibrated from a JSONL history.
+
+    Each line of the history records the features of one finished render
+    together with its wall time in seconds and peak RSS in bytes.
+    """
+
+    def __init__(self, history_path=None):
+        self._history_path = history_path
+        self.time_coefficients = TIME_PRIOR.copy()
+        self.memory_coefficients = MEMORY_PRIOR.copy()
+        self.scene_factors = {}
+        self.script_factors = {}
+
+    @property
+    def history_path(self):
+        if self._history_path is not None:
+            return Path(self._history_path)
+        return Path(config.media_dir) / "render_history.jsonl"
+
+    def load_history(self):
+        if not self.history_path.exists():
+            return []
+        with self.history_path.open(encoding="utf-8") as history:
+            return [json.loads(line) for line in history if line.strip()]
+
+    def fit(self):
+        """Fits both models to the recorded runs; returns the number of runs used."""
+        runs = self.load_history()
+        self.time_coefficients = fit_coefficients(
+            [get_time_vector(run["features"]) for run in runs],
+            np.array([run["seconds"] for run in runs]),
+            TIME_PRIOR,
+        )
+        self.memory_coefficients = fit_coefficients(
+            [get_memory_vector(run["features"]) for run in runs],
+            np.array([run["peak_rss"] for run in runs]),
+            MEMORY_PRIOR,
+        )
+        # Later runs of a scene replace the factors of earlier ones
+        self.scene_factors, self.script_factors = {}, {}
+        for run in runs:
+            seconds, peak_rss = self.predict_features(run["features"])
+            factors = run["seconds"] / seconds, run["peak_rss"] / peak_rss
+            self.scene_factors[(run["file"], run["scene"])] = factors
+            self.script_factors[run["file"]] = factors
+        return len(runs)
+
+    def get_scene_factors(self, job):
+        """
+        (time, memory) factors of a scene, else of another scene of its
+        script (the other language), else the largest recorded ones.
+        """
+        file, scene = get_scene_key(job)
+        factors = self.scene_factors.get((file, scene), self.script_factors.get(file))
+        if factors is not None:
+            return factors
+        if not self.scene_factors:
+            return 1.0, 1.0
+        time_factors, memory_factors = zip(*self.scene_factors.values())
+        return max(1.0, max(time_factors)), max(1.0, max(memory_factors))
+
+    def predict_features(self, features):
+        """(seconds, peak RSS in bytes) of the linear model alone."""
+        seconds = float(get_time_vector(features) @ self.time_coefficients)
+        peak_rss = float(get_memory_vector(features) @ self.memory_coefficients)
+        return max(seconds, 1.0), max(peak_rss, MEMORY_PRIOR[0])
+
+    def predict(self, features, job=None):
+        """Returns (seconds, peak RSS in bytes) for a feature dict, scaled for job's scene."""
+        seconds, peak_rss = self.predict_features(features)
+        if job is None:
+            return seconds, peak_rss
+        time_factor, memory_factor = self.get_scene_factors(job)
+        return seconds * time_factor, peak_rss * memory_factor
+
+    def record(self, job, features, seconds, peak_rss):
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        run = {
+            "file": get_scene_key(job)[0],
+            "scene": job.scene_name,
+            "features": features,
+            "seconds": seconds,
+            "peak_rss": peak_rss,
+            "time": time.time(),
+        }
+        with self.history_path.open("a", encoding="utf-8") as history:
+            history.write(json.dumps(run) + "\n")
@@ -0,0 +1,139 @@
+"""
+Memory footprint report / Speicherbedarf
+
+Runs scenes without rasterizing or encoding and measures their mobjects:
+counts by type, Bezier points and the bytes of all numpy arrays (points,
+fill and stroke colours...) held by each mobject. A snapshot is taken of
+every ``create_*`` result and of the scene after every ``play``, and the
+largest one is the scene's footprint. Aggregated over the catalog it
+shows which scenes are heaviest and whether a change really shrank them.
+"""
+
+from collections import Counter
+
+import numpy as np
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from .catalog import get_quality_config, load_scene_class
+
+MEGABYTE = 1024 ** 2
+
+
+def iter_family(mobjects):
+    """All mobjects of the given families, each once."""
+    seen = set()
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            if id(member) not in seen:
+                seen.add(id(member))
+                yield member
+
+
+def get_array_bytes(mobject):
+    return sum(value.nbytes for value in vars(mobject).values() if isinstance(value, np.ndarray))
+
+
+def measure(mobjects):
+    """Counts, points and array bytes of the given mobject families."""
+    types = Counter()
+    points = 0
+    array_bytes = 0
+    for member in iter_family(mobjects):
+        types[type(member).__name__] += 1
+        points += len(member.points)
+        array_bytes += get_array_bytes(member)
+    return {
+        "mobjects": sum(types.values()),
+        "points": points,
+        "bytes": array_bytes,
+        "types": dict(types.most_common()),
+    }
+
+
+class FootprintRecorder:
+    """Labelled footprint snapshots of one scene."""
+
+    def __init__(self, scene_name):
+        self.scene_name = scene_name
+        self.snapshots = []
+
+    def snapshot(self, label, mobjects):
+        self.snapshots.append({"label": label, **measure(mobjects)})
+
+    def get_peak(self):
+        return max(self.snapshots, key=lambda snapshot: snapshot["bytes"], default=None)
+
+    def to_dict(self):
+        return {"scene": self.scene_name, "peak": self.get_peak(), "snapshots": self.snapshots}
+
+
+def footprint_scene(scene_cls, recorder):
+    """Subclass of scene_cls that reports to recorder while it runs."""
+
+    def recorded_builder(name, method):
+        def builder(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            mobjects = result if isinstance(result, tuple) else (result,)
+            mobjects = [mobject for mobject in mobjects if hasattr(mobject, "get_family")]
+            if mobjects:
+                recorder.snapshot(f"built: {name}", mobjects)
+            return result
+        return builder
+
+    def play(self, *args, **kwargs):
+        scene_cls.play(self, *args, **kwargs)
+        names = ", ".join(type(animation).__name__ for animation in args)
+        recorder.snapshot(f"{self.renderer.num_plays - 1}: {names}", self.mobjects)
+
+    namespace = {"play": play, "__module__": scene_cls.__module__}
+    for name in dir(scene_cls):
+        if name.startswith("create_") and callable(getattr(scene_cls, name)):
+            namespace[name] = recorded_builder(name, getattr(scene_cls, name))
+    return type(scene_cls.__name__, (scene_cls,), namespace)
+
+
+def measure_scene(job, quality="l"):
+    """Runs a scene without output and returns its FootprintRecorder."""
+    settings = {"input_file": job.file_path, "dry_run": True, **get_quality_config(quality)}
+    recorder = FootprintRecorder(job.scene_name)
+    with tempconfig(settings):
+        scene_cls = footprint_scene(load_scene_class(job.file_path, job.scene_name), recorder)
+        scene_cls(renderer=CairoRenderer(skip_animations=True)).render()
+    return recorder
+
+
+def summarize(recorders):
+    """Catalog totals: type counts and bytes at each scene's peak."""
+    types = Counter()
+    for recorder in recorders:
+        peak = recorder.get_peak()
+        if peak is not None:
+            types.update(peak["types"])
+    peaks = [recorder.get_peak() for recorder in recorders if recorder.get_peak()]
+    return {
+        "scenes": len(recorders),
+        "peak_bytes_total": sum(peak["bytes"] for peak in peaks),
+        "peak_points_total": sum(peak["points"] for peak in peaks),
+        "types": dict(types.most_common()),
+    }
+
+
+def format_report(recorders, top=None):
+    """Text table of the scenes, heaviest first."""
+    recorders = sorted(recorders, key=lambda recorder: (recorder.get_peak() or {}).get("bytes", 0),
+                       reverse=True)
+    lines = [f"{'Scene':<28} {'Mobjects':>9} {'Points':>10} {'MB':>8}  Peak at"]
+    for recorder in recorders[:top]:
+        peak = recorder.get_peak()
+        if peak is None:
+            continue
+        lines.append(f"{recorder.scene_name:<28} {peak['mobjects']:>9} {peak['points']:>10} "
+                     f"{peak['bytes'] / MEGABYTE:>8.2f}  {peak['label']}")
+    summary = summarize(recorders)
+    lines.append("")
+    lines.append(f"{summary['scenes']} scenes, {summary['peak_points_total']} points, "
+                 f"{summary['peak_bytes_total'] / MEGABYTE:.1f} MB at peak")
+    lines.append("Mobjects by type: " + ", ".join(
+        f"{name} {count}" for name, count in list(summary["types"].items())[:10]))
+    return "\n".join(lines)
@@ -0,0 +1,189 @@
+"""
+Golden frame checks / Referenzbild-Pruefung
+
+Guards render optimizations against visual drift. Every scene is rendered
+at low quality, frames are sampled at fixed timestamps and scaled down to
+small grayscale images, and each frame is compared with the stored golden
+frame twice: by the Hamming distance of a DCT perceptual hash (layout
+changes) and by SSIM (local detail). Scenes are checked in parallel; the
+work happens in manim and ffmpeg subprocesses.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from manim import config
+
+from .batch import get_worker_env
+from .catalog import REPO_ROOT, get_quality_config
+from .manifest import get_movie_path
+
+GOLDEN_DIR = REPO_ROOT / "benchmarks" / "golden"
+
+# Seconds into the video; times past the end are clamped to the last frame
+SAMPLE_TIMES = [0.5, 2.0, 4.0, 7.0, 10.0, 14.0]
+FRAME_SIZE = (90, 160)  # height, width of the compared grayscale frames
+
+HASH_SIZE = 32
+HASH_BITS = 8
+MAX_HASH_DISTANCE = 10
+MIN_SSIM = 0.95
+
+DURATION_PATTERN = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+def get_dct_matrix(size):
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] /= np.sqrt(2)
+    return matrix * np.sqrt(2 / size)
+
+
+DCT_MATRIX = get_dct_matrix(HASH_SIZE)
+
+
+def resize(image, height, width):
+    """Bilinear resize of a 2D array."""
+    rows = np.linspace(0, image.shape[0] - 1, height)
+    cols = np.linspace(0, image.shape[1] - 1, width)
+    image = np.array([np.interp(rows, np.arange(image.shape[0]), column) for column in image.T]).T
+    return np.array([np.interp(cols, np.arange(image.shape[1]), row) for row in image])
+
+
+def perceptual_hash(frame):
+    """64-bit DCT hash: low frequencies above their median."""
+    small = resize(frame.astype(np.float64), HASH_SIZE, HASH_SIZE)
+    coefficients = (DCT_MATRIX @ small @ DCT_MATRIX.T)[:HASH_BITS, :HASH_BITS].ravel()[1:]
+    return coefficients > np.median(coefficients)
+
+
+def hash_distance(hash_a, hash_b):
+    return int(np.count_nonzero(hash_a != hash_b))
+
+
+def box_filter(image, size):
+    """Mean over size x size windows (valid region), via summed-area tables."""
+    table = np.pad(image, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    window = (table[size:, size:] - table[:-size, size:]
+              - table[size:, :-size] + table[:-size, :-size])
+    return window / (size * size)
+
+
+def ssim(frame_a, frame_b, window=7, data_range=255.0):
+    """Mean structural similarity of two grayscale frames."""
+    a = frame_a.astype(np.float64)
+    b = frame_b.astype(np.float64)
+    c1 = (0.01 * data_range) ** 2
+    c2 = (0.03 * data_range) ** 2
+    mean_a, mean_b = box_filter(a, window), box_filter(b, window)
+    var_a = box_filter(a * a, window) - mean_a ** 2
+    var_b = box_filter(b * b, window) - mean_b ** 2
+    covariance = box_filter(a * b, window) - mean_a * mean_b
+    similarity = ((2 * mean_a * mean_b + c1) * (2 * covariance + c2)
+                  / ((mean_a ** 2 + mean_b ** 2 + c1) * (var_a + var_b + c2)))
+    return float(similarity.mean())
+
+
+def get_duration(movie_path):
+    """Length of a movie in seconds, from the input description of the configured ffmpeg."""
+    # Without an output file ffmpeg describes the input and exits with an error
+    output = subprocess.run(
+        [config.ffmpeg_executable, "-hide_banner", "-i", str(movie_path)],
+        capture_output=True, text=True,
+    ).stderr
+    match = DURATION_PATTERN.search(output)
+    if match is None:
+        raise RuntimeError(f"no duration for {movie_path}: {output.strip()}")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def extract_frame(movie_path, seconds):
+    """Grayscale frame of FRAME_SIZE at the given time."""
+    height, width = FRAME_SIZE
+    raw = subprocess.run(
+        [config.ffmpeg_executable, "-v", "error", "-ss", f"{seconds:.3f}", "-i", str(movie_path),
+         "-frames:v", "1", "-vf", f"scale={width}:{height},format=gray",
+         "-f", "rawvideo", "-"],
+        capture_output=True, check=True,
+    ).stdout
+    return np.frombuffer(raw, dtype=np.uint8).reshape(height, width)
+
+
+def sample_frames(movie_path, frame_rate):
+    """Sample times (clamped to the video) and the frames at these times."""
+    last_frame = max(get_duration(movie_path) - 2 / frame_rate, 0.0)
+    times = sorted({min(seconds, last_frame) for seconds in SAMPLE_TIMES})
+    return np.array(times), np.stack([extract_frame(movie_path, seconds) for seconds in times])
+
+
+def render_frames(job, quality="l"):
+    """
+    Renders a scene into a throwaway media directory and samples it.
+
+    Caching is off and the shared segment store is not passed on, so every
+    frame is rendered by the current code, never linked from an earlier
+    render of the same play.
+    """
+    env = get_worker_env()
+    env.pop("RENDER_SEGMENT_STORE", None)
+    with tempfile.TemporaryDirectory(prefix="render-golden-") as media_dir:
+        command = [sys.executable, "-m", "render", "scene", str(job.file_path), job.scene_name,
+                   "-q", quality, "--media-dir", media_dir, "--disable-caching"]
+        subprocess.run(command, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        settings = {"media_dir": media_dir, **get_quality_config(quality)}
+        return sample_frames(get_movie_path(job, settings), settings["frame_rate"])
+
+
+def get_golden_path(job, golden_dir=GOLDEN_DIR):
+    return Path(golden_dir) / Path(job.file_path).stem / f"{job.scene_name}.npz"
+
+
+def compare_frames(times, frames, golden):
+    """Drifted frames as (time, hash distance, ssim) tuples."""
+    if not np.array_equal(times, golden["times"]):
+        return [(None, None, None)]
+    drifted = []
+    for seconds, frame, golden_frame in zip(times, frames, golden["frames"]):
+        distance = hash_distance(perceptual_hash(frame), perceptual_hash(golden_frame))
+        similarity = ssim(frame, golden_frame)
+        if distance > MAX_HASH_DISTANCE or similarity < MIN_SSIM:
+            drifted.append((float(seconds), distance, similarity))
+    return drifted
+
+
+def check_scene(job, golden_dir=GOLDEN_DIR, update=False, quality="l"):
+    """
+    Renders and compares one scene. Returns (job, status, drifted frames),
+    status being "ok", "drift", "missing", "updated" or "error: ...".
+    """
+    golden_path = get_golden_path(job, golden_dir)
+    try:
+        times, frames = render_frames(job, quality)
+    except (subprocess.CalledProcessError, ValueError) as error:
+        return job, f"error: {error}", []
+    if update:
+        golden_path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(golden_path, times=times, frames=frames)
+        return job, "updated", []
+    if not golden_path.exists():
+        return job, "missing", []
+    with np.load(golden_path) as golden:
+        drifted = compare_frames(times, frames, golden)
+    return job, "drift" if drifted else "ok", drifted
+
+
+def check_scenes(jobs, golden_dir=GOLDEN_DIR, update=False, quality="l", workers=None):
+    """Checks scenes in parallel and yields the results in job order."""
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(check_scene, job, golden_dir, update, quality) for job in jobs]
+        for future in futures:
+            yield future.result()
@@ -0,0 +1,243 @@
+"""
+Render job queue / Render-Warteschlange
+
+Shares a catalog render between several machines. A coordinator enqueues
+(scene, quality) jobs in a SQLite database; workers lease one job at a
+time, keep the lease alive with heartbeats while manim runs and publish
+the movie to a shared output directory. A lease that is not renewed (the
+worker crashed or lost the connection) expires and the job is handed to
+the next worker, up to ``max_attempts`` times.
+
+The database uses SQLite's default rollback journal, which only needs
+POSIX advisory locks (fcntl) on the database file; WAL mode would need
+shared memory and does not work across hosts. The shared filesystem has
+to implement those locks (NFSv4, or NFSv3 with lockd; not mounts with
+``nolock``). Several local workers on one machine behave exactly like
+workers on separate render boxes.
+"""
+
+import os
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .batch import get_output_settings, get_scene_command, get_worker_env
+from .catalog import REPO_ROOT, SceneJob
+from .manifest import get_movie_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    quality TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    output TEXT,
+    error TEXT,
+    finished REAL,
+    UNIQUE (file, scene, quality)
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, id);
+"""
+
+# Job states
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+def get_job_file(file_path):
+    """Scripts are stored relative to the repository, which may sit elsewhere on each node."""
+    file_path = Path(file_path).resolve()
+    try:
+        return file_path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(file_path)
+
+
+def get_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """SQLite-backed queue of scene render jobs with expiring leases."""
+
+    def __init__(self, path, max_attempts=3):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        # Rollback journal, also for databases an older version switched to WAL
+        self.connection.execute("PRAGMA journal_mode=DELETE")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def transaction(self):
+        """Write transaction that takes the database lock right away."""
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def enqueue(self, jobs, quality):
+        """Adds scene jobs; jobs already in the queue are left alone."""
+        quality = quality or ""
+        connection = self.transaction()
+        try:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO jobs (file, scene, quality) VALUES (?, ?, ?)",
+                [(get_job_file(job.file_path), job.scene_name, quality) for job in jobs],
+            )
+            added = connection.total_changes - before
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return added
+
+    def requeue_expired(self, connection, now):
+        connection.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+            "worker = NULL, error = 'lease expired' "
+            "WHERE state = ? AND lease_expires < ?",
+            (self.max_attempts, FAILED, PENDING, LEASED, now),
+        )
+
+    def lease(self, worker_id, lease_seconds):
+        """Leases the oldest pending job; returns the job row or None."""
+        now = time.time()
+        connection = self.transaction()
+        try:
+            self.requeue_expired(connection, now)
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE state = ? ORDER BY id LIMIT 1", (PENDING,)
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE jobs SET state = ?, worker = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (LEASED, worker_id, now + lease_seconds, row["id"]),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return row
+
+    def heartbeat(self, job_id, worker_id, lease_seconds):
+        """Extends a lease; False when the lease was lost to another worker."""
+        cursor = self.connection.execute(
+            "UPDATE jobs SET lease_expires = ? WHERE id = ? AND worker = ? AND state = ?",
+            (time.time() + lease_seconds, job_id, worker_id, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id, worker_id, output):
+        cursor = self.connection.execute(
+            "UPDATE jobs SET state = ?, output = ?, error = NULL, finished = ? "
+            "WHERE id = ? AND worker = ? AND state = ?",
+            (DONE, str(output), time.time(), job_id, worker_id, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id, worker_id, error):
+        """Gives a job back for retry, or marks it failed after max_attempts."""
+        cursor = self.connection.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+            "worker = NULL, error = ? WHERE id = ? AND worker = ? AND state = ?",
+            (self.max_attempts, FAILED, PENDING, error, job_id, worker_id, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def counts(self):
+        rows = self.connection.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state")
+        return {state: count for state, count in rows}
+
+    def has_open_jobs(self):
+        counts = self.counts()
+        return bool(counts.get(PENDING) or counts.get(LEASED))
+
+
+def publish_movie(movie_path, output_dir, job, quality):
+    """Copies a finished movie into the shared output directory, atomically."""
+    target = Path(output_dir) / (quality or "default") / job.file_path.stem / movie_path.name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.{get_worker_id().replace(':', '_')}")
+    shutil.copyfile(movie_path, temp_path)
+    os.replace(temp_path, target)
+    return target
+
+
+def run_job(queue, row, worker_id, output_dir, pipeline="sync", lease_seconds=60, ring_size=None):
+    """Renders one leased job while renewing its lease; returns True on success."""
+    job = SceneJob(REPO_ROOT / row["file"], row["scene"])
+    quality = row["quality"] or None
+    process = subprocess.Popen(get_scene_command(job, quality, pipeline, ring_size),
+                               env=get_worker_env())
+    while True:
+        try:
+            process.wait(timeout=lease_seconds / 3)
+            break
+        except subprocess.TimeoutExpired:
+            if not queue.heartbeat(row["id"], worker_id, lease_seconds):
+                # The job was handed to another worker, stop duplicating work
+                process.kill()
+                process.wait()
+                return False
+
+    if process.returncode != 0:
+        queue.fail(row["id"], worker_id, f"exit code {process.returncode}")
+        return False
+    movie_path = get_movie_path(job, get_output_settings(quality))
+    try:
+        target = publish_movie(movie_path, output_dir, job, quality)
+    except OSError as error:
+        queue.fail(row["id"], worker_id, f"publish failed: {error}")
+        return False
+    return queue.complete(row["id"], worker_id, target)
+
+
+def run_worker(queue_path, output_dir, pipeline="sync", lease_seconds=60,
+               poll_interval=5.0, wait=False, on_job=None, ring_size=None):
+    """
+    Leases and renders jobs until the queue is drained.
+
+    Without ``wait`` the worker exits when no job is pending or leased;
+    with it, it keeps polling for new jobs.
+    """
+    queue = JobQueue(queue_path)
+    worker_id = get_worker_id()
+    try:
+        while True:
+            row = queue.lease(worker_id, lease_seconds)
+            if row is None:
+                if not wait and not queue.has_open_jobs():
+                    return
+                time.sleep(poll_interval)
+                continue
+            succeeded = run_job(queue, row, worker_id, output_dir, pipeline, lease_seconds,
+                                ring_size)
+            if on_job is not None:
+                on_job(row, succeeded)
+    finally:
+        queue.close()
+
+
+def start_local_workers(count, queue_path, output_dir, pipeline="sync", lease_seconds=60,
+                        ring_size=None):
+    """Starts worker processes on this machine, standing in for render nodes."""
+    command = [sys.executable, "-m", "render", "work", str(queue_path), str(output_dir),
+               "--pipeline", pipeline, "--lease", str(lease_seconds)]
+    if ring_size is not None:
+        command += ["--ring-size", str(ring_size)]
+    return [subprocess.Popen(command, env=get_worker_env()) for _ in range(count)]
@@ -0,0 +1,157 @@
+"""
+Render manifest / Render-Protokoll
+
+Append-only JSONL record of finished scene renders. Each line holds the
+fingerprint of the inputs (scene source, the repository modules it
+imports, output settings, manim version) and the size and SHA-256 of the
+movie file. A batch that died half-way resumes by skipping every job
+whose fingerprint is recorded and whose movie is still intact.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from manim import __version__, config, tempconfig
+
+from .catalog import REPO_ROOT
+
+
+def file_sha256(file_path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as stream:
+        while chunk := stream.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_package_modules(package):
+    """
+    Modules of a package and of its subpackages. Directories without an
+    ``__init__.py`` (``chemistry/elements``, ``chemistry/quantum``...) hold
+    scene scripts, not library code, and are left out.
+    """
+    modules = sorted(package.glob("*.py"))
+    for directory in sorted(path for path in package.iterdir() if path.is_dir()):
+        if (directory / "__init__.py").exists():
+            modules += get_package_modules(directory)
+    return modules
+
+
+def get_source_files(file_path):
+    """
+    The script and the repository modules it imports: the library modules
+    of shared packages like ``chemistry`` and sibling modules like
+    ``heating_curve``. Other scene scripts inside a package do not affect
+    the fingerprint.
+    """
+    file_path = Path(file_path).resolve()
+    tree = ast.parse(file_path.read_text(encoding="utf-8"))
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module.split(".")[0])
+
+    sources = [file_path]
+    for module in sorted(modules):
+        package = REPO_ROOT / module
+        sibling = file_path.parent / f"{module}.py"
+        if (package / "__init__.py").exists():
+            sources += get_package_modules(package)
+        elif sibling.exists() and sibling != file_path:
+            sources.append(sibling)
+    return sources
+
+
+def get_fingerprint(job, settings):
+    """Hash of everything that determines the movie of a scene job."""
+    digest = hashlib.sha256()
+    digest.update(job.scene_name.encode())
+    for source in get_source_files(job.file_path):
+        digest.update(str(source.relative_to(REPO_ROOT)).encode())
+        digest.update(source.read_bytes())
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    digest.update(__version__.encode())
+    return digest.hexdigest()
+
+
+def get_movie_path(job, settings):
+    """Where manim writes the movie of a scene job with the given settings."""
+    with tempconfig(settings):
+        video_dir = config.get_dir("video_dir", module_name=Path(job.file_path).stem)
+        return video_dir / f"{job.scene_name}{config.movie_file_extension}"
+
+
+class RenderManifest:
+    """Append-only JSONL manifest of completed scene renders."""
+
+    def __init__(self, path=None):
+        self._path = path
+        self.entries = None
+
+    @property
+    def path(self):
+        if self._path is not None:
+            return Path(self._path)
+        return Path(config.media_dir) / "render_manifest.jsonl"
+
+    def load(self):
+        """Latest entry per fingerprint; a torn last line from a crash is ignored."""
+        self.entries = {}
+        if not self.path.exists():
+            return self.entries
+        with self.path.open(encoding="utf-8") as manifest:
+            for line in manifest:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.entries[entry["fingerprint"]] = entry
+        return self.entries
+
+    def is_complete(self, job, settings, verify=False):
+        """
+        Whether the job's movie is recorded for its current fingerprint and
+        still on disk with the recorded size (and checksum with ``verify``).
+        """
+        if self.entries is None:
+            self.load()
+        entry = self.entries.get(get_fingerprint(job, settings))
+        if entry is None:
+            return False
+        movie_path = Path(entry["output"])
+        if not movie_path.exists() or movie_path.stat().st_size != entry["size"]:
+            return False
+        return not verify or file_sha256(movie_path) == entry["sha256"]
+
+    def record(self, job, settings):
+        """Appends the finished movie of a job, flushed to disk before returning."""
+        movie_path = get_movie_path(job, settings)
+        entry = {
+            "fingerprint": get_fingerprint(job, settings),
+            "file": str(job.file_path),
+            "scene": job.scene_name,
+            "settings": settings,
+            "output": str(movie_path.resolve()),
+            "size": movie_path.stat().st_size,
+            "sha256": file_sha256(movie_path),
+            "time": time.time(),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a+b") as manifest:
+            # Start on a fresh line after a torn write of an earlier run
+            if manifest.tell():
+                manifest.seek(-1, os.SEEK_END)
+                if manifest.read(1) != b"\n":
+                    manifest.write(b"\n")
+            manifest.write(json.dumps(entry).encode() + b"\n")
+            manifest.flush()
+            os.fsync(manifest.fileno())
+        if self.entries is not None:
+            self.entries[entry["fingerprint"]] = entry
+        return entry
@@ -0,0 +1,356 @@
+"""
+Pipelined frame output / Parallele Bildausgabe
+
+By default manim rasterizes a frame and then writes it to ffmpeg's stdin on
+the same thread, so the CPU idles while the pipe drains and vice versa.
+The PipelinedCairoRenderer lets Cairo draw straight into a ring of
+preallocated frame buffers and hands each filled buffer to a writer thread
+that streams it to ffmpeg while the next frame is drawn. Wall time per
+scene approaches max(render, encode) instead of their sum.
+
+Frames are written to the encoder straight from the memory Cairo drew
+into: the camera's pixel array is the backing store of the Cairo image
+surface, and ``write_frame_buffer`` hands a memoryview of it to the pipe
+instead of going through ``np.array`` and ``tobytes`` (two 33 MB copies
+per 4K frame).
+
+Static waits (a Wait without updaters) are already drawn only once by
+manim, but the frame is still piped and encoded once per video frame.
+Here the encoder gets the frame a single time and repeats it itself with
+ffmpeg's loop filter, so a two second wait at 4K60 sends 33 MB instead of
+4 GB through the pipe.
+
+All pipelines write movie files under a temporary name and rename them
+once ffmpeg finished successfully. An interrupted render never leaves a
+truncated partial movie file that manim's cache would later reuse.
+Finished partial files go to the SegmentStore, which lets other scenes
+reuse identical segments.
+
+The writers override the ffmpeg-pipe API of manim 0.18 (``open_movie_pipe``,
+``writing_process``); manim 0.19 encodes through PyAV instead, so the
+requirements pin ``manim<0.19``.
+"""
+
+import os
+import queue
+import subprocess
+import threading
+from pathlib import Path
+
+import numpy as np
+from manim import __version__, config
+from manim.constants import RendererType
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format, write_to_movie
+
+from .store import SEGMENT_STORE
+
+
+class FrameRing:
+    """
+    Fixed set of frame buffers cycled between renderer and writer thread.
+
+    The ring also bounds the pipeline: when every buffer is still waiting
+    for the encoder, ``acquire`` blocks the renderer.
+    """
+
+    def __init__(self, shape, dtype, size=3):
+        self.buffers = [np.empty(shape, dtype=dtype) for _ in range(size)]
+        self.free = queue.Queue()
+        for buffer in self.buffers:
+            self.free.put(buffer)
+
+    def acquire(self):
+        return self.free.get()
+
+    def release(self, buffer):
+        self.free.put(buffer)
+
+    def owns(self, frame):
+        return any(frame is buffer for buffer in self.buffers)
+
+
+def frame_memoryview(frame):
+    """Flat byte view of a frame buffer, sharing its memory."""
+    return memoryview(frame).cast("B")
+
+
+def write_frame_buffer(pipe, frame):
+    """
+    Writes a frame to the encoder pipe without copying it into bytes.
+
+    The frame's memory goes to the pipe's file descriptor in as many
+    ``os.write`` calls as the pipe needs, bypassing Python's write buffer.
+    """
+    view = frame_memoryview(frame)
+    fd = pipe.fileno()
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def build_encoder_command(file_path, video_filters=()):
+    """
+    ffmpeg command for a partial movie file of the Cairo renderer.
+
+    Mirrors ``SceneFileWriter.open_movie_pipe`` of manim 0.18, so partial
+    files stay compatible with manim's own; ``video_filters`` are joined
+    into a single ``-vf`` chain.
+    """
+    fps = config.frame_rate
+    if fps == int(fps):
+        fps = int(fps)
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-f", "rawvideo",
+        "-s", f"{config.pixel_width}x{config.pixel_height}",
+        "-pix_fmt", "rgba",
+        "-r", str(fps),
+        "-i", "-",
+        "-an",
+        "-loglevel", config.ffmpeg_loglevel.lower(),
+        "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+    ]
+    if video_filters:
+        command += ["-vf", ",".join(video_filters)]
+    if is_webm_format():
+        command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+    elif config.transparent:
+        command += ["-vcodec", "qtrle"]
+    else:
+        command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+    command += [file_path]
+    return command
+
+
+def get_temp_path(file_path):
+    """``name.tmp.mp4`` next to ``name.mp4``; ffmpeg still sees the container."""
+    file_path = Path(file_path)
+    return file_path.with_name(f"{file_path.stem}.tmp{file_path.suffix}")
+
+
+class AtomicSceneFileWriter(SceneFileWriter):
+    """
+    SceneFileWriter that publishes movie files only when they are complete.
+
+    Partial movie files and the combined scene movie are encoded to a
+    temporary path and renamed into place after ffmpeg succeeded. Partial
+    files are shared through ``segment_store``.
+    """
+
+    segment_store = SEGMENT_STORE
+
+    def is_already_cached(self, hash_invocation):
+        if super().is_already_cached(hash_invocation):
+            return True
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return False
+        partial_path = self.partial_movie_directory / f"{hash_invocation}{config.movie_file_extension}"
+        return self.segment_store.fetch(hash_invocation, partial_path)
+
+    def open_movie_pipe(self, file_path=None, **encoder_options):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.finished_movie_path = Path(file_path)
+        self.start_encoder(get_temp_path(file_path), **encoder_options)
+
+    def start_encoder(self, file_path):
+        super().open_movie_pipe(file_path=file_path)
+
+    def close_movie_pipe(self):
+        super().close_movie_pipe()
+        if self.writing_process.returncode == 0:
+            os.replace(self.partial_movie_file_path, self.finished_movie_path)
+            self.segment_store.add(self.finished_movie_path.stem, self.finished_movie_path)
+
+    def combine_files(self, input_files, output_file, create_gif=False, includes_sound=False):
+        temp_path = get_temp_path(output_file)
+        super().combine_files(input_files, temp_path, create_gif, includes_sound)
+        if temp_path.exists():
+            os.replace(temp_path, output_file)
+
+
+class SyncCairoRenderer(CairoRenderer):
+    """manim's own renderer, with movie files written by AtomicSceneFileWriter."""
+
+    def __init__(self, file_writer_class=AtomicSceneFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+
+
+class ZeroCopySceneFileWriter(AtomicSceneFileWriter):
+    """
+    SceneFileWriter that writes frames to ffmpeg from their own memory.
+
+    The encoder of an animation is started with its first frame, not in
+    ``begin_animation``: by then it is known whether the animation is a
+    frozen frame that ffmpeg can repeat on its own.
+    """
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.pending_movie_path = None
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write:
+            if file_path is None:
+                file_path = self.partial_movie_files[self.renderer.num_plays]
+            self.pending_movie_path = file_path
+
+    def end_animation(self, allow_write=False):
+        # An animation without frames still gets its (empty) partial file
+        self.start_movie_pipe()
+        super().end_animation(allow_write)
+
+    def start_movie_pipe(self, video_filters=()):
+        if self.pending_movie_path is not None:
+            file_path, self.pending_movie_path = self.pending_movie_path, None
+            self.open_movie_pipe(file_path=file_path, video_filters=video_filters)
+
+    def start_encoder(self, file_path, video_filters=()):
+        if config.renderer != RendererType.CAIRO:
+            super().start_encoder(file_path)
+            return
+        self.partial_movie_file_path = file_path
+        self.writing_process = subprocess.Popen(
+            build_encoder_command(file_path, video_filters),
+            stdin=subprocess.PIPE,
+        )
+
+    def write_frame(self, frame_or_renderer):
+        self.start_movie_pipe()
+        if config.renderer == RendererType.CAIRO and write_to_movie():
+            write_frame_buffer(self.writing_process.stdin, frame_or_renderer)
+            return
+        super().write_frame(frame_or_renderer)
+
+    def write_frozen_frame(self, frame, num_frames):
+        """Writes a static frame once and lets ffmpeg repeat it num_frames times."""
+        self.start_movie_pipe([f"loop=loop={num_frames - 1}:size=1:start=0"])
+        self.write_frame(frame)
+
+
+class ZeroCopyCairoRenderer(CairoRenderer):
+    """
+    CairoRenderer that hands the camera's pixel array to the writer directly.
+
+    The synchronous writer is done with the frame before the next one is
+    drawn, so the per-frame ``np.array`` copy of ``get_frame`` is not needed.
+    Frozen frames are passed to the writer once, with their repeat count.
+    """
+
+    def __init__(self, file_writer_class=ZeroCopySceneFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+
+    def render(self, scene, time, moving_mobjects):
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)
+        if self.skip_animations or num_frames < 2 or not write_to_movie():
+            super().freeze_current_frame(duration)
+            return
+        self.time += num_frames * dt
+        self.file_writer.write_frozen_frame(self.get_frame(), num_frames)
+
+
+class ThreadedSceneFileWriter(ZeroCopySceneFileWriter):
+    """
+    SceneFileWriter that streams frames to ffmpeg from a background thread.
+
+    Frames are queued as references, never copied; ring buffers go back to
+    the renderer's FrameRing once written.
+    """
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.frame_queue = None
+        self.writer_thread = None
+        self.writer_error = None
+
+    def open_movie_pipe(self, file_path=None, video_filters=()):
+        super().open_movie_pipe(file_path=file_path, video_filters=video_filters)
+        self.writer_error = None
+        self.frame_queue = queue.Queue(maxsize=len(self.renderer.frame_ring.buffers))
+        self.writer_thread = threading.Thread(
+            target=self.write_queued_frames,
+            args=(self.writing_process.stdin, self.frame_queue),
+            daemon=True,
+        )
+        self.writer_thread.start()
+
+    def write_queued_frames(self, pipe, frames):
+        ring = self.renderer.frame_ring
+        while True:
+            frame = frames.get()
+            if frame is None:
+                return
+            try:
+                if self.writer_error is None:
+                    write_frame_buffer(pipe, frame)
+            except OSError as error:
+                # Keep draining so the renderer never blocks on a dead pipe
+                self.writer_error = error
+            finally:
+                if ring.owns(frame):
+                    ring.release(frame)
+
+    def write_frame(self, frame_or_renderer):
+        self.start_movie_pipe()
+        if (
+            self.frame_queue is None
+            or config.renderer != RendererType.CAIRO
+            or not write_to_movie()
+        ):
+            super().write_frame(frame_or_renderer)
+            if self.renderer.frame_ring.owns(frame_or_renderer):
+                self.renderer.frame_ring.release(frame_or_renderer)
+            return
+        self.frame_queue.put(frame_or_renderer)
+
+    def close_movie_pipe(self):
+        if self.frame_queue is not None:
+            self.frame_queue.put(None)
+            self.writer_thread.join()
+            self.frame_queue = None
+            self.writer_thread = None
+        if self.writer_error is not None:
+            # Do not let ffmpeg finish a movie with missing frames
+            self.writing_process.kill()
+        super().close_movie_pipe()
+        if self.writer_error is not None:
+            raise self.writer_error
+
+
+class PipelinedCairoRenderer(ZeroCopyCairoRenderer):
+    """
+    CairoRenderer that overlaps rasterization with encoding.
+
+    Each animation frame is drawn directly into a FrameRing buffer (the
+    Cairo context of every buffer is cached by the camera) and queued for
+    the ThreadedSceneFileWriter, so no per-frame allocation or copy happens.
+    """
+
+    def __init__(self, ring_size=3, file_writer_class=ThreadedSceneFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+        pixel_array = self.camera.pixel_array
+        self.frame_ring = FrameRing(pixel_array.shape, pixel_array.dtype, ring_size)
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            super().render(scene, time, moving_mobjects)
+            return
+        camera_array = self.camera.pixel_array
+        frame = self.frame_ring.acquire()
+        self.camera.pixel_array = frame
+        try:
+            self.update_frame(scene, moving_mobjects)
+        except BaseException:
+            self.frame_ring.release(frame)
+            raise
+        finally:
+            self.camera.pixel_array = camera_array
+        self.add_frame(frame)
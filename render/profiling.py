@@ -0,0 +1,179 @@
+"""
+Render profiling / Render-Profiling
+
+Breaks the render time of a scene down into phases: every ``create_*``
+builder of the scene (periodic table, detail card, Bohr model, axes...),
+every ``play`` and ``wait`` with its frame count, and the encoding work
+of the file writer (closing partial movies, combining the scene movie).
+The phases are written as a Chrome trace (open in chrome://tracing or
+https://ui.perfetto.dev) with the mobject count at the end of each phase.
+
+Profiling wraps the scene class at render time, so the scripts stay
+unchanged and an unprofiled render runs exactly the original code.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+# Directory for trace files; set by ``--profile`` and inherited by workers
+PROFILE_ENV = "RENDER_PROFILE"
+
+
+def get_profile_dir():
+    """Trace directory if profiling is enabled, else None."""
+    value = os.environ.get(PROFILE_ENV)
+    return Path(value) if value else None
+
+
+class PhaseTimer:
+    """Collects timed phases as Chrome trace 'complete' events."""
+
+    def __init__(self, name):
+        self.name = name
+        self.origin = time.perf_counter()
+        self.events = []
+        self.open_phases = Counter()
+        self.totals = Counter()
+
+    @contextmanager
+    def phase(self, name, category, **args):
+        # Builders call builders; only the outermost phase counts towards totals
+        outermost = not self.open_phases[category]
+        self.open_phases[category] += 1
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            self.open_phases[category] -= 1
+            if outermost:
+                self.totals[category] += end - start
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def get_summary(self):
+        """Total seconds per category."""
+        return dict(self.totals)
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        trace = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"scene": self.name, "summary": self.get_summary()},
+        }
+        path.write_text(json.dumps(trace, indent=1), encoding="utf-8")
+        return path
+
+
+def count_mobjects(scene):
+    return len(scene.get_mobject_family_members())
+
+
+def get_animation_name(animations):
+    return ", ".join(type(animation).__name__ for animation in animations) or "play"
+
+
+def profile_scene(scene_cls, profile_dir):
+    """
+    Returns a subclass of scene_cls that records a trace of its render to
+    ``profile_dir/<scene>.trace.json``.
+    """
+
+    def timed_builder(name, method):
+        @functools.wraps(method)
+        def builder(self, *args, **kwargs):
+            with self.phase_timer.phase(name, "setup") as phase_args:
+                result = method(self, *args, **kwargs)
+                if hasattr(result, "get_family"):
+                    phase_args["mobjects"] = len(result.get_family())
+            return result
+        return builder
+
+    def play(self, *args, **kwargs):
+        renderer = self.renderer
+        start_frames = self.frames_rendered
+        category = "wait" if get_animation_name(args) == "Wait" else "animation"
+        with self.phase_timer.phase(f"{renderer.num_plays}: {get_animation_name(args)}",
+                                    category) as phase_args:
+            scene_cls.play(self, *args, **kwargs)
+            phase_args["frames"] = self.frames_rendered - start_frames
+            phase_args["mobjects"] = count_mobjects(self)
+
+    def render(self, preview=False):
+        with self.phase_timer.phase("render", "scene") as phase_args:
+            result = scene_cls.render(self, preview)
+            phase_args["frames"] = self.frames_rendered
+        self.phase_timer.write(Path(profile_dir) / f"{scene_cls.__name__}.trace.json")
+        return result
+
+    def __init__(self, *args, **kwargs):
+        self.phase_timer = PhaseTimer(scene_cls.__name__)
+        self.frames_rendered = 0
+        with self.phase_timer.phase("init", "setup"):
+            scene_cls.__init__(self, *args, **kwargs)
+        self.instrument_renderer()
+
+    def instrument_renderer(self):
+        renderer = self.renderer
+        add_frame = renderer.add_frame
+
+        def counted_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                self.frames_rendered += num_frames
+            add_frame(frame, num_frames)
+
+        renderer.add_frame = counted_add_frame
+
+        file_writer = getattr(renderer, "file_writer", None)
+        write_frozen_frame = getattr(file_writer, "write_frozen_frame", None)
+        if write_frozen_frame is not None:
+            # Static waits of the zero-copy and threaded pipelines skip add_frame:
+            # freeze_current_frame hands the frame and its repeat count to the writer
+            def counted_write_frozen_frame(frame, num_frames):
+                self.frames_rendered += num_frames
+                write_frozen_frame(frame, num_frames)
+
+            file_writer.write_frozen_frame = counted_write_frozen_frame
+
+        for method_name in ("close_movie_pipe", "combine_to_movie"):
+            if file_writer is not None and hasattr(file_writer, method_name):
+                method = getattr(file_writer, method_name)
+                setattr(file_writer, method_name,
+                        self.timed_call(f"encode: {method_name}", "encode", method))
+
+    def timed_call(self, name, category, function):
+        @functools.wraps(function)
+        def call(*args, **kwargs):
+            with self.phase_timer.phase(name, category):
+                return function(*args, **kwargs)
+        return call
+
+    namespace = {
+        "__init__": __init__,
+        "render": render,
+        "play": play,
+        "instrument_renderer": instrument_renderer,
+        "timed_call": timed_call,
+        "__module__": scene_cls.__module__,
+        "__qualname__": scene_cls.__qualname__,
+    }
+    for name in dir(scene_cls):
+        if name.startswith("create_") and callable(getattr(scene_cls, name)):
+            namespace[name] = timed_builder(name, getattr(scene_cls, name))
+    return type(scene_cls.__name__, (scene_cls,), namespace)
@@ -0,0 +1,52 @@
+"""
+Scene runner / Szenen-Renderer
+
+Renders a single scene in the current process with a chosen quality and
+renderer, without going through the manim command line.
+"""
+
+from pathlib import Path
+
+from manim import config, tempconfig
+
+from .catalog import REPO_ROOT, get_quality_config, load_scene_class
+from .pipeline import PipelinedCairoRenderer, SyncCairoRenderer, ZeroCopyCairoRenderer
+from .profiling import get_profile_dir, profile_scene
+
+# Renderer classes selectable with --pipeline
+PIPELINES = {
+    "sync": SyncCairoRenderer,
+    "zero-copy": ZeroCopyCairoRenderer,
+    "threaded": PipelinedCairoRenderer,
+}
+
+
+def load_project_config():
+    """Reads the repository's manim.cfg, independent of the working directory."""
+    config.digest_file(REPO_ROOT / "manim.cfg")
+
+
+def render_scene(file_path, scene_name, quality=None, pipeline="sync",
+                 renderer_options=None, config_overrides=None):
+    """
+    Renders one scene and returns the finished Scene object.
+
+    ``quality`` is a manim quality flag (l, m, h, p, k); without it the
+    settings of manim.cfg apply. ``pipeline`` picks the renderer from
+    PIPELINES; ``renderer_options`` are passed to its constructor. With
+    profiling enabled (``RENDER_PROFILE``) a phase trace is written as well.
+    """
+    settings = {"input_file": Path(file_path)}
+    if quality is not None:
+        settings.update(get_quality_config(quality))
+    settings.update(config_overrides or {})
+
+    with tempconfig(settings):
+        scene_cls = load_scene_class(file_path, scene_name)
+        profile_dir = get_profile_dir()
+        if profile_dir is not None:
+            scene_cls = profile_scene(scene_cls, profile_dir)
+        renderer = PIPELINES[pipeline](**(renderer_options or {}))
+        scene = scene_cls(renderer=renderer)
+        scene.render()
+    return scene
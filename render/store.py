@@ -0,0 +1,130 @@
+"""
+Segment store / Segmentspeicher
+
+Manim names every partial movie file after a hash of its ``play`` call
+(camera, animations and all mobjects of the scene) but keeps it in a
+folder per scene, so the same segment is encoded and stored again for
+every scene that contains it. The SegmentStore keeps one copy per
+content key in a shared directory. Finished partial files are hard-linked
+into it, and a scene that meets a known segment links it into its partial
+folder instead of rendering it. Scene movies are still assembled by
+manim's stream-copy concatenation, now reading the stored segments.
+
+The store defaults to ``media/segments`` and can be shared between
+checkouts and render boxes with the ``RENDER_SEGMENT_STORE`` variable.
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from manim import __version__, config
+
+
+def get_segment_key(play_hash):
+    """Content key of a partial movie: the play hash plus the encoding settings."""
+    settings = "|".join([
+        play_hash,
+        f"{config.pixel_width}x{config.pixel_height}",
+        f"{config.frame_rate:g}",
+        config.movie_file_extension,
+        str(config.transparent),
+        __version__,
+    ])
+    return hashlib.sha256(settings.encode()).hexdigest()
+
+
+def link_or_copy(source, target):
+    """Hard-links source to target, copying across filesystems; atomic either way."""
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.{os.getpid()}")
+    try:
+        os.link(source, temp_path)
+    except FileExistsError:
+        os.unlink(temp_path)
+        os.link(source, temp_path)
+    except OSError as error:
+        if error.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+            raise
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, target)
+
+
+class SegmentStore:
+    """Content-addressed directory of partial movie files."""
+
+    def __init__(self, root=None):
+        self._root = root
+
+    @property
+    def root(self):
+        if self._root is not None:
+            return Path(self._root)
+        if os.environ.get("RENDER_SEGMENT_STORE"):
+            return Path(os.environ["RENDER_SEGMENT_STORE"])
+        return Path(config.media_dir) / "segments"
+
+    def get_path(self, play_hash):
+        key = get_segment_key(play_hash)
+        return self.root / key[:2] / f"{key}{config.movie_file_extension}"
+
+    def is_storable(self, play_hash):
+        # Without caching manim numbers the plays instead of hashing them
+        return not play_hash.startswith("uncached_")
+
+    def fetch(self, play_hash, partial_path):
+        """Links a stored segment to ``partial_path``; False if it is unknown."""
+        if not self.is_storable(play_hash):
+            return False
+        stored = self.get_path(play_hash)
+        if not stored.exists():
+            return False
+        link_or_copy(stored, partial_path)
+        self.touch(stored)
+        return True
+
+    def add(self, play_hash, partial_path):
+        """Adds a finished partial movie file, unless the segment is already stored."""
+        if not self.is_storable(play_hash):
+            return
+        stored = self.get_path(play_hash)
+        if not stored.exists():
+            link_or_copy(partial_path, stored)
+        else:
+            self.touch(stored)
+
+    def touch(self, stored):
+        """
+        Marks a segment as used now. prune goes by this modification time:
+        access times are not kept on noatime or relatime mounts.
+        """
+        try:
+            os.utime(stored)
+        except OSError:
+            # A segment in a shared store may belong to another user
+            pass
+
+    def iter_segments(self):
+        return self.root.glob(f"??/*{config.movie_file_extension}")
+
+    def get_size(self):
+        return sum(path.stat().st_size for path in self.iter_segments())
+
+    def prune(self, max_bytes):
+        """Deletes the least recently used segments until the store fits max_bytes."""
+        segments = sorted(self.iter_segments(), key=lambda path: path.stat().st_mtime)
+        size = sum(path.stat().st_size for path in segments)
+        removed = 0
+        for path in segments:
+            if size <= max_bytes:
+                break
+            size -= path.stat().st_size
+            path.unlink()
+            removed += 1
+        return removed
+
+
+SEGMENT_STORE = SegmentStore()